@@ -0,0 +1,69 @@
+"""
+基准测试公共工具：统计、结果文件与基线比较
+"""
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """样本的均值与百分位（单位与样本一致）"""
+    ordered = sorted(samples)
+    count = len(ordered)
+    
+    def percentile(p: int) -> float:
+        return ordered[max(0, -(-p * count // 100) - 1)]
+        
+    return {
+        "mean": statistics.mean(ordered),
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "p99": percentile(99),
+        "max": ordered[-1]
+    }
+
+def environment() -> Dict[str, str]:
+    """记录运行环境，比较基线时只有同一台机器的结果才有意义"""
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+def write_results(path: str, results: Dict):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+def load_results(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            metrics: Dict[str, float], higher_is_better: bool = False) -> List[str]:
+    """按阈值比较每个场景的指标，返回回归说明列表
+
+    metrics 为 指标名 -> 允许的相对变化（0.2 表示允许变差 20%）。
+    基线中没有的场景或指标跳过。
+    """
+    regressions = []
+    for scenario, values in current.items():
+        base = baseline.get(scenario)
+        if not base:
+            continue
+        for metric, tolerance in metrics.items():
+            if metric not in values or not base.get(metric):
+                continue
+            change = values[metric] / base[metric] - 1
+            if higher_is_better:
+                change = -change
+            if change > tolerance:
+                regressions.append(
+                    f"{scenario}.{metric}: {base[metric]:.4g} -> {values[metric]:.4g} "
+                    f"({change:+.0%}, limit {tolerance:.0%})"
+                )
+    return regressions
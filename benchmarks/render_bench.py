@@ -0,0 +1,217 @@
+"""
+GameScreen 渲染基准测试（SDL dummy 驱动，无需窗口）
+
+用法：
+    python benchmarks/render_bench.py --output benchmarks/results/render.json
+    python benchmarks/render_bench.py --baseline benchmarks/results/render.json
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from src.config import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, CELL_SIZE, GameState, Difficulty, RENDERING, DEMO_MODE
+)
+from src.ui.screens import GameScreen
+from src.ui.theme import ThemeManager
+from bench_utils import summarize, environment, write_results, load_results, compare
+
+# 指标 -> 允许的相对变化
+THRESHOLDS = {
+    "draw_p50_ms": 0.25,
+    "update_p50_ms": 0.25,
+    "frame_p95_ms": 0.35,
+    "alloc_kb_per_frame": 0.5
+}
+
+def serpentine(length: int) -> List[Tuple[int, int]]:
+    """从棋盘底部开始蛇形排列的蛇身，头部在前"""
+    cols = WINDOW_WIDTH // CELL_SIZE
+    rows = WINDOW_HEIGHT // CELL_SIZE
+    path = []
+    for row in range(rows - 1, -1, -1):
+        xs = range(cols) if (rows - 1 - row) % 2 == 0 else range(cols - 1, -1, -1)
+        path.extend((x * CELL_SIZE, row * CELL_SIZE) for x in xs)
+        if len(path) >= length:
+            break
+    return list(reversed(path[:length]))
+
+def setup_playing(screen: GameScreen, length: int):
+    """难度 INFINITE、穿墙关闭，蛇身排成蛇形，头部朝未占用的方向"""
+    screen.select_difficulty(Difficulty.INFINITE)
+    screen.engine.reset(seed=1)
+    snake = screen.snake
+    body = serpentine(length)
+    snake.position = body
+    snake.length = length
+    if len(body) > 1:
+        dx = body[0][0] - body[1][0]
+        dy = body[0][1] - body[1][1]
+        snake.direction = (dx, dy)
+    screen.food.respawn(snake.free_cells)
+    screen.start_countdown()
+    screen.state = GameState.PLAYING
+    screen.accumulator = 0.0
+    screen.invalidate_frame()
+
+def setup_state(state: GameState) -> Callable[[GameScreen], None]:
+    def setup(screen: GameScreen):
+        screen.select_difficulty(Difficulty.HARD)
+        screen.engine.reset(seed=1)
+        if state == GameState.LEADERBOARD:
+            screen.show_leaderboard()
+        elif state == GameState.GAME_OVER:
+            screen.final_rankings = {"all_time": 3, "daily": 1}
+            screen.state = GameState.GAME_OVER
+        else:
+            screen.state = state
+        screen.invalidate_frame()
+    return setup
+
+# 各场景使用的渲染配置，未列出的键取 DEFAULT_RENDERING
+DEFAULT_RENDERING = {"dirty_rects": False, "board_renderer": "sprites"}
+DIRTY = {"dirty_rects": True}
+SURFARRAY = {"board_renderer": "surfarray"}
+
+SCENARIOS: Dict[str, Tuple[Callable[[GameScreen], None], Dict[str, object]]] = {
+    # 名称 -> (初始化函数, 渲染配置)
+    "difficulty_select": (setup_state(GameState.DIFFICULTY_SELECT), {}),
+    "playing_10": (lambda screen: setup_playing(screen, 10), {}),
+    "playing_100": (lambda screen: setup_playing(screen, 100), {}),
+    "playing_1000": (lambda screen: setup_playing(screen, 1000), {}),
+    "playing_100_dirty": (lambda screen: setup_playing(screen, 100), DIRTY),
+    "playing_1000_dirty": (lambda screen: setup_playing(screen, 1000), DIRTY),
+    "playing_100_surfarray": (lambda screen: setup_playing(screen, 100), SURFARRAY),
+    "playing_1000_surfarray": (lambda screen: setup_playing(screen, 1000), SURFARRAY),
+    "leaderboard": (setup_state(GameState.LEADERBOARD), {}),
+    "game_over": (setup_state(GameState.GAME_OVER), {})
+}
+
+def run_frames(screen: GameScreen, setup: Callable[[GameScreen], None], frames: int,
+               dt: float) -> Tuple[List[float], List[float]]:
+    """运行若干帧，返回 update 与 draw 的耗时（毫秒）
+
+    游戏中若撞到自己而结束，重新初始化场景（不计时）。
+    """
+    initial_state = screen.state
+    update_times, draw_times = [], []
+    for _ in range(frames):
+        start = time.perf_counter()
+        screen.update(dt)
+        middle = time.perf_counter()
+        screen.draw()
+        end = time.perf_counter()
+        update_times.append((middle - start) * 1000.0)
+        draw_times.append((end - middle) * 1000.0)
+        if screen.state != initial_state:
+            setup(screen)
+    return update_times, draw_times
+
+def measure_allocations(screen: GameScreen, setup: Callable[[GameScreen], None], frames: int,
+                        dt: float) -> Dict[str, float]:
+    """用 tracemalloc 统计每帧的内存峰值增量（临时分配）与净增长
+
+    场景初始化后的第一帧会重建缓存图层，先绘制一帧不计入统计，与计时一致。
+    """
+    initial_state = screen.state
+    transient, growth = [], []
+    run_frames(screen, setup, 1, dt)
+    tracemalloc.start()
+    try:
+        for _ in range(frames):
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            screen.update(dt)
+            screen.draw()
+            current, peak = tracemalloc.get_traced_memory()
+            transient.append(peak - start)
+            growth.append(current - start)
+            if screen.state != initial_state:
+                setup(screen)
+                run_frames(screen, setup, 1, dt)
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_kb_per_frame": sum(transient) / len(transient) / 1024,
+        "alloc_kb_max": max(transient) / 1024,
+        "net_kb_per_frame": sum(growth) / len(growth) / 1024
+    }
+
+def run_scenario(screen: GameScreen, name: str, frames: int, warmup: int) -> Dict[str, float]:
+    setup, rendering = SCENARIOS[name]
+    RENDERING.update(DEFAULT_RENDERING, **rendering)
+    screen.setup_board_renderer()
+    dt = 1.0 / 60
+    random.seed(0)
+    setup(screen)
+    run_frames(screen, setup, warmup, dt)
+    update_times, draw_times = run_frames(screen, setup, frames, dt)
+    frame_times = [u + d for u, d in zip(update_times, draw_times)]
+    
+    result = {}
+    for label, samples in (("update", update_times), ("draw", draw_times), ("frame", frame_times)):
+        for stat, value in summarize(samples).items():
+            result[f"{label}_{stat}_ms"] = value
+    setup(screen)
+    result.update(measure_allocations(screen, setup, max(1, frames // 4), dt))
+    return result
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark GameScreen update/draw per frame")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "results", "render.json"))
+    parser.add_argument("--baseline", help="compare against a previous results file")
+    args = parser.parse_args(argv)
+    
+    # 在临时目录中运行，排行榜与存档不会写入仓库
+    output = os.path.abspath(args.output)
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    os.chdir(tempfile.mkdtemp(prefix="render_bench_"))
+    
+    # 长时间停留在难度选择界面时不要自动进入演示模式
+    DEMO_MODE["enabled"] = False
+    pygame.init()
+    display = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    screen = GameScreen(display, ThemeManager())
+    rendering = dict(RENDERING)
+    results = {}
+    try:
+        for name in args.scenarios:
+            results[name] = run_scenario(screen, name, args.frames, args.warmup)
+            print(f"{name:<22} update p50 {results[name]['update_p50_ms']:.3f} ms  "
+                  f"draw p50 {results[name]['draw_p50_ms']:.3f} ms  "
+                  f"p95 {results[name]['frame_p95_ms']:.3f} ms  "
+                  f"alloc {results[name]['alloc_kb_per_frame']:.1f} KB/frame")
+    finally:
+        RENDERING.update(rendering)
+        screen.close()
+        pygame.quit()
+        
+    write_results(output, {"environment": environment(), "scenarios": results})
+    print(f"Results saved to {output}")
+    
+    if baseline_path:
+        regressions = compare(results, load_results(baseline_path)["scenarios"], THRESHOLDS)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
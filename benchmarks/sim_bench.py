@@ -0,0 +1,176 @@
+"""
+模拟热点微基准：Snake.move / grow / find_safe_position、Food.generate_position、
+RankingManager.add_score
+
+用法：
+    python benchmarks/sim_bench.py --output benchmarks/results/sim.json
+    python benchmarks/sim_bench.py --baseline benchmarks/results/sim.json
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.engine.rules import CELL_SIZE, Difficulty
+from src.engine.board import Board
+from src.game.snake import Snake
+from src.game.food import Food
+from src.game.grid import FreeCellIndex, SparseFreeCells
+from bench_utils import environment, write_results, load_results, compare
+
+LENGTHS = (10, 100, 1000)
+FILL_RATIOS = (0.1, 0.5, 0.9, 0.99)
+RECORD_COUNTS = (10, 1000, 10000)
+THRESHOLDS = {"ops_per_sec": 0.2}  # 吞吐下降超过 20% 视为回归
+
+def hamiltonian_cycle(board: Board) -> List[Tuple[int, int]]:
+    """覆盖整个棋盘的环路（第一行向右，其余列蛇形，最后沿第 0 列回到起点）"""
+    cols, rows = board.cols, board.rows
+    cycle = [(x, 0) for x in range(cols)]
+    for y in range(1, rows):
+        xs = range(cols - 1, 0, -1) if y % 2 == 1 else range(1, cols)
+        cycle.extend((x, y) for x in xs)
+    cycle.extend((0, y) for y in range(rows - 1, 0, -1))
+    return [(x * CELL_SIZE, y * CELL_SIZE) for x, y in cycle]
+
+def make_snake(board: Board, length: int, rng: random.Random) -> Tuple[Snake, Dict]:
+    """沿环路摆放的蛇，以及每个格子沿环路前进的方向"""
+    cycle = hamiltonian_cycle(board)
+    turns = {
+        cell: (cycle[(i + 1) % len(cycle)][0] - cell[0], cycle[(i + 1) % len(cycle)][1] - cell[1])
+        for i, cell in enumerate(cycle)
+    }
+    snake = Snake(board, rng)
+    snake.position = list(reversed(cycle[:length]))
+    snake.length = length
+    return snake, turns
+
+def measure(fn: Callable[[], object], min_time: float) -> Dict[str, float]:
+    """取多次运行中最快的一次，返回每秒操作数与单次耗时"""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    best = min(timer.repeat(repeat=3, number=number)) / number
+    return {"ops_per_sec": 1.0 / best, "us_per_op": best * 1e6}
+
+def bench_snake(board: Board, min_time: float) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for length in LENGTHS:
+        rng = random.Random(0)
+        snake, turns = make_snake(board, length, rng)
+        
+        def move():
+            snake.direction = turns[snake.position[0]]
+            snake.move()
+        results[f"snake.move/length={length}"] = measure(move, min_time)
+        
+        body = list(snake.position)
+        
+        def reset_position():
+            snake.position = body
+        results[f"snake.position/length={length}"] = measure(reset_position, min_time)
+        
+        def find_safe_position():
+            snake.position = body
+            snake.find_safe_position()
+        results[f"snake.find_safe_position/length={length}"] = measure(find_safe_position, min_time)
+        
+    snake = Snake(board, random.Random(0))
+    snake.difficulty = Difficulty.HARD
+    results["snake.grow"] = measure(snake.grow, min_time)
+    return results
+
+def bench_food(board: Board, min_time: float) -> Dict[str, Dict[str, float]]:
+    results = {}
+    cells = board.food_cells()
+    for ratio in FILL_RATIOS:
+        rng = random.Random(0)
+        free_cells = FreeCellIndex(cells)
+        for cell in rng.sample(cells, int(len(cells) * ratio)):
+            free_cells.occupy(cell)
+        food = Food(free_cells, board, rng)
+        results[f"food.generate_position/fill={ratio}"] = measure(
+            lambda: food.generate_position(free_cells), min_time
+        )
+        
+    # 大棋盘：只记录蛇身占用的格子，拒绝采样
+    large = Board.large(2000, 2000)
+    for length in LENGTHS:
+        rng = random.Random(0)
+        free_cells = SparseFreeCells(large)
+        free_cells.reset(large.food_cell_at(i) for i in range(length))
+        food = Food(free_cells, large, rng)
+        results[f"food.generate_position/large/len={length}"] = measure(
+            lambda: food.generate_position(free_cells), min_time
+        )
+    return results
+
+def bench_rankings(min_time: float) -> Dict[str, Dict[str, float]]:
+    from src.config import RANKING_SYSTEM
+    from src.managers.ranking_manager import RankingManager
+    
+    results = {}
+    directory = tempfile.mkdtemp(prefix="sim_bench_")
+    for backend in ("json", "sqlite"):
+        for count in RECORD_COUNTS:
+            config = dict(
+                RANKING_SYSTEM, backend=backend,
+                file_path=os.path.join(directory, f"{backend}_{count}.json"),
+                sqlite_path=os.path.join(directory, f"{backend}_{count}.db")
+            )
+            manager = RankingManager(config)
+            rng = random.Random(0)
+            now = time.time()
+            # 预先填充：SQLite 保留全部记录，JSON 限时分类最多保留 window_records 条
+            for category in config["categories"]:
+                for i in range(count):
+                    manager.store.insert(category, "HARD", "bench", rng.randrange(0, 5000, 5), now - i)
+                    
+            def add_score():
+                manager.add_score("HARD", rng.randrange(0, 5000, 5), "bench")
+            results[f"rankings.add_score/{backend}/records={count}"] = measure(add_score, min_time)
+            manager.close()
+    return results
+
+SUITES = {
+    "snake": lambda board, min_time: bench_snake(board, min_time),
+    "food": lambda board, min_time: bench_food(board, min_time),
+    "rankings": lambda board, min_time: bench_rankings(min_time)
+}
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmarks for simulation hot paths")
+    parser.add_argument("--suites", nargs="+", default=list(SUITES), choices=list(SUITES))
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing run")
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "results", "sim.json"))
+    parser.add_argument("--baseline", help="compare against a previous results file")
+    args = parser.parse_args(argv)
+    
+    board = Board.default()
+    results = {}
+    for suite in args.suites:
+        for name, values in SUITES[suite](board, args.min_time).items():
+            results[name] = values
+            print(f"{name:<48}{values['ops_per_sec']:>14,.0f} ops/s{values['us_per_op']:>12.2f} us")
+            
+    write_results(args.output, {"environment": environment(), "benchmarks": results})
+    print(f"Results saved to {args.output}")
+    
+    if args.baseline:
+        regressions = compare(results, load_results(args.baseline)["benchmarks"], THRESHOLDS,
+                              higher_is_better=True)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
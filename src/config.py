@@ -3,11 +3,17 @@
 """
 from enum import Enum, auto
 import pygame
+import sys
+import os
 
-# 窗口设置
-WINDOW_WIDTH = 600
-WINDOW_HEIGHT = 800
-CELL_SIZE = 20
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+# 游戏规则定义在不依赖 pygame 的引擎模块中，这里统一导出
+from src.engine.rules import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, CELL_SIZE, GAME_AREA,
+    Difficulty, DIFFICULTY_SETTINGS, FPS, MOVE_DELAY, SIMULATION,
+    SCORE_SYSTEM, RESPAWN_SYSTEM, ACTIONS, DIRECTIONS, VERIFICATION, LARGE_BOARD
+)
 
 # 颜色配置
 class Colors:
@@ -25,48 +31,6 @@ class Colors:
         TEXT = (236, 240, 241)
         GRID = (52, 73, 94)
 
-# 游戏设置
-class Difficulty(Enum):
-    EASY = 1
-    MEDIUM = 2
-    HARD = 3
-    INFINITE = 4  # 新增无限模式
-
-DIFFICULTY_SETTINGS = {
-    Difficulty.EASY: {
-        "speed": 4,
-        "wall_collision": True,
-        "lives": 3,
-        "food_timeout": None,
-        "time_limit": 35,  # 35秒
-        "name": "Casual Mode"
-    },
-    Difficulty.MEDIUM: {
-        "speed": 6,
-        "wall_collision": True,
-        "lives": 1,
-        "food_timeout": None,
-        "time_limit": 60,  # 60秒
-        "name": "Hard Mode"
-    },
-    Difficulty.HARD: {
-        "speed": 8,
-        "wall_collision": True,
-        "lives": 1,
-        "food_timeout": 5000,
-        "time_limit": 90,  # 90秒
-        "name": "Hell Mode"
-    },
-    Difficulty.INFINITE: {
-        "speed": 8,
-        "wall_collision": True,
-        "lives": 1,
-        "food_timeout": 5000,
-        "time_limit": None,  # 无时间限制
-        "name": "Infinite Mode"
-    }
-}
-
 # 控制键
 CONTROLS = {
     "UP": [pygame.K_UP, pygame.K_w],
@@ -75,7 +39,9 @@ CONTROLS = {
     "RIGHT": [pygame.K_RIGHT, pygame.K_d],
     "PAUSE": [pygame.K_ESCAPE],
     "RESTART": [pygame.K_SPACE],
-    "THEME": [pygame.K_t]
+    "THEME": [pygame.K_t],
+    "PROFILER": [pygame.K_F3],  # 显示/隐藏帧耗时浮层
+    "PROFILER_EXPORT": [pygame.K_F4]  # 导出帧耗时统计
 }
 
 # 游戏状态
@@ -124,6 +90,8 @@ GAME_MESSAGES = {
     "ALL_TIME_RANK": "All Time Rank",
     "RANK_TITLE": "{mode} Leaderboard",
     "YOUR_RANK": "Your Rank",
+    "PROJECTED_RANK": "You would place #{rank}",
+    "DEMO": "DEMO - press any key to play",
     "VIEW_RANKINGS": "View Rankings [R]",
     "NO_RECORDS": "No Records",
     "ENTER_NAME": "Congratulations! Enter your name:",
@@ -146,6 +114,8 @@ GAME_STYLE = {
     "snake_radius": 8,  # 蛇身圆角
     "food_radius": 10,  # 食物圆角
     "border_width": 3,  # 游戏区域边框宽度
+    "show_grid": False,  # 是否在游戏区域绘制网格
+    "grid_line_width": 1,  # 网格线宽
     "shadow_offset": 4  # 阴影偏移
 }
 
@@ -169,6 +139,44 @@ FONTS = {
     }
 }
 
+# 渲染配置
+RENDERING = {
+    "text_cache_size": 256,  # 文字缓存最多保留的 Surface 数量
+    "dirty_rects": False,  # 脏矩形模式：游戏中只重绘并提交变化区域（适合软件渲染的低功耗设备，关闭插值）
+    "board_renderer": "sprites"  # 蛇身渲染方式："sprites" 逐节 blit 图块；"surfarray" 整盘光栅化后一次 blit（关闭插值）
+}
+
+# 帧耗时分析器配置
+PROFILER = {
+    "window": 600,  # 统计最近多少帧
+    "overlay_refresh": 0.5,  # 浮层统计刷新间隔（秒）
+    "font_size": 20,
+    "text_color": (236, 240, 241),
+    "background": (30, 30, 30),
+    "export_dir": "save/profile"
+}
+
+# 演示模式：难度选择界面闲置一段时间后由自动驾驶策略自己玩
+DEMO_MODE = {
+    "enabled": True,
+    "idle_seconds": 30,  # 无操作多久后进入演示
+    "policy": "bfs",  # src/engine/registry.py 中注册的策略名（"hamiltonian" 为环路求解器）
+    "difficulty": Difficulty.INFINITE
+}
+
+# 小地图（大棋盘模式下显示）
+MINIMAP = {
+    "enabled": True,
+    "size": 120,  # 长边的最大像素数，棋盘按块降采样到该尺寸以内
+    "refresh": 0.25,  # 刷新间隔（秒），两次刷新之间只记录变化的格子
+    "position": {
+        "right": WINDOW_WIDTH - 20,  # 右上角，按钮下方
+        "top": 70
+    },
+    "opacity": 200,
+    "border_width": 1
+}
+
 # 按钮样式
 BUTTON_STYLE = {
     "normal": (52, 152, 219),
@@ -189,48 +197,12 @@ LAYOUT = {
     "score_margin": 20,
     "title_y_pos": WINDOW_HEIGHT * 0.15,
     "subtitle_y_pos": WINDOW_HEIGHT * 0.25,
-    "game_area": {
-        "top": WINDOW_HEIGHT * 0.2,
-        "bottom": WINDOW_HEIGHT * 0.8,
-    },
+    "game_area": GAME_AREA,
     "buttons_start_y": WINDOW_HEIGHT * 0.35,
     "buttons_spacing": 30,
     "controls_hint_y": WINDOW_HEIGHT * 0.92,
 }
 
-# 添加帧率控制
-FPS = 60  # 游戏帧率
-MOVE_DELAY = {  # 每个难度的移动延迟（帧数）
-    Difficulty.EASY: 15,    # 约每秒4次移动
-    Difficulty.MEDIUM: 10,  # 约每秒6次移动
-    Difficulty.HARD: 8      # 约每秒8次移动
-} 
-
-# 分数系统配置
-SCORE_SYSTEM = {
-    "base_score": 10,  # 基础分数
-    "combo_multiplier": {  # 连击倍数
-        3: 1.5,  # 3连击 1.5倍
-        5: 2.0,  # 5连击 2倍
-        7: 2.5,  # 7连击 2.5倍
-        10: 3.0  # 10连击 3倍
-    },
-    "difficulty_bonus": {  # 难度加成
-        Difficulty.EASY: 1.0,
-        Difficulty.MEDIUM: 1.5,
-        Difficulty.HARD: 2.0,
-        Difficulty.INFINITE: 2.5
-    }
-}
-
-# 重生系统配置
-RESPAWN_SYSTEM = {
-    "invincible_time": 3,  # 重生后无敌时间（秒）
-    "flash_interval": 0.2,  # 闪烁间隔（秒）
-    "safe_distance": 5,     # 重生安全距离（格子数）
-    "position_tries": 10    # 重生位置尝试次数
-}
-
 # 触摸控制配置
 TOUCH_CONTROLS = {
     "enabled": True,
@@ -258,6 +230,17 @@ SAVE_SYSTEM = {
     ]
 }
 
+# 对局录像配置
+REPLAY_SYSTEM = {
+    "last_replay_path": "save/last_game.replay"  # 最近一局的录像，用于复现问题
+}
+
+# 持久化线程配置
+PERSISTENCE = {
+    "coalesce_delay": 0.5,  # 合并写盘的等待窗口（秒），从第一份待写快照开始计时
+    "flush_timeout": 5.0  # 退出时等待写盘的最长时间（秒）
+}
+
 # 成就系统配置
 ACHIEVEMENTS = {
     "beginner": {
@@ -304,24 +287,43 @@ TOUCH_CONTROLS.update({
 
 # 排名系统配置
 RANKING_SYSTEM = {
+    "backend": "json",  # json：整份文档，每组保留前 max_records 名；sqlite：带索引的数据库，保留全部记录
     "file_path": "save/rankings.json",
-    "max_records": 10,  # 每个难度保存前10名
+    "sqlite_path": "save/rankings.db",
+    "max_records": 10,  # 每个难度显示（JSON 后端保存）前10名
+    "expire_interval": 1.0,  # 限时分类的过期清理间隔（秒），读取排行榜时不再清理
+    "window_records": 100,  # JSON 后端限时分类每组最多保留的记录数，前几名过期后由后面的记录补位
+    "verify_submissions": False,  # 提交前按录像重新模拟校验分数（在后台线程进行，通过后才记入排行榜）
     "categories": {
         "all_time": {
             "name": "All Time Best",
             "expire_hours": None
+        },
+        "daily": {
+            "name": "Today's Best",
+            "expire_hours": 24
+        },
+        "weekly": {
+            "name": "This Week's Best",
+            "expire_hours": 24 * 7
+        },
+        "monthly": {
+            "name": "This Month's Best",
+            "expire_hours": 24 * 30
         }
     },
     "difficulty_names": {
         Difficulty.EASY: "Casual Mode",
         Difficulty.MEDIUM: "Hard Mode",
-        Difficulty.HARD: "Hell Mode"
+        Difficulty.HARD: "Hell Mode",
+        Difficulty.INFINITE: "Infinite Mode"
     }
 } 
 
 # 排行榜界面配置
 RANKING_UI = {
     "min_score_for_record": 50,  # 最低记录分数
+    "projection_category": "all_time",  # 游戏中预估名次使用的分类
     "name_input": {
         "width": 300,
         "height": 40,
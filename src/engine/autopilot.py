@@ -0,0 +1,258 @@
+"""
+BFS 自动驾驶（演示模式）
+"""
+from collections import deque
+from typing import List, Optional, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import LARGE_BOARD
+from src.engine.policies import Policy, GreedyPolicy, register_policy, is_safe, reverse_action
+from src.engine.graph import CellGraph, cell_graph
+
+@register_policy("bfs")
+class BfsAutopilot(Policy):
+    """沿食物的 BFS 距离场下降的自动驾驶
+
+    距离场从食物出发做 BFS（蛇身为障碍），找到蛇头即停止，只在食物移动
+    或下一步被挡住（玩家改变方向、重生）时重新计算；蛇沿距离严格递减的格子前进，
+    走过的格子不会再出现在剩余路径上，所以其余时候每步只需比较四个邻居。
+    计算距离场时用洪水填充检查吃到食物后蛇头能否到达蛇尾，不能则先沿追尾路线求生，
+    每 REPLAN_TICKS 步再尝试一次。
+    """
+    REPLAN_TICKS = 8
+
+    def reset(self, engine):
+        self.graph: Optional[CellGraph] = None
+        self.distance: List[int] = []
+        self.target = None  # 距离场对应的食物位置
+        self.chasing = False  # 当前距离场是否可以安全地追食物
+        self.replan_tick = 0
+        self.route = deque()  # 求生时缓存的追尾路线
+        self.fallback = None
+        board = engine.board
+        if board.cols * board.rows > LARGE_BOARD["dense_index_limit"]:
+            # 大棋盘上整盘 BFS 与邻接表都不划算，退化为贪心策略
+            self.fallback = GreedyPolicy(self.rng)
+            return
+        self.graph = cell_graph(
+            board.cols, board.rows, board.cell_size, not engine.settings["wall_collision"]
+        )
+
+    def act(self, engine) -> Optional[str]:
+        if self.fallback is not None:
+            return self.fallback.act(engine)
+        food = engine.food.position
+        if food is None:
+            return self.survive(engine)
+        if food != self.target or (not self.chasing and engine.tick >= self.replan_tick):
+            self.plan(engine)
+        if self.chasing:
+            action = self.descend(engine)
+            if action is None:
+                # 蛇头不在路径上，按当前局面重新计算
+                self.plan(engine)
+                action = self.descend(engine) if self.chasing else None
+            if action is not None:
+                return action
+        return self.survive(engine)
+
+    def blocked_cells(self, engine) -> bytearray:
+        """蛇身占用的格子；本步会移走的蛇尾不算障碍"""
+        snake = engine.snake
+        body = snake.position
+        size, cols = self.graph.cell_size, self.graph.cols
+        blocked = bytearray(self.graph.size)
+        for x, y in body:
+            blocked[(y // size) * cols + x // size] = 1
+        if len(body) >= snake.length:
+            blocked[self.graph.index(body[-1])] = 0
+        return blocked
+
+    def plan(self, engine):
+        """从食物出发计算距离场，并检查吃到食物后是否会困住自己"""
+        graph = self.graph
+        snake = engine.snake
+        self.target = engine.food.position
+        self.chasing = False
+        self.replan_tick = engine.tick + self.REPLAN_TICKS
+
+        head = graph.index(snake.position[0])
+        blocked = self.blocked_cells(engine)
+        blocked[head] = 0
+        distance = [-1] * graph.size
+        start = graph.index(self.target)
+        distance[start] = 0
+        queue = deque((start,))
+        neighbors = graph.neighbors
+        while queue:
+            i = queue.popleft()
+            if i == head:
+                break
+            d = distance[i] + 1
+            for _, j in neighbors[i]:
+                if distance[j] < 0 and not blocked[j]:
+                    distance[j] = d
+                    queue.append(j)
+        self.distance = distance
+        if distance[head] < 0:
+            return
+        self.chasing = self.safe_after_eating(engine)
+        if self.chasing:
+            self.route.clear()
+
+    def path(self, engine) -> List[int]:
+        """从蛇头沿距离场走到食物的格子下标（不含蛇头）"""
+        distance = self.distance
+        neighbors = self.graph.neighbors
+        i = self.graph.index(engine.snake.position[0])
+        cells = []
+        while distance[i] > 0:
+            i = min(
+                (j for _, j in neighbors[i] if 0 <= distance[j] < distance[i]),
+                key=distance.__getitem__
+            )
+            cells.append(i)
+        return cells
+
+    def safe_after_eating(self, engine) -> bool:
+        """模拟沿路径吃到食物后的蛇身，洪水填充检查蛇头能否到达蛇尾"""
+        graph = self.graph
+        snake = engine.snake
+        index = graph.index
+        path = self.path(engine)
+        body = [index(cell) for cell in snake.position]
+        virtual = (path[::-1] + body)[:snake.length + 1]
+        if len(virtual) < 2:
+            return True
+        blocked = bytearray(graph.size)
+        for i in virtual:
+            blocked[i] = 1
+        tail = virtual[-1]
+        blocked[tail] = 0
+
+        seen = bytearray(graph.size)
+        seen[virtual[0]] = 1
+        queue = deque((virtual[0],))
+        neighbors = graph.neighbors
+        while queue:
+            i = queue.popleft()
+            for _, j in neighbors[i]:
+                if j == tail:
+                    return True
+                if not seen[j] and not blocked[j]:
+                    seen[j] = 1
+                    queue.append(j)
+        return False
+
+    def descend(self, engine) -> Optional[str]:
+        """选择距离严格减小且安全的邻居"""
+        graph = self.graph
+        snake = engine.snake
+        distance = self.distance
+        head = graph.index(snake.position[0])
+        current = distance[head]
+        if current <= 0:
+            return None
+        reverse = reverse_action(engine)
+        best, best_distance = None, current
+        for action, j in graph.neighbors[head]:
+            d = distance[j]
+            if 0 <= d < best_distance and action != reverse:
+                if is_safe(engine, graph.cell(j)):
+                    best, best_distance = action, d
+        return best
+
+    def survive(self, engine) -> Optional[str]:
+        """没有安全的吃食路径时追着蛇尾走；到不了蛇尾时选择剩余空间最大的方向"""
+        action = self.follow_route(engine)
+        if action is None:
+            self.route = self.route_to_tail(engine)
+            action = self.follow_route(engine)
+        if action is None:
+            action = self.most_space(engine)
+        return action
+
+    def follow_route(self, engine) -> Optional[str]:
+        """沿缓存的追尾路线走一步，下一格不安全时丢弃路线"""
+        if not self.route:
+            return None
+        snake = engine.snake
+        graph = self.graph
+        target = self.route[0]
+        cell = graph.cell(target)
+        reverse = reverse_action(engine)
+        for action, j in graph.neighbors[graph.index(snake.position[0])]:
+            if j == target and action != reverse and is_safe(engine, cell):
+                self.route.popleft()
+                return action
+        self.route.clear()
+        return None
+
+    def route_to_tail(self, engine) -> deque:
+        """从蛇头 BFS 到蛇尾的路线（找到即停）
+
+        路线上的格子此刻都空闲，之后只有蛇头会走进来，而蛇尾会让出终点，
+        所以路线在走完之前一直有效，每步只需检查下一格。
+        """
+        graph = self.graph
+        snake = engine.snake
+        head = graph.index(snake.position[0])
+        tail = graph.index(snake.position[-1])
+        blocked = self.blocked_cells(engine)
+        parent = {head: head}
+        queue = deque((head,))
+        neighbors = graph.neighbors
+        while queue:
+            i = queue.popleft()
+            for _, j in neighbors[i]:
+                if j in parent or (blocked[j] and j != tail):
+                    continue
+                parent[j] = i
+                if j == tail:
+                    route = deque()
+                    while j != head:
+                        route.appendleft(j)
+                        j = parent[j]
+                    return route
+                queue.append(j)
+        return deque()
+
+    def most_space(self, engine) -> Optional[str]:
+        """选择洪水填充空间最大的方向，优先还能到达蛇尾的方向"""
+        graph = self.graph
+        snake = engine.snake
+        head = graph.index(snake.position[0])
+        blocked = self.blocked_cells(engine)
+        tail = graph.index(snake.position[-1])
+        limit = len(snake.position) + 1
+        reverse = reverse_action(engine)
+        best, best_score = None, None
+        for action, j in graph.neighbors[head]:
+            if action == reverse or blocked[j]:
+                continue
+            score = self.flood(j, head, tail, blocked, limit)
+            if best is None or score > best_score:
+                best, best_score = action, score
+        return best
+
+    def flood(self, start: int, head: int, tail: int, blocked: bytearray,
+              limit: int) -> Tuple[bool, int]:
+        """从 start 洪水填充，返回 (空间足够或能到达蛇尾, 可达格子数（最多 limit）)"""
+        seen = bytearray(blocked)
+        seen[start] = seen[head] = 1
+        queue = deque((start,))
+        neighbors = self.graph.neighbors
+        count, reaches_tail = 1, start == tail
+        while queue and count < limit:
+            i = queue.popleft()
+            for _, j in neighbors[i]:
+                if j == tail:
+                    reaches_tail = True
+                if not seen[j]:
+                    seen[j] = 1
+                    count += 1
+                    queue.append(j)
+        return (reaches_tail or count >= limit, min(count, limit))
@@ -0,0 +1,236 @@
+"""
+NumPy 批量游戏环境
+"""
+from typing import Dict, Optional, Tuple
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import (
+    Difficulty, DIFFICULTY_SETTINGS, MOVE_DELAY, SIMULATION,
+    SCORE_SYSTEM, RESPAWN_SYSTEM, ACTIONS
+)
+from src.engine.board import Board
+from src.engine.scoring import food_score
+
+# 动作编号与 ACTIONS 顺序一致：UP, DOWN, LEFT, RIGHT；-1 表示保持方向
+_DX = np.array([0, 0, -1, 1], dtype=np.int32)
+_DY = np.array([-1, 1, 0, 0], dtype=np.int32)
+_OPPOSITE = np.array([1, 0, 3, 2], dtype=np.int8)
+_START_ACTION = ACTIONS.index("RIGHT")  # 与 Snake 的初始方向一致
+
+# step 返回的每局事件
+EVENT_IDLE = -1  # 本局已结束，未推进
+EVENT_MOVE = 0
+EVENT_EAT = 1
+EVENT_RESPAWN = 2
+
+# 结束原因
+END_NONE = 0
+END_COLLISION = 1
+END_TIME_UP = 2
+END_BOARD_FULL = 3
+
+class BatchEngine:
+    """同时推进 N 局游戏的向量化环境
+
+    规则与 GameEngine 一致（移动、撞墙/穿墙、自身碰撞、尾巴释放、连击计分、
+    生命与重生、时间限制、棋盘已满），状态全部保存在数组中：
+    每局一张占用表、环形缓冲区保存的蛇身、长度、连击数等。
+    坐标使用格子编号 row * cols + col。
+    """
+    def __init__(self, num_games: int, difficulty: Difficulty = Difficulty.HARD,
+                 board: Board = None, seed: int = None):
+        self.num_games = num_games
+        self.difficulty = difficulty
+        self.settings = DIFFICULTY_SETTINGS[difficulty]
+        self.board = board or Board.for_difficulty(difficulty)
+        self.cols = self.board.cols
+        self.rows = self.board.rows
+        self.num_cells = self.cols * self.rows
+        self.rng = np.random.default_rng(seed)
+        
+        size = self.board.cell_size
+        self.food_cells = np.array(
+            [(y // size) * self.cols + x // size for x, y in self.board.food_cells()],
+            dtype=np.int32
+        )
+        x_range, y_range = self.board.respawn_ranges()
+        self.respawn_cols = np.array([x // size for x in x_range], dtype=np.int32)
+        self.respawn_rows = np.array([y // size for y in y_range], dtype=np.int32)
+        spawn_x, spawn_y = self.board.default_spawn()
+        self.default_spawn = (spawn_y // size) * self.cols + spawn_x // size
+        
+        # 连击数 -> 单个食物得分，超过最高连击门槛后分数不再变化
+        self.max_combo = max(SCORE_SYSTEM["combo_multiplier"])
+        self.score_table = np.array(
+            [food_score(combo, difficulty) for combo in range(self.max_combo + 1)],
+            dtype=np.int64
+        )
+        
+        # 时间限制按整数帧比较，与 GameEngine.time_left 相同
+        self.move_delay = MOVE_DELAY[difficulty]
+        time_limit = self.settings["time_limit"]
+        self.time_limit_frames = time_limit * SIMULATION["tick_rate"] if time_limit else None
+        
+        n, c = num_games, self.num_cells
+        self.occupied = np.zeros((n, c), dtype=bool)
+        self.body = np.zeros((n, c), dtype=np.int32)  # 环形缓冲区，head_ptr 指向蛇头
+        self.head_ptr = np.zeros(n, dtype=np.int64)
+        self.size = np.zeros(n, dtype=np.int64)  # 当前蛇身节数
+        self.length = np.zeros(n, dtype=np.int64)  # 目标长度（吃到食物后增加）
+        self.direction = np.zeros(n, dtype=np.int8)
+        self.food = np.zeros(n, dtype=np.int32)  # -1 表示没有食物
+        self.score = np.zeros(n, dtype=np.int64)
+        self.combo = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int64)
+        self.tick = np.zeros(n, dtype=np.int64)
+        self.done = np.ones(n, dtype=bool)
+        self.end_reason = np.zeros(n, dtype=np.int8)
+        self._rows_index = np.arange(n)
+        self.reset()
+        
+    @property
+    def head(self) -> np.ndarray:
+        """每局蛇头所在格子"""
+        return self.body[self._rows_index, self.head_ptr]
+        
+    def observe(self) -> Dict[str, np.ndarray]:
+        """当前状态的只读视图"""
+        return {
+            "occupied": self.occupied.reshape(self.num_games, self.rows, self.cols),
+            "head": self.head,
+            "food": self.food,
+            "direction": self.direction,
+            "length": self.length,
+            "done": self.done
+        }
+        
+    def reset(self, games: np.ndarray = None) -> Dict[str, np.ndarray]:
+        """重新开始全部或指定的若干局"""
+        idx = self._rows_index if games is None else np.asarray(games)
+        count = len(idx)
+        self.occupied[idx] = False
+        self.head_ptr[idx] = 0
+        self.size[idx] = 1
+        self.length[idx] = 1
+        self.direction[idx] = _START_ACTION
+        self.score[idx] = 0
+        self.combo[idx] = 0
+        self.lives[idx] = self.settings["lives"]
+        self.tick[idx] = 0
+        self.done[idx] = False
+        self.end_reason[idx] = END_NONE
+        
+        # 空棋盘上第一次尝试一定安全
+        start = (self.rng.choice(self.respawn_rows, count) * self.cols
+                 + self.rng.choice(self.respawn_cols, count))
+        self.body[idx, 0] = start
+        self.occupied[idx, start] = True
+        self.food[idx] = -1
+        self._spawn_food(idx)
+        return self.observe()
+        
+    def step(self, actions) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray]:
+        """所有未结束的局各推进一步
+
+        actions 为长度 N 的动作编号数组（-1 表示保持方向）。
+        返回 (状态, 本步得分, 是否结束, 事件)。
+        """
+        actions = np.asarray(actions)
+        active = ~self.done
+        events = np.where(active, EVENT_MOVE, EVENT_IDLE).astype(np.int8)
+        before = self.score.copy()
+        
+        # 改变方向：不能直接掉头（与 Snake.change_direction 相同）
+        turn = active & (actions >= 0)
+        turn &= actions.astype(np.int8) != _OPPOSITE[self.direction]
+        self.direction[turn] = actions[turn]
+        
+        self.tick[active] += 1
+        head = self.head
+        new_x = head % self.cols + _DX[self.direction]
+        new_y = head // self.cols + _DY[self.direction]
+        if self.settings["wall_collision"]:
+            wall = (new_x < 0) | (new_x >= self.cols) | (new_y < 0) | (new_y >= self.rows)
+        else:
+            new_x %= self.cols
+            new_y %= self.rows
+            wall = np.zeros(self.num_games, dtype=bool)
+        new_head = np.where(wall, 0, new_y * self.cols + new_x)
+        
+        # 本步会释放的尾巴不算碰撞
+        capacity = self.num_cells
+        tail_ptr = (self.head_ptr - self.size + 1) % capacity
+        tail = self.body[self._rows_index, tail_ptr]
+        releases_tail = self.size >= self.length
+        hit = self.occupied[self._rows_index, new_head] & ~(releases_tail & (new_head == tail))
+        collided = active & (wall | hit)
+        moved = active & ~collided
+        
+        # 释放尾巴、压入新蛇头
+        pop = moved & releases_tail
+        self.occupied[pop, tail[pop]] = False
+        self.size[pop] -= 1
+        self.head_ptr[moved] = (self.head_ptr[moved] + 1) % capacity
+        self.body[moved, self.head_ptr[moved]] = new_head[moved]
+        self.occupied[moved, new_head[moved]] = True
+        self.size[moved] += 1
+        
+        # 吃到食物：长度和连击加一，按连击与难度计分
+        ate = moved & (new_head == self.food)
+        self.length[ate] += 1
+        self.combo[ate] += 1
+        self.score[ate] += self.score_table[np.minimum(self.combo[ate], self.max_combo)]
+        events[ate] = EVENT_EAT
+        full = self._spawn_food(np.nonzero(ate)[0])
+        self._end(full, END_BOARD_FULL)
+        
+        # 碰撞：有剩余生命则重生，否则结束
+        revive = collided & (self.lives > 0)
+        self.lives[revive] -= 1
+        for game in np.nonzero(revive)[0]:
+            self._respawn(game)
+        events[revive] = EVENT_RESPAWN
+        self._end(np.nonzero(collided & ~revive)[0], END_COLLISION)
+        
+        if self.time_limit_frames is not None:
+            time_up = ~self.done & (self.tick * self.move_delay >= self.time_limit_frames)
+            self._end(np.nonzero(time_up)[0], END_TIME_UP)
+            
+        return self.observe(), self.score - before, self.done.copy(), events
+        
+    def _end(self, games: np.ndarray, reason: int):
+        self.done[games] = True
+        self.end_reason[games] = reason
+        
+    def _spawn_food(self, games: np.ndarray) -> np.ndarray:
+        """在食物区域的空闲格子中均匀取样，返回没有空位的局"""
+        if len(games) == 0:
+            return games
+        free = ~self.occupied[games][:, self.food_cells]
+        keys = self.rng.random(free.shape)
+        keys[~free] = -1.0
+        choice = keys.argmax(axis=1)
+        has_space = free[np.arange(len(games)), choice]
+        self.food[games] = np.where(has_space, self.food_cells[choice], -1)
+        return games[~has_space]
+        
+    def _respawn(self, game: int):
+        """与 Snake.find_safe_position 相同：随机尝试若干次，离现有蛇身至少两格"""
+        cells = np.nonzero(self.occupied[game])[0]
+        body_x, body_y = cells % self.cols, cells // self.cols
+        spawn = self.default_spawn
+        for _ in range(RESPAWN_SYSTEM["position_tries"]):
+            x = self.rng.choice(self.respawn_cols)
+            y = self.rng.choice(self.respawn_rows)
+            if not np.any((np.abs(body_x - x) < 2) & (np.abs(body_y - y) < 2)):
+                spawn = y * self.cols + x
+                break
+        self.occupied[game] = False
+        self.size[game] = 1
+        self.body[game, self.head_ptr[game]] = spawn
+        self.occupied[game, spawn] = True
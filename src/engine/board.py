@@ -0,0 +1,101 @@
+"""
+棋盘几何
+"""
+from typing import List, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, CELL_SIZE, GAME_AREA, RESPAWN_SYSTEM, LARGE_BOARD,
+    Difficulty
+)
+
+class Board:
+    """棋盘：墙壁边界、食物区域与重生区域
+
+    坐标沿用游戏的像素坐标（格子左上角，按 CELL_SIZE 对齐）。
+    默认棋盘与窗口一致：撞墙按窗口边界判定，食物只在游戏区域内生成。
+    """
+    def __init__(self, width: int, height: int, food_top: int = 0, food_bottom: int = None,
+                 cell_size: int = CELL_SIZE):
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.food_top = food_top
+        self.food_bottom = height if food_bottom is None else food_bottom
+        
+    @classmethod
+    def default(cls) -> "Board":
+        """与窗口布局一致的标准棋盘"""
+        return cls(
+            WINDOW_WIDTH, WINDOW_HEIGHT,
+            food_top=int(GAME_AREA["top"]),
+            food_bottom=int(GAME_AREA["bottom"])
+        )
+        
+    @classmethod
+    def large(cls, cols: int, rows: int) -> "Board":
+        """远大于窗口的棋盘，整个棋盘都可以生成食物"""
+        return cls(cols * CELL_SIZE, rows * CELL_SIZE)
+        
+    @classmethod
+    def for_difficulty(cls, difficulty: Difficulty) -> "Board":
+        """按配置为难度选择棋盘（回放与校验据此得到同样的棋盘）"""
+        if LARGE_BOARD["enabled"] and difficulty in LARGE_BOARD["difficulties"]:
+            return cls.large(LARGE_BOARD["cols"], LARGE_BOARD["rows"])
+        return cls.default()
+        
+    @property
+    def cols(self) -> int:
+        return self.width // self.cell_size
+        
+    @property
+    def rows(self) -> int:
+        return self.height // self.cell_size
+        
+    def contains(self, position: Tuple[int, int]) -> bool:
+        """位置是否在墙内"""
+        return 0 <= position[0] < self.width and 0 <= position[1] < self.height
+        
+    def wrap(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        """穿墙时把位置折回棋盘"""
+        return (position[0] % self.width, position[1] % self.height)
+        
+    @property
+    def food_cell_count(self) -> int:
+        """食物区域的格子数"""
+        return self.cols * ((self.food_bottom - self.food_top) // self.cell_size)
+        
+    def food_cell_at(self, index: int) -> Tuple[int, int]:
+        """食物区域内第 index 个格子（与 food_cells 的顺序一致）"""
+        row, col = divmod(index, self.cols)
+        return (col * self.cell_size, self.food_top + row * self.cell_size)
+        
+    def in_food_area(self, position: Tuple[int, int]) -> bool:
+        """位置是否在食物区域内"""
+        return (0 <= position[0] <= self.width - self.cell_size
+                and self.food_top <= position[1] <= self.food_bottom - self.cell_size)
+        
+    def food_cells(self) -> List[Tuple[int, int]]:
+        """食物可生成区域内的全部格子"""
+        size = self.cell_size
+        return [
+            (x, y)
+            for y in range(self.food_top, self.food_bottom - size + 1, size)
+            for x in range(0, self.width - size + 1, size)
+        ]
+        
+    def respawn_ranges(self) -> Tuple[range, range]:
+        """重生位置的候选范围（离墙至少 safe_distance 格）"""
+        size = self.cell_size
+        margin = size * RESPAWN_SYSTEM["safe_distance"]
+        return (
+            range(margin, self.width - size - margin, size),
+            range(self.food_top + margin, self.food_bottom - size - margin, size)
+        )
+        
+    def default_spawn(self) -> Tuple[int, int]:
+        """找不到安全位置时使用的重生点"""
+        return (self.width // 2, (self.food_top + self.food_bottom) // 2)
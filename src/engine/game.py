@@ -0,0 +1,114 @@
+"""
+无界面游戏引擎
+"""
+import random
+from typing import List, Optional, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import (
+    Difficulty, DIFFICULTY_SETTINGS, MOVE_DELAY, SIMULATION, DIRECTIONS
+)
+from src.engine.board import Board
+from src.game.snake import Snake
+from src.game.food import Food
+
+# 单步事件
+EVENT_MOVE = "move"  # 正常移动
+EVENT_EAT = "eat"  # 吃到食物
+EVENT_RESPAWN = "respawn"  # 碰撞后消耗生命重生
+
+# 游戏结束原因
+END_COLLISION = "collision"  # 生命耗尽
+END_TIME_UP = "time_up"  # 时间耗尽
+END_BOARD_FULL = "board_full"  # 没有空位放食物
+
+class GameEngine:
+    """游戏规则核心，不依赖 pygame
+
+    一次 step 对应蛇移动一格。给定难度、种子和每一步的动作，结果完全确定，
+    因此既能驱动界面，也能在无界面环境中批量模拟。
+    """
+    def __init__(self, difficulty: Difficulty = Difficulty.HARD, seed: int = None,
+                 board: Board = None):
+        self.difficulty = difficulty
+        self.settings = DIFFICULTY_SETTINGS[difficulty]
+        self.board = board or Board.for_difficulty(difficulty)
+        self.reset(seed)
+        
+    def reset(self, seed: int = None):
+        """开始新的一局"""
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.snake = Snake(self.board, self.rng)
+        self.snake.difficulty = self.difficulty
+        self.snake.speed = self.settings["speed"]
+        self.snake.wall_collision = self.settings["wall_collision"]
+        self.snake.lives = self.settings["lives"]
+        self.snake.move_delay = MOVE_DELAY[self.difficulty]
+        self.food = Food(self.snake.free_cells, self.board, self.rng)
+        self.tick = 0  # 已执行的步数
+        self.inputs: List[Tuple[int, str]] = []  # 生效的方向改变 (步数, 动作)，用于录制回放
+        self.game_over = False
+        self.end_reason: Optional[str] = None
+        
+    @property
+    def step_interval(self) -> float:
+        """每步对应的游戏时间（秒）"""
+        return self.snake.step_interval
+        
+    @property
+    def elapsed(self) -> float:
+        """已进行的游戏时间（秒）"""
+        return self.tick * self.step_interval
+        
+    @property
+    def time_left(self) -> Optional[int]:
+        """剩余整秒数，无时间限制时返回 None"""
+        time_limit = self.settings["time_limit"]
+        if not time_limit:
+            return None
+        # 用整数帧计算，避免浮点误差导致结束步数漂移
+        elapsed_seconds = self.tick * self.snake.move_delay // SIMULATION["tick_rate"]
+        return max(0, time_limit - elapsed_seconds)
+        
+    def change_direction(self, action: str):
+        """按动作名（UP/DOWN/LEFT/RIGHT）改变方向"""
+        direction = self.snake.direction
+        self.snake.change_direction(DIRECTIONS[action])
+        if self.snake.direction != direction:
+            self.inputs.append((self.tick, action))
+        
+    def step(self, action: str = None) -> str:
+        """推进一步，返回本步事件"""
+        if self.game_over:
+            raise RuntimeError("game is over")
+        if action is not None:
+            self.change_direction(action)
+            
+        self.tick += 1
+        event = EVENT_MOVE
+        collision = self.snake.move(allow_wall_pass=not self.settings["wall_collision"])
+        if collision:
+            if self.snake.respawn():
+                event = EVENT_RESPAWN
+            else:
+                self.end(END_COLLISION)
+                return event
+        elif self.snake.position[0] == self.food.position:
+            self.snake.grow()
+            event = EVENT_EAT
+            if not self.food.respawn(self.snake.free_cells):
+                self.end(END_BOARD_FULL)
+                return event
+                
+        if self.time_left == 0:
+            self.end(END_TIME_UP)
+        return event
+        
+    def end(self, reason: str):
+        """结束本局"""
+        self.game_over = True
+        self.end_reason = reason
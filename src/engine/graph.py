@@ -0,0 +1,48 @@
+"""
+棋盘格子图
+"""
+from functools import lru_cache
+from typing import List, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import ACTIONS, DIRECTIONS
+
+class CellGraph:
+    """棋盘格子的邻接表
+
+    格子用平铺下标 y * cols + x 表示；neighbors[i] 为 (动作, 相邻下标) 的元组，
+    撞墙模式下不含墙外的邻居，穿墙模式下折回棋盘另一侧。
+    """
+    def __init__(self, cols: int, rows: int, cell_size: int, wrap: bool):
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.size = cols * rows
+        self.neighbors: List[Tuple[Tuple[str, int], ...]] = []
+        for i in range(self.size):
+            y, x = divmod(i, cols)
+            cells = []
+            for action in ACTIONS:
+                dx, dy = DIRECTIONS[action]
+                nx, ny = x + dx // cell_size, y + dy // cell_size
+                if not (0 <= nx < cols and 0 <= ny < rows):
+                    if not wrap:
+                        continue
+                    nx, ny = nx % cols, ny % rows
+                cells.append((action, ny * cols + nx))
+            self.neighbors.append(tuple(cells))
+
+    def index(self, cell: Tuple[int, int]) -> int:
+        return (cell[1] // self.cell_size) * self.cols + cell[0] // self.cell_size
+
+    def cell(self, index: int) -> Tuple[int, int]:
+        y, x = divmod(index, self.cols)
+        return (x * self.cell_size, y * self.cell_size)
+
+@lru_cache(maxsize=8)
+def cell_graph(cols: int, rows: int, cell_size: int, wrap: bool) -> CellGraph:
+    """按棋盘尺寸缓存邻接表，同一尺寸的多局游戏共用"""
+    return CellGraph(cols, rows, cell_size, wrap)
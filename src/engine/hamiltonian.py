@@ -0,0 +1,171 @@
+"""
+Hamiltonian 环路求解器
+"""
+from array import array
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import HAMILTONIAN, LARGE_BOARD
+from src.engine.policies import Policy, register_policy, is_safe, reverse_action
+from src.engine.autopilot import BfsAutopilot
+from src.engine.graph import CellGraph, cell_graph
+
+_CYCLES: Dict[Tuple[int, int], array] = {}
+
+def build_cycle(cols: int, rows: int) -> array:
+    """构造经过每个格子恰好一次的环路，返回按环路顺序排列的平铺下标
+
+    第一行向右，其余行在第 1 列之后蛇形往返，最后沿第 0 列回到起点；
+    该构造要求行数为偶数，行数为奇数时按转置的棋盘构造。奇数 x 奇数的棋盘不存在环路。
+    """
+    if cols < 2 or rows < 2:
+        raise ValueError(f"board {cols}x{rows} is too small for a Hamiltonian cycle")
+    if rows % 2 == 0:
+        width, height, transpose = cols, rows, False
+    elif cols % 2 == 0:
+        width, height, transpose = rows, cols, True
+    else:
+        raise ValueError(f"odd x odd board {cols}x{rows} has no Hamiltonian cycle")
+
+    cells = [(x, 0) for x in range(width)]
+    for y in range(1, height):
+        xs = range(width - 1, 0, -1) if y % 2 == 1 else range(1, width)
+        cells.extend((x, y) for x in xs)
+    cells.extend((0, y) for y in range(height - 1, 0, -1))
+    if transpose:
+        cells = [(y, x) for x, y in cells]
+    return array('I', (y * cols + x for x, y in cells))
+
+def is_valid_cycle(cycle: array, cols: int, rows: int) -> bool:
+    """检查环路覆盖全部格子且相邻两格在棋盘上相邻（含首尾）"""
+    size = cols * rows
+    if len(cycle) != size or len(set(cycle)) != size or max(cycle) >= size:
+        return False
+    for a, b in zip(cycle, cycle[1:] + cycle[:1]):
+        ay, ax = divmod(a, cols)
+        by, bx = divmod(b, cols)
+        if abs(ax - bx) + abs(ay - by) != 1:
+            return False
+    return True
+
+def cycle_path(cols: int, rows: int, cache_dir: str = None) -> str:
+    return os.path.join(cache_dir or HAMILTONIAN["cache_dir"], f"{cols}x{rows}.bin")
+
+def load_cycle(cols: int, rows: int, cache_dir: str = None) -> array:
+    """读取棋盘尺寸对应的环路；没有缓存（或缓存损坏）时构造并写入磁盘
+
+    文件内容为小端 uint32 平铺下标数组，同一尺寸在进程内也只读取一次。
+    """
+    key = (cols, rows)
+    if key in _CYCLES:
+        return _CYCLES[key]
+    path = cycle_path(cols, rows, cache_dir)
+    cycle = array('I')
+    try:
+        with open(path, 'rb') as f:
+            cycle.frombytes(f.read())
+        if sys.byteorder == "big":
+            cycle.byteswap()
+    except (OSError, ValueError):
+        cycle = array('I')
+    if not is_valid_cycle(cycle, cols, rows):
+        cycle = build_cycle(cols, rows)
+        save_cycle(cycle, path)
+    _CYCLES[key] = cycle
+    return cycle
+
+def save_cycle(cycle: array, path: str):
+    """以临时文件 + rename 的方式写入环路缓存，写入失败不影响求解"""
+    data = array('I', cycle)
+    if sys.byteorder == "big":
+        data.byteswap()
+    try:
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                data.tofile(f)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"Error saving cycle cache {path}: {e}")
+
+@register_policy("hamiltonian")
+class HamiltonianSolver(Policy):
+    """沿 Hamiltonian 环路走满整个棋盘，蛇身较短时走安全捷径
+
+    蛇身始终按环路顺序排列（蛇尾在后、蛇头在前），因此沿环路的下一格总是空的。
+    捷径只跳过蛇头与蛇尾之间的空格，不越过食物，并与蛇尾保留 shortcut_buffer 格
+    （加上尚未长出的长度），所以跳过之后蛇身仍按环路顺序排列。
+    蛇身超过棋盘的 shortcut_max_fill 后严格沿环路走，保证能够填满棋盘。
+    """
+    def reset(self, engine):
+        self.fallback: Optional[Policy] = None
+        board = engine.board
+        try:
+            if board.cols * board.rows > LARGE_BOARD["dense_index_limit"]:
+                raise ValueError("board is too large for a precomputed cycle")
+            cycle = load_cycle(board.cols, board.rows)
+        except ValueError:
+            # 不存在环路的棋盘改用 BFS 自动驾驶
+            self.fallback = BfsAutopilot(self.rng)
+            self.fallback.reset(engine)
+            return
+        self.graph: CellGraph = cell_graph(
+            board.cols, board.rows, board.cell_size, not engine.settings["wall_collision"]
+        )
+        self.cycle = cycle
+        self.order: List[int] = [0] * len(cycle)
+        for position, index in enumerate(cycle):
+            self.order[index] = position
+
+    def act(self, engine) -> Optional[str]:
+        if self.fallback is not None:
+            return self.fallback.act(engine)
+        graph = self.graph
+        order = self.order
+        size = len(order)
+        snake = engine.snake
+        body = snake.position
+        head = graph.index(body[0])
+        head_order = order[head]
+        reverse = reverse_action(engine)
+
+        # 沿环路的下一格
+        best = None
+        step = self.cycle[(head_order + 1) % size]
+        for action, j in graph.neighbors[head]:
+            if j == step and action != reverse and is_safe(engine, graph.cell(j)):
+                best = action
+
+        food = engine.food.position
+        if food is None or len(body) > size * HAMILTONIAN["shortcut_max_fill"]:
+            return best
+        # 捷径：环路距离不超过食物、且与蛇尾保持距离的最远邻居
+        food_distance = (order[graph.index(food)] - head_order) % size
+        tail_distance = (order[graph.index(body[-1])] - head_order) % size if len(body) > 1 else size
+        limit = min(
+            food_distance + 1,
+            tail_distance - HAMILTONIAN["shortcut_buffer"] - (snake.length - len(body))
+        )
+        shortcut, shortcut_distance = None, 1
+        for action, j in graph.neighbors[head]:
+            distance = (order[j] - head_order) % size
+            if (shortcut_distance < distance < limit and action != reverse
+                    and is_safe(engine, graph.cell(j))):
+                shortcut, shortcut_distance = action, distance
+        if shortcut is not None:
+            return shortcut
+        if best is None:
+            # 长度为 1 时环路的下一格可能正好在身后（或蛇身不是按环路顺序排列），换一个不掉头的安全方向
+            for action, j in graph.neighbors[head]:
+                if action != reverse and is_safe(engine, graph.cell(j)):
+                    return action
+        return best
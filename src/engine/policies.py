@@ -0,0 +1,100 @@
+"""
+自动驾驶策略
+"""
+import abc
+import random
+from typing import Callable, Dict, List, Optional, Tuple, Type
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import ACTIONS, DIRECTIONS
+
+POLICIES: Dict[str, Type["Policy"]] = {}
+
+def register_policy(name: str) -> Callable[[Type["Policy"]], Type["Policy"]]:
+    """注册策略类，供锦标赛与演示模式按名字创建"""
+    def decorator(cls):
+        cls.name = name
+        POLICIES[name] = cls
+        return cls
+    return decorator
+
+def make_policy(name: str, rng: random.Random = None) -> "Policy":
+    """按名字创建策略实例"""
+    if name not in POLICIES:
+        raise ValueError(f"unknown policy: {name} (available: {', '.join(sorted(POLICIES))})")
+    return POLICIES[name](rng)
+
+def next_cell(engine, action: str) -> Optional[Tuple[int, int]]:
+    """按该动作移动后蛇头的位置，撞墙时返回 None"""
+    head = engine.snake.position[0]
+    dx, dy = DIRECTIONS[action]
+    cell = (head[0] + dx, head[1] + dy)
+    if engine.board.contains(cell):
+        return cell
+    if engine.settings["wall_collision"]:
+        return None
+    return engine.board.wrap(cell)
+
+def is_safe(engine, cell: Optional[Tuple[int, int]]) -> bool:
+    """移动到该格子是否不会立即碰撞（与 Snake.move 的判定一致）"""
+    if cell is None:
+        return False
+    snake = engine.snake
+    if not snake.occupies(cell):
+        return True
+    return len(snake.position) >= snake.length and cell == snake.position[-1]
+
+OPPOSITE = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
+
+def reverse_action(engine) -> Optional[str]:
+    """掉头的动作（蛇会忽略该动作）"""
+    direction = engine.snake.direction
+    for action in ACTIONS:
+        if DIRECTIONS[action] == direction:
+            return OPPOSITE[action]
+    return None
+
+def legal_actions(engine) -> List[str]:
+    """不掉头的动作"""
+    dx, dy = engine.snake.direction
+    return [action for action in ACTIONS if DIRECTIONS[action] != (-dx, -dy)]
+
+class Policy(abc.ABC):
+    """策略基类：每步根据引擎状态返回动作名，返回 None 表示保持方向"""
+    name = ""
+    
+    def __init__(self, rng: random.Random = None):
+        self.rng = rng or random.Random()
+        
+    def reset(self, engine):
+        """新的一局开始时调用"""
+        pass
+        
+    @abc.abstractmethod
+    def act(self, engine) -> Optional[str]:
+        """返回本步的动作名"""
+
+@register_policy("random")
+class RandomPolicy(Policy):
+    """随机选择不会立即碰撞的方向"""
+    def act(self, engine) -> Optional[str]:
+        actions = [a for a in legal_actions(engine) if is_safe(engine, next_cell(engine, a))]
+        return self.rng.choice(actions) if actions else None
+
+@register_policy("greedy")
+class GreedyPolicy(Policy):
+    """朝食物方向走，只避开下一步的碰撞"""
+    def act(self, engine) -> Optional[str]:
+        food = engine.food.position
+        best, best_distance = None, None
+        for action in legal_actions(engine):
+            cell = next_cell(engine, action)
+            if not is_safe(engine, cell):
+                continue
+            distance = abs(cell[0] - food[0]) + abs(cell[1] - food[1]) if food else 0
+            if best is None or distance < best_distance:
+                best, best_distance = action, distance
+        return best
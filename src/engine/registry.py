@@ -0,0 +1,14 @@
+"""
+策略注册入口
+
+导入所有定义策略的模块，使其中的策略完成注册；锦标赛、演示模式等按名字创建策略时
+应从这里导入 POLICIES 与 make_policy，而不是直接从 policies 导入。
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.policies import POLICIES, Policy, make_policy
+import src.engine.autopilot  # noqa: F401
+import src.engine.hamiltonian  # noqa: F401
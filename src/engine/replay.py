@@ -0,0 +1,140 @@
+"""
+对局录像：紧凑的二进制格式与重放
+"""
+from typing import List, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import Difficulty, ACTIONS
+from src.engine.game import GameEngine
+
+# 文件格式（整数均为无符号 varint）：
+#   magic(4) version(1) difficulty(1) seed end_tick score event_count
+#   events: (与上一事件的步数差 << 2) | 动作编号
+MAGIC = b"SNKR"
+VERSION = 1
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+def write_varint(out: bytearray, value: int):
+    """LEB128 编码一个非负整数"""
+    if value < 0:
+        raise ValueError("varint must be non-negative")
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """解码一个 varint，返回 (值, 新的偏移)"""
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("truncated replay")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+class Replay:
+    """一局游戏的完整输入：难度、种子与每次方向改变所在的步数"""
+    def __init__(self, difficulty: Difficulty, seed: int, events: List[Tuple[int, str]],
+                 end_tick: int, score: int):
+        self.difficulty = difficulty
+        self.seed = seed
+        self.events = events  # (步数, 动作)，步数为改变方向时已执行的步数
+        self.end_tick = end_tick
+        self.score = score  # 客户端声称的分数
+        
+    @classmethod
+    def from_engine(cls, engine: GameEngine) -> "Replay":
+        """从引擎当前状态生成录像（引擎必须使用整数种子）"""
+        if not isinstance(engine.seed, int):
+            raise ValueError("only seeded games can be recorded")
+        return cls(engine.difficulty, engine.seed, list(engine.inputs),
+                   engine.tick, engine.snake.score)
+        
+    def to_bytes(self) -> bytes:
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        out.append(self.difficulty.value)
+        write_varint(out, self.seed)
+        write_varint(out, self.end_tick)
+        write_varint(out, self.score)
+        write_varint(out, len(self.events))
+        last_tick = 0
+        for tick, action in self.events:
+            write_varint(out, (tick - last_tick) << 2 | ACTION_CODES[action])
+            last_tick = tick
+        return bytes(out)
+        
+    @classmethod
+    def read_header(cls, data: bytes) -> Tuple[Difficulty, int, int, int, int]:
+        """只解析文件头，返回 (难度, 种子, 结束步数, 分数, 头部之后的偏移)"""
+        if data[:4] != MAGIC:
+            raise ValueError("not a replay file")
+        if len(data) < 6 or data[4] != VERSION:
+            raise ValueError("unsupported replay version")
+        try:
+            difficulty = Difficulty(data[5])
+        except ValueError:
+            raise ValueError("unknown difficulty in replay")
+        seed, offset = read_varint(data, 6)
+        end_tick, offset = read_varint(data, offset)
+        score, offset = read_varint(data, offset)
+        return difficulty, seed, end_tick, score, offset
+        
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        difficulty, seed, end_tick, score, offset = cls.read_header(data)
+        count, offset = read_varint(data, offset)
+        events = []
+        tick = 0
+        for _ in range(count):
+            value, offset = read_varint(data, offset)
+            tick += value >> 2
+            events.append((tick, ACTIONS[value & 0x3]))
+        if offset != len(data):
+            raise ValueError("trailing data in replay")
+        return cls(difficulty, seed, events, end_tick, score)
+        
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+            
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+class ReplayPlayer:
+    """按录像重新模拟一局，结果与原对局完全一致"""
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self.engine = GameEngine(replay.difficulty, seed=replay.seed)
+        self._next_event = 0
+        
+    def step(self) -> str:
+        """应用本步之前的输入并推进一步"""
+        engine = self.engine
+        events = self.replay.events
+        while self._next_event < len(events) and events[self._next_event][0] <= engine.tick:
+            engine.change_direction(events[self._next_event][1])
+            self._next_event += 1
+        return engine.step()
+        
+    def run(self, max_ticks: int = None) -> GameEngine:
+        """模拟到录像结束（或 max_ticks 步），返回引擎"""
+        end_tick = self.replay.end_tick if max_ticks is None else min(self.replay.end_tick, max_ticks)
+        engine = self.engine
+        while engine.tick < end_tick and not engine.game_over:
+            self.step()
+        return engine
+        
+    def matches(self) -> bool:
+        """重新模拟的结果是否与录像声称的步数和分数一致"""
+        engine = self.run()
+        return engine.tick == self.replay.end_tick and engine.snake.score == self.replay.score
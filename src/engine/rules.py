@@ -0,0 +1,131 @@
+"""
+游戏规则配置（不依赖 pygame，供无界面引擎与界面共用）
+"""
+from enum import Enum
+
+# 窗口设置
+WINDOW_WIDTH = 600
+WINDOW_HEIGHT = 800
+CELL_SIZE = 20
+
+# 游戏区域（食物生成与重生范围，像素坐标）
+GAME_AREA = {
+    "top": WINDOW_HEIGHT * 0.2,
+    "bottom": WINDOW_HEIGHT * 0.8,
+}
+
+# 游戏设置
+class Difficulty(Enum):
+    EASY = 1
+    MEDIUM = 2
+    HARD = 3
+    INFINITE = 4  # 新增无限模式
+
+DIFFICULTY_SETTINGS = {
+    Difficulty.EASY: {
+        "speed": 4,
+        "wall_collision": True,
+        "lives": 3,
+        "food_timeout": None,
+        "time_limit": 35,  # 35秒
+        "name": "Casual Mode"
+    },
+    Difficulty.MEDIUM: {
+        "speed": 6,
+        "wall_collision": True,
+        "lives": 1,
+        "food_timeout": None,
+        "time_limit": 60,  # 60秒
+        "name": "Hard Mode"
+    },
+    Difficulty.HARD: {
+        "speed": 8,
+        "wall_collision": True,
+        "lives": 1,
+        "food_timeout": 5000,
+        "time_limit": 90,  # 90秒
+        "name": "Hell Mode"
+    },
+    Difficulty.INFINITE: {
+        "speed": 8,
+        "wall_collision": True,
+        "lives": 1,
+        "food_timeout": 5000,
+        "time_limit": None,  # 无时间限制
+        "name": "Infinite Mode"
+    }
+}
+
+# 大棋盘模式：指定难度使用远大于窗口的棋盘，界面镜头跟随蛇头
+LARGE_BOARD = {
+    "enabled": False,
+    "difficulties": (Difficulty.INFINITE,),  # 使用大棋盘的难度
+    "cols": 2000,  # 棋盘列数
+    "rows": 2000,  # 棋盘行数
+    "dense_index_limit": 250000  # 食物格子数超过该值时改用拒绝采样，内存只随蛇长增长
+}
+
+# 添加帧率控制
+FPS = 60  # 游戏帧率
+MOVE_DELAY = {  # 每个难度的移动延迟（帧数）
+    Difficulty.EASY: 15,    # 约每秒4次移动
+    Difficulty.MEDIUM: 10,  # 约每秒6次移动
+    Difficulty.HARD: 8,     # 约每秒8次移动
+    Difficulty.INFINITE: 8  # 约每秒8次移动
+}
+
+# 固定步长模拟配置
+SIMULATION = {
+    "tick_rate": FPS,  # MOVE_DELAY 按该频率换算成秒，模拟速度与渲染帧率无关
+    "render_fps": 60,  # 渲染帧率上限，0 表示不限制
+    "max_frame_time": 0.25,  # 单帧最多补偿的模拟时间（秒），避免卡顿后追帧雪崩
+    "interpolate": True  # 在两次移动之间插值绘制蛇身
+} 
+
+# 分数系统配置
+SCORE_SYSTEM = {
+    "base_score": 10,  # 基础分数
+    "combo_multiplier": {  # 连击倍数
+        3: 1.5,  # 3连击 1.5倍
+        5: 2.0,  # 5连击 2倍
+        7: 2.5,  # 7连击 2.5倍
+        10: 3.0  # 10连击 3倍
+    },
+    "difficulty_bonus": {  # 难度加成
+        Difficulty.EASY: 1.0,
+        Difficulty.MEDIUM: 1.5,
+        Difficulty.HARD: 2.0,
+        Difficulty.INFINITE: 2.5
+    }
+}
+
+# 重生系统配置
+RESPAWN_SYSTEM = {
+    "invincible_time": 3,  # 重生后无敌时间（秒）
+    "flash_interval": 0.2,  # 闪烁间隔（秒）
+    "safe_distance": 5,     # 重生安全距离（格子数）
+    "position_tries": 10    # 重生位置尝试次数
+}
+
+# 录像校验配置
+VERIFICATION = {
+    "max_replay_bytes": 256 * 1024,  # 超过该大小的录像直接拒绝
+    "max_ticks": 200000,  # 无时间限制模式允许的最大步数
+    "workers": None  # 校验进程数，None 表示使用全部 CPU
+}
+
+# Hamiltonian 环路求解器
+HAMILTONIAN = {
+    "cache_dir": "save/cycles",  # 按棋盘尺寸缓存环路，文件名为 <列>x<行>.bin
+    "shortcut_max_fill": 0.5,  # 蛇身占棋盘的比例不超过该值时允许走捷径
+    "shortcut_buffer": 4  # 捷径与蛇尾之间至少保留的空格数
+}
+
+# 动作编码（引擎、回放与批量环境共用）
+ACTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+DIRECTIONS = {
+    "UP": (0, -CELL_SIZE),
+    "DOWN": (0, CELL_SIZE),
+    "LEFT": (-CELL_SIZE, 0),
+    "RIGHT": (CELL_SIZE, 0)
+}
@@ -0,0 +1,28 @@
+"""
+计分规则
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import Difficulty, SCORE_SYSTEM
+
+# 连击门槛从高到低排列，取第一个达到的倍数
+_COMBO_THRESHOLDS = sorted(SCORE_SYSTEM["combo_multiplier"].items(), reverse=True)
+
+def food_score(combo_count: int, difficulty: Difficulty) -> int:
+    """吃到一个食物的得分（combo_count 为包含本次在内的连击数）"""
+    score = SCORE_SYSTEM["base_score"]
+    
+    # 应用连击加成
+    for combo, multiplier in _COMBO_THRESHOLDS:
+        if combo_count >= combo:
+            score *= multiplier
+            break
+            
+    # 应用难度加成
+    if difficulty in SCORE_SYSTEM["difficulty_bonus"]:
+        score *= SCORE_SYSTEM["difficulty_bonus"][difficulty]
+        
+    return int(score)
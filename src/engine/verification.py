@@ -0,0 +1,103 @@
+"""
+排行榜提交校验：按录像无界面重新模拟，分数一致才接受
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import (
+    Difficulty, DIFFICULTY_SETTINGS, MOVE_DELAY, SIMULATION, VERIFICATION
+)
+from src.engine.replay import Replay, ReplayPlayer
+
+# 校验结果
+VERIFIED = "verified"
+REJECT_MALFORMED = "malformed"  # 无法解析
+REJECT_OVER_BUDGET = "over_budget"  # 文件或步数超出上限，未模拟
+REJECT_MISMATCH = "mismatch"  # 重新模拟的结果与声称的不一致
+
+def max_ticks(difficulty: Difficulty, config: Dict = VERIFICATION) -> int:
+    """该难度下一局最多能进行的步数"""
+    time_limit = DIFFICULTY_SETTINGS[difficulty]["time_limit"]
+    if not time_limit:
+        return config["max_ticks"]
+    # 与 GameEngine.time_left 一致：tick * move_delay >= 时限帧数 时结束
+    frames = time_limit * SIMULATION["tick_rate"]
+    return -(-frames // MOVE_DELAY[difficulty])
+
+def _result(status: str, difficulty: Difficulty = None, score: int = None,
+            ticks: int = None) -> Dict:
+    return {
+        "status": status,
+        "accepted": status == VERIFIED,
+        "difficulty": difficulty.name if difficulty else None,
+        "score": score,
+        "ticks": ticks
+    }
+
+def check_budget(data: bytes, config: Dict = VERIFICATION) -> Optional[Dict]:
+    """只读文件头做廉价检查，不通过时返回拒绝结果，否则返回 None"""
+    if len(data) > config["max_replay_bytes"]:
+        return _result(REJECT_OVER_BUDGET)
+    try:
+        difficulty, _, end_tick, score, _ = Replay.read_header(data)
+    except ValueError:
+        return _result(REJECT_MALFORMED)
+    if end_tick > max_ticks(difficulty, config):
+        return _result(REJECT_OVER_BUDGET, difficulty, score, end_tick)
+    return None
+
+def verify_replay(data: bytes, config: Dict = VERIFICATION) -> Dict:
+    """校验一份录像：重新模拟后必须在声称的步数以相同分数结束"""
+    rejected = check_budget(data, config)
+    if rejected:
+        return rejected
+    try:
+        replay = Replay.from_bytes(data)
+    except ValueError:
+        return _result(REJECT_MALFORMED)
+    
+    engine = ReplayPlayer(replay).run()
+    reproduced = (
+        engine.game_over
+        and engine.tick == replay.end_tick
+        and engine.snake.score == replay.score
+    )
+    status = VERIFIED if reproduced else REJECT_MISMATCH
+    return _result(status, replay.difficulty, replay.score, replay.end_tick)
+
+class VerificationService:
+    """用进程池并行校验提交队列
+
+    文件头检查在调用方进程完成，超出预算的录像不会占用工作进程。
+    """
+    def __init__(self, config: Dict = VERIFICATION):
+        self.config = config
+        self.executor = ProcessPoolExecutor(max_workers=config["workers"])
+        
+    def submit(self, data: bytes) -> Future:
+        """提交一份录像，返回结果的 Future"""
+        rejected = check_budget(data, self.config)
+        if rejected:
+            future = Future()
+            future.set_result(rejected)
+            return future
+        return self.executor.submit(verify_replay, data, self.config)
+        
+    def verify_all(self, submissions: Iterable[bytes]) -> Iterator[Dict]:
+        """按提交顺序返回校验结果"""
+        futures: List[Future] = [self.submit(data) for data in submissions]
+        for future in futures:
+            yield future.result()
+            
+    def close(self):
+        self.executor.shutdown()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, *exc):
+        self.close()
@@ -2,40 +2,33 @@
 食物类实现
 """
 import random
-from typing import Tuple
+from typing import Optional, Tuple
 import sys
 import os
 
 # 添加项目根目录到 Python 路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from src.config import (
-    CELL_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT,
-    LAYOUT
-)
+from src.engine.board import Board
+from src.game.grid import FreeCellIndex
 
 class Food:
-    def __init__(self):
-        self.position = self.generate_position()
+    def __init__(self, free_cells: FreeCellIndex = None, board: Board = None, rng=None):
+        self.board = board or Board.default()
+        self.rng = rng or random  # 随机源，传入 random.Random 实例可复现
+        self.position = self.generate_position(free_cells)
         self.spawn_time = 0
         
-    def generate_position(self, snake_positions: list = None) -> Tuple[int, int]:
-        """生成新的食物位置"""
-        # 根据游戏区域计算可用格子
-        min_x = 0
-        max_x = (WINDOW_WIDTH - CELL_SIZE)
-        min_y = int(LAYOUT["game_area"]["top"])
-        max_y = int(LAYOUT["game_area"]["bottom"] - CELL_SIZE)
-        
-        while True:
-            # 确保食物位置对齐网格
-            x = random.randrange(min_x, max_x + 1, CELL_SIZE)
-            y = random.randrange(min_y, max_y + 1, CELL_SIZE)
-            position = (x, y)
+    def generate_position(self, free_cells: FreeCellIndex = None) -> Optional[Tuple[int, int]]:
+        """生成新的食物位置，棋盘已满时返回 None"""
+        if free_cells is not None:
+            # 从空闲格子索引中均匀采样，不再拒绝采样
+            return free_cells.sample(self.rng)
             
-            if snake_positions is None or position not in snake_positions:
-                return position
+        # 没有蛇身信息时直接在食物区域内取一个格子
+        return self.board.food_cell_at(self.rng.randrange(self.board.food_cell_count))
                 
-    def respawn(self, snake_positions: list):
-        """重新生成食物"""
-        self.position = self.generate_position(snake_positions) 
\ No newline at end of file
+    def respawn(self, free_cells: FreeCellIndex) -> bool:
+        """重新生成食物，返回 False 表示棋盘已满"""
+        self.position = self.generate_position(free_cells)
+        return self.position is not None
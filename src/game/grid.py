@@ -0,0 +1,129 @@
+"""
+棋盘格子索引
+"""
+import random
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import LARGE_BOARD
+
+class FreeCellIndex:
+    """空闲格子索引
+
+    所有格子存放在一个数组里，前 free_count 个是空闲格子，
+    占用/释放时与边界格子交换位置，因此占用、释放和均匀采样都是 O(1)。
+    不在索引范围内的格子（如游戏区域外）会被忽略。
+    """
+    def __init__(self, cells: Iterable[Tuple[int, int]]):
+        self._cells: List[Tuple[int, int]] = list(cells)
+        self._slots: Dict[Tuple[int, int], int] = {
+            cell: i for i, cell in enumerate(self._cells)
+        }
+        self.free_count = len(self._cells)
+        
+    def __len__(self) -> int:
+        return self.free_count
+        
+    @property
+    def is_full(self) -> bool:
+        """是否已无空闲格子"""
+        return self.free_count == 0
+        
+    def is_free(self, cell: Tuple[int, int]) -> bool:
+        """判断格子是否空闲"""
+        slot = self._slots.get(cell)
+        return slot is not None and slot < self.free_count
+        
+    def _swap(self, i: int, j: int):
+        cell_i, cell_j = self._cells[i], self._cells[j]
+        self._cells[i], self._cells[j] = cell_j, cell_i
+        self._slots[cell_j] = i
+        self._slots[cell_i] = j
+        
+    def occupy(self, cell: Tuple[int, int]):
+        """标记格子为占用"""
+        slot = self._slots.get(cell)
+        if slot is None or slot >= self.free_count:
+            return
+        self.free_count -= 1
+        self._swap(slot, self.free_count)
+        
+    def release(self, cell: Tuple[int, int]):
+        """标记格子为空闲"""
+        slot = self._slots.get(cell)
+        if slot is None or slot < self.free_count:
+            return
+        self._swap(slot, self.free_count)
+        self.free_count += 1
+        
+    def reset(self, occupied: Iterable[Tuple[int, int]] = ()):
+        """全部释放后重新占用给定格子"""
+        self.free_count = len(self._cells)
+        for cell in occupied:
+            self.occupy(cell)
+            
+    def sample(self, rng=random) -> Optional[Tuple[int, int]]:
+        """均匀随机取一个空闲格子，棋盘已满时返回 None"""
+        if self.free_count == 0:
+            return None
+        return self._cells[rng.randrange(self.free_count)]
+            
+class SparseFreeCells:
+    """大棋盘的空闲格子集合
+
+    只记录食物区域内被占用的格子，内存与蛇长成正比而不是与棋盘面积成正比。
+    采样时在整个食物区域均匀取格子，遇到占用格子就重取（拒绝采样）；
+    连续失败 max_tries 次（棋盘接近占满）时退化为扫描全部空闲格子。
+    """
+    def __init__(self, board, max_tries: int = 64):
+        self.board = board
+        self.total = board.food_cell_count
+        self.max_tries = max_tries
+        self._occupied: Set[Tuple[int, int]] = set()
+        
+    def __len__(self) -> int:
+        return self.total - len(self._occupied)
+        
+    @property
+    def is_full(self) -> bool:
+        """是否已无空闲格子"""
+        return len(self._occupied) >= self.total
+        
+    def is_free(self, cell: Tuple[int, int]) -> bool:
+        """判断格子是否空闲"""
+        return self.board.in_food_area(cell) and cell not in self._occupied
+        
+    def occupy(self, cell: Tuple[int, int]):
+        """标记格子为占用"""
+        if self.board.in_food_area(cell):
+            self._occupied.add(cell)
+            
+    def release(self, cell: Tuple[int, int]):
+        """标记格子为空闲"""
+        self._occupied.discard(cell)
+        
+    def reset(self, occupied: Iterable[Tuple[int, int]] = ()):
+        """全部释放后重新占用给定格子"""
+        self._occupied.clear()
+        for cell in occupied:
+            self.occupy(cell)
+            
+    def sample(self, rng=random) -> Optional[Tuple[int, int]]:
+        """均匀随机取一个空闲格子，棋盘已满时返回 None"""
+        if self.is_full:
+            return None
+        for _ in range(self.max_tries):
+            cell = self.board.food_cell_at(rng.randrange(self.total))
+            if cell not in self._occupied:
+                return cell
+        free = [cell for cell in self.board.food_cells() if cell not in self._occupied]
+        return free[rng.randrange(len(free))]
+        
+def make_free_cells(board):
+    """按食物区域大小选择空闲格子索引：小棋盘用 FreeCellIndex，大棋盘用 SparseFreeCells"""
+    if board.food_cell_count > LARGE_BOARD["dense_index_limit"]:
+        return SparseFreeCells(board)
+    return FreeCellIndex(board.food_cells())
@@ -1,8 +1,8 @@
 """
 蛇类实现
 """
-from typing import List, Tuple
-import pygame
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
 import sys
 import os
 import random
@@ -11,31 +11,87 @@ import time
 # 添加项目根目录到 Python 路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from src.config import (
-    CELL_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT, 
-    DIFFICULTY_SETTINGS, Difficulty, MOVE_DELAY,
-    SCORE_SYSTEM, RESPAWN_SYSTEM, LAYOUT
+from src.engine.rules import (
+    CELL_SIZE, DIFFICULTY_SETTINGS, Difficulty, MOVE_DELAY,
+    RESPAWN_SYSTEM, SIMULATION
 )
+from src.engine.board import Board
+from src.engine.scoring import food_score
+from src.game.grid import make_free_cells
 
 class Snake:
-    def __init__(self):
+    def __init__(self, board: Board = None, rng=None):
+        self.board = board or Board.default()
+        self.rng = rng or random  # 随机源，传入 random.Random 实例可复现
         self.speed = DIFFICULTY_SETTINGS[Difficulty.HARD]["speed"]
         self.wall_collision = DIFFICULTY_SETTINGS[Difficulty.HARD]["wall_collision"]
         self.lives = DIFFICULTY_SETTINGS[Difficulty.HARD]["lives"]
         self.move_delay = MOVE_DELAY[Difficulty.HARD]
-        self.move_counter = 0
         self.combo_count = 0
         self.invincible = False
         self.invincible_timer = 0
         self.flash_timer = 0
         self.visible = True
-        self.position = []  # 初始化位置列表
+        self._body: Deque[Tuple[int, int]] = deque()  # 蛇身队列，头部在左端
+        self._occupied: Dict[Tuple[int, int], int] = {}  # 蛇身占用格子 -> 压入序号，与队列同步
+        self.head_serial = 0  # 每压入一节加一，蛇身每节的序号在其生命周期内不变
+        self.dirty_cells: Set[Tuple[int, int]] = set()  # 自上次绘制以来内容变化的格子
+        self.free_cells = make_free_cells(self.board)  # 食物区域空闲格子，随移动增量维护
+        self.previous_tail = None  # 上一步弹出的尾巴，用于插值绘制
         self.direction = (CELL_SIZE, 0)  # 初始化方向
         self.length = 1  # 初始化长度
         self.score = 0  # 初始化分数
         self.difficulty = Difficulty.HARD  # 初始化难度
         self.find_safe_position()  # 最后设置安全位置
         
+    @property
+    def position(self) -> Deque[Tuple[int, int]]:
+        """蛇身位置队列（头部在前），支持 position[0] 索引与遍历"""
+        return self._body
+        
+    @position.setter
+    def position(self, positions: Iterable[Tuple[int, int]]):
+        """整体替换蛇身并重建占用索引"""
+        self.dirty_cells.update(self._body)
+        self._body = deque(positions)
+        self.head_serial += len(self._body)
+        self._occupied = {
+            cell: self.head_serial - i for i, cell in enumerate(self._body)
+        }
+        self.dirty_cells.update(self._body)
+        self.free_cells.reset(self._body)
+        self.previous_tail = None
+        
+    def occupies(self, cell: Tuple[int, int]) -> bool:
+        """O(1) 判断格子是否被蛇身占用"""
+        return cell in self._occupied
+        
+    def segment_serial(self, cell: Tuple[int, int]) -> Optional[int]:
+        """占用该格子的蛇身序号，未占用时返回 None"""
+        return self._occupied.get(cell)
+        
+    def drain_dirty_cells(self) -> Set[Tuple[int, int]]:
+        """取出并清空自上次绘制以来变化的格子"""
+        cells = self.dirty_cells
+        self.dirty_cells = set()
+        return cells
+        
+    def _push_head(self, cell: Tuple[int, int]):
+        """头部压入新格子并更新占用索引"""
+        self.head_serial += 1
+        self._body.appendleft(cell)
+        self._occupied[cell] = self.head_serial
+        self.free_cells.occupy(cell)
+        self.dirty_cells.add(cell)
+        
+    def _pop_tail(self) -> Tuple[int, int]:
+        """弹出尾部格子并释放占用"""
+        tail = self._body.pop()
+        del self._occupied[tail]
+        self.free_cells.release(tail)
+        self.dirty_cells.add(tail)
+        return tail
+        
     def reset(self):
         """重置蛇的位置和状态"""
         self.direction = (CELL_SIZE, 0)
@@ -50,20 +106,11 @@ class Snake:
         
     def find_safe_position(self):
         """找到一个安全的重生位置"""
-        game_area_top = int(LAYOUT["game_area"]["top"])
-        game_area_bottom = int(LAYOUT["game_area"]["bottom"])
+        x_range, y_range = self.board.respawn_ranges()
         
         for _ in range(RESPAWN_SYSTEM["position_tries"]):
-            x = random.randrange(
-                CELL_SIZE * RESPAWN_SYSTEM["safe_distance"],
-                WINDOW_WIDTH - CELL_SIZE * (RESPAWN_SYSTEM["safe_distance"] + 1),
-                CELL_SIZE
-            )
-            y = random.randrange(
-                game_area_top + CELL_SIZE * RESPAWN_SYSTEM["safe_distance"],
-                game_area_bottom - CELL_SIZE * (RESPAWN_SYSTEM["safe_distance"] + 1),
-                CELL_SIZE
-            )
+            x = self.rng.choice(x_range)
+            y = self.rng.choice(y_range)
             
             # 检查位置是否安全
             if not any(abs(x - pos[0]) < CELL_SIZE * 2 and abs(y - pos[1]) < CELL_SIZE * 2 
@@ -72,7 +119,7 @@ class Snake:
                 return
             
         # 如果找不到安全位置，使用默认位置
-        self.position = [(WINDOW_WIDTH // 2, (game_area_top + game_area_bottom) // 2)]
+        self.position = [self.board.default_spawn()]
         
     def move(self, allow_wall_pass: bool = False) -> bool:
         """移动蛇并返回是否发生碰撞"""
@@ -83,22 +130,18 @@ class Snake:
         
         # 检查墙壁碰撞
         if not allow_wall_pass:
-            if (new_head[0] < 0 or new_head[0] >= WINDOW_WIDTH or
-                new_head[1] < 0 or new_head[1] >= WINDOW_HEIGHT):
+            if not self.board.contains(new_head):
                 return True
         else:
-            new_head = (
-                new_head[0] % WINDOW_WIDTH,
-                new_head[1] % WINDOW_HEIGHT
-            )
+            new_head = self.board.wrap(new_head)
             
-        # 检查自身碰撞
-        if new_head in self.position[:-1]:
+        # 检查自身碰撞：本步会释放的尾巴不算碰撞
+        releases_tail = len(self._body) >= self.length
+        if new_head in self._occupied and not (releases_tail and new_head == self._body[-1]):
             return True
             
-        self.position.insert(0, new_head)
-        if len(self.position) > self.length:
-            self.position.pop()
+        self.previous_tail = self._pop_tail() if releases_tail else None
+        self._push_head(new_head)
             
         return False
         
@@ -106,21 +149,7 @@ class Snake:
         """增加蛇的长度和分数"""
         self.length += 1
         self.combo_count += 1
-        
-        # 计算基础分数
-        score = SCORE_SYSTEM["base_score"]
-        
-        # 应用连击加成
-        for combo, multiplier in sorted(SCORE_SYSTEM["combo_multiplier"].items(), reverse=True):
-            if self.combo_count >= combo:
-                score *= multiplier
-                break
-                
-        # 应用难度加成
-        if self.difficulty in SCORE_SYSTEM["difficulty_bonus"]:
-            score *= SCORE_SYSTEM["difficulty_bonus"][self.difficulty]
-        
-        self.score += int(score)
+        self.score += food_score(self.combo_count, self.difficulty)
         
     def respawn(self):
         """重生处理"""
@@ -150,10 +179,7 @@ class Snake:
         if (new_direction[0] * -1, new_direction[1] * -1) != self.direction:
             self.direction = new_direction 
         
-    def should_move(self) -> bool:
-        """检查是否应该移动"""
-        self.move_counter += 1
-        if self.move_counter >= self.move_delay:
-            self.move_counter = 0
-            return True
-        return False 
\ No newline at end of file
+    @property
+    def step_interval(self) -> float:
+        """两次移动之间的模拟时间（秒）"""
+        return self.move_delay / SIMULATION["tick_rate"] 
\ No newline at end of file
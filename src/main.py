@@ -3,6 +3,7 @@
 """
 import os
 import sys
+import time
 import pygame
 
 # 添加项目根目录到 Python 路径
@@ -10,9 +11,10 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
-from src.config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.config import WINDOW_WIDTH, WINDOW_HEIGHT, SIMULATION, CONTROLS, PROFILER
 from src.ui.screens import GameScreen
 from src.ui.theme import ThemeManager
+from src.ui.profiler import Profiler
 
 class Game:
     def __init__(self):
@@ -22,19 +24,55 @@ class Game:
         self.clock = pygame.time.Clock()
         self.theme_manager = ThemeManager()
         self.game_screen = GameScreen(self.screen, self.theme_manager)
+        self.profiler = Profiler(PROFILER)
+        
+    def handle_profiler_key(self, event: pygame.event.Event) -> bool:
+        """处理分析器快捷键，返回事件是否已被处理"""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key in CONTROLS["PROFILER"]:
+            self.profiler.toggle_overlay()
+            self.game_screen.invalidate_frame()  # 隐藏浮层后需要整屏重绘
+            return True
+        if event.key in CONTROLS["PROFILER_EXPORT"]:
+            for path in self.profiler.export():
+                print(f"Profile saved to {path}")
+            return True
+        return False
         
     def run(self):
+        dt = 0.0  # 上一帧耗时（秒），驱动固定步长模拟
+        profiler = self.profiler
+        overlay_rect = None
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                self.game_screen.handle_event(event)
+            frame_start = time.perf_counter()
+            with profiler.section("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.game_screen.close()
+                        pygame.quit()
+                        sys.exit()
+                    if not self.handle_profiler_key(event):
+                        self.game_screen.handle_event(event)
             
-            self.game_screen.update()
-            self.game_screen.draw()
-            pygame.display.flip()
-            self.clock.tick(60)
+            with profiler.section("update"):
+                self.game_screen.update(dt)
+            with profiler.section("draw"):
+                dirty_rects = self.game_screen.draw()
+                previous_overlay = overlay_rect
+                overlay_rect = profiler.draw_overlay(self.screen)
+                if overlay_rect != previous_overlay:
+                    self.game_screen.invalidate_frame()  # 浮层尺寸变化，旧区域需要重绘
+            with profiler.section("present"):
+                if dirty_rects is None:
+                    pygame.display.flip()
+                else:
+                    if overlay_rect:
+                        dirty_rects.append(overlay_rect)
+                    pygame.display.update(dirty_rects)
+            with profiler.section("sleep"):
+                dt = self.clock.tick(SIMULATION["render_fps"]) / 1000.0
+            profiler.record("frame", (time.perf_counter() - frame_start) * 1000.0)
 
 if __name__ == "__main__":
     game = Game()
@@ -0,0 +1,109 @@
+"""
+后台持久化线程
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+class PersistenceWorker:
+    """写后落盘线程
+
+    游戏主循环只把数据快照交给后台线程写盘。每个文件只保留一个待写槽位，
+    新快照直接覆盖旧快照，所以一连串提交最终只写最后一份，内存中也只保留这一份；
+    每个文件先写临时文件再 rename，保证原子替换。
+    合并窗口从第一份待写快照开始计时，持续不断的提交也不会一直推迟写盘。
+    需要按顺序执行的写操作（如 SQLite 事务）以任务的形式提交，不参与合并。
+    """
+    def __init__(self, config):
+        self.config = config
+        self._condition = threading.Condition()
+        self._pending: Dict[str, Any] = {}  # 路径 -> 最新快照
+        self._first_pending = 0.0  # 第一份待写快照的提交时间
+        self._tasks: List[Callable[[], None]] = []
+        self._waiters: List[threading.Event] = []
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        
+    def submit(self, path: str, snapshot: Any):
+        """提交一份待保存的数据快照（调用方需保证快照之后不再被修改）"""
+        with self._condition:
+            if not self._pending:
+                self._first_pending = time.monotonic()
+            self._pending[path] = snapshot
+            self._condition.notify()
+            
+    def submit_task(self, task: Callable[[], None]):
+        """提交一个在后台线程按提交顺序执行的写操作"""
+        with self._condition:
+            self._tasks.append(task)
+            self._condition.notify()
+        
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """等待此前提交的所有快照与任务完成，超时（默认 flush_timeout）返回 False"""
+        timeout = self.config["flush_timeout"] if timeout is None else timeout
+        if not self._thread.is_alive():
+            print("Persistence worker is not running, pending saves are lost")
+            return False
+        done = threading.Event()
+        with self._condition:
+            self._waiters.append(done)
+            self._condition.notify()
+        if not done.wait(timeout):
+            print(f"Timed out after {timeout}s waiting for pending saves")
+            return False
+        return True
+        
+    def _run(self):
+        """后台线程主循环"""
+        while True:
+            with self._condition:
+                while not (self._pending or self._tasks or self._waiters):
+                    self._condition.wait()
+                # 只有快照时等到合并窗口结束；有任务或 flush 请求时立即处理
+                deadline = self._first_pending + self.config["coalesce_delay"]
+                while self._pending and not (self._tasks or self._waiters):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                pending, self._pending = self._pending, {}
+                tasks, self._tasks = self._tasks, []
+                waiters, self._waiters = self._waiters, []
+                
+            for path, snapshot in pending.items():
+                self.write_atomic(path, snapshot)
+            for task in tasks:
+                try:
+                    task()
+                except Exception as e:
+                    print(f"Error in persistence task: {e}")
+            for done in waiters:
+                done.set()
+                
+    @staticmethod
+    def write_atomic(path: str, snapshot: Any):
+        """以临时文件 + rename 的方式写入 JSON（bytes 快照按原样写入）"""
+        try:
+            directory = os.path.dirname(path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                if isinstance(snapshot, bytes):
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(snapshot)
+                        f.flush()
+                        os.fsync(f.fileno())
+                else:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        json.dump(snapshot, f, ensure_ascii=False, indent=2)
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (IOError, OSError, TypeError, ValueError):
+            print(f"Error saving {path}")
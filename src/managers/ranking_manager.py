@@ -1,111 +1,142 @@
 """
 排名管理器
 """
-import json
 import os
+import sys
 import time
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.config import PERSISTENCE
+from src.managers.persistence import PersistenceWorker
+from src.managers.ranking_store import RankingStore, create_ranking_store
+from src.engine.verification import verify_replay
 
 class RankingManager:
-    def __init__(self, config):
+    def __init__(self, config, persistence: PersistenceWorker = None, store: RankingStore = None):
         self.config = config
-        self.rankings = self.load_rankings()
+        # 写后落盘：JSON 后端只修改内存，快照交给持久化线程写入
+        self.persistence = persistence or PersistenceWorker(PERSISTENCE)
+        self.store = store or create_ranking_store(config, self.persistence)
+        self.last_expiry = float("-inf")
+        self.revision = 0  # 排行榜内容每次变化加一，供界面判断分数快照是否过时
+        self.verifier: Optional[ThreadPoolExecutor] = None  # 校验线程，首次提交录像时创建
+        self.pending_verifications: List[Tuple[Future, str]] = []  # (校验结果, 玩家名)
+        self.expire_records()
         
-    def load_rankings(self) -> Dict:
-        """加载排行榜数据"""
-        try:
-            if not os.path.exists(self.config["file_path"]):
-                return self.create_default_rankings()
-            
-            with open(self.config["file_path"], 'r', encoding='utf-8') as f:
-                rankings = json.load(f)
-                if not self.validate_rankings(rankings):
-                    return self.create_default_rankings()
-                self.clean_expired_records(rankings)
-                return rankings
-        except (json.JSONDecodeError, IOError):
-            return self.create_default_rankings()
-            
-    def create_default_rankings(self) -> Dict:
-        """创建默认排行榜结构"""
-        rankings = {}
-        for category in self.config["categories"]:
-            rankings[category] = {}
-            for difficulty in self.config["difficulty_names"]:
-                rankings[category][difficulty.name] = []
-        return rankings
-        
-    def clean_expired_records(self, rankings: Dict):
-        """清理过期记录"""
-        now = datetime.now()
-        for category, config in self.config["categories"].items():
-            if config["expire_hours"]:
-                expire_time = now - timedelta(hours=config["expire_hours"])
-                for difficulty in rankings[category]:
-                    rankings[category][difficulty] = [
-                        record for record in rankings[category][difficulty]
-                        if datetime.fromtimestamp(record["timestamp"]) > expire_time
-                    ]
-                    
     def add_score(self, difficulty: str, score: int, player_name: str = "玩家") -> Dict[str, Optional[int]]:
         """添加新分数，返回各个分类的排名"""
         now = time.time()
         rankings = {}
         
+        self.expire_records(now)
         for category in self.config["categories"]:
-            records = self.rankings[category][difficulty]
-            
-            # 添加新记录
-            records.append({
-                "name": player_name,
-                "score": score,
-                "timestamp": now
-            })
-            
-            # 按分数排序
-            records.sort(key=lambda x: x["score"], reverse=True)
-            
-            # 只保留前N名
-            records = records[:self.config["max_records"]]
-            
-            # 获取当前分数排名
-            for i, record in enumerate(records):
-                if record["timestamp"] == now:
-                    rankings[category] = i + 1
-                    break
-            else:
-                rankings[category] = None
-                
-            self.rankings[category][difficulty] = records
-            
+            rankings[category] = self.store.insert(category, difficulty, player_name, score, now)
+        self.revision += 1
         self.save_rankings()
         return rankings
         
+    def expire_cutoff(self, category: str, now: float) -> Optional[float]:
+        """该分类中不晚于此时间的记录已过期，不限时返回 None"""
+        expire_hours = self.config["categories"][category]["expire_hours"]
+        return now - expire_hours * 3600 if expire_hours else None
+        
+    def expire_records(self, now: float = None) -> int:
+        """清理各限时分类中已过期的记录，返回清理数量"""
+        now = time.time() if now is None else now
+        self.last_expiry = now
+        removed = 0
+        for category in self.config["categories"]:
+            cutoff = self.expire_cutoff(category, now)
+            if cutoff is None:
+                continue
+            for difficulty in self.config["difficulty_names"]:
+                removed += self.store.expire(category, difficulty.name, cutoff)
+        if removed:
+            self.revision += 1
+        return removed
+        
+    def expire_if_due(self, now: float = None) -> int:
+        """距上次清理超过 expire_interval 时清理过期记录（每帧调用）"""
+        now = time.time() if now is None else now
+        if now - self.last_expiry < self.config["expire_interval"]:
+            return 0
+        return self.expire_records(now)
+        
+    def rank_of(self, score: int, category: str, difficulty: str) -> Optional[int]:
+        """只读查询：该分数现在提交会得到的名次，不修改排行榜"""
+        return self.store.rank_of(category, difficulty, score)
+        
+    def top_scores(self, category: str, difficulty: str) -> List[int]:
+        """前 max_records 名的分数快照（从高到低），供游戏中预估名次"""
+        return [record["score"] for record in self.get_rankings(category, difficulty)]
+        
+    def project_rank(self, scores: List[int], score: int) -> Optional[int]:
+        """按分数快照计算名次，同分排在已有记录之后，与 rank_of 一致"""
+        rank = sum(1 for s in scores if s >= score) + 1
+        return rank if rank <= self.config["max_records"] else None
+        
+    def add_verified_score(self, replay_data: bytes,
+                           player_name: str = "玩家") -> Optional[Dict[str, Optional[int]]]:
+        """按录像重新模拟，分数复现后才记录；校验失败返回 None
+
+        在调用线程中同步模拟整局，只供服务端和离线工具使用；
+        界面中用 submit_verified_score，不阻塞主循环。
+        """
+        result = verify_replay(replay_data)
+        return self.add_verified_result(result, player_name)
+        
+    def add_verified_result(self, result: Dict, player_name: str) -> Optional[Dict[str, Optional[int]]]:
+        """按校验结果记录分数，未通过返回 None"""
+        if not result["accepted"]:
+            return None
+        return self.add_score(result["difficulty"], result["score"], player_name)
+        
+    def submit_verified_score(self, replay_data: bytes, player_name: str = "玩家") -> Future:
+        """在校验线程中重新模拟录像，结果由 poll_verified 在主线程记入排行榜"""
+        if self.verifier is None:
+            self.verifier = ThreadPoolExecutor(max_workers=1)
+        future = self.verifier.submit(verify_replay, replay_data)
+        self.pending_verifications.append((future, player_name))
+        return future
+        
+    def poll_verified(self) -> List[Tuple[Future, Optional[Dict[str, Optional[int]]]]]:
+        """记录已完成校验的分数（每帧调用），返回 (提交时的 Future, 各分类排名或 None)"""
+        if not self.pending_verifications:
+            return []
+        finished = []
+        pending = []
+        for future, player_name in self.pending_verifications:
+            if not future.done():
+                pending.append((future, player_name))
+                continue
+            try:
+                rankings = self.add_verified_result(future.result(), player_name)
+            except Exception as e:
+                print(f"Error verifying replay: {e}")
+                rankings = None
+            finished.append((future, rankings))
+        self.pending_verifications = pending
+        return finished
+            
     def save_rankings(self):
         """保存排行榜"""
-        try:
-            os.makedirs(os.path.dirname(self.config["file_path"]), exist_ok=True)
-            with open(self.config["file_path"], 'w', encoding='utf-8') as f:
-                json.dump(self.rankings, f, ensure_ascii=False, indent=2)
-        except IOError:
-            print("Error saving rankings")
+        self.store.save()
+        
+    def flush(self):
+        """等待排行榜写入磁盘（退出游戏时调用）"""
+        self.store.flush()
+        
+    def close(self):
+        """等待进行中的校验，写盘并关闭存储后端"""
+        if self.verifier is not None:
+            self.verifier.shutdown(wait=True)
+            self.poll_verified()
+        self.store.flush()
+        self.store.close()
             
     def get_rankings(self, category: str, difficulty: str) -> List[Dict]:
-        """获取指定类别和难度的排行榜"""
-        return self.rankings[category][difficulty] 
-
-    def validate_rankings(self, rankings: Dict) -> bool:
-        """验证排行榜数据格式"""
-        try:
-            for category in self.config["categories"]:
-                if category not in rankings:
-                    return False
-                for difficulty in self.config["difficulty_names"]:
-                    if difficulty.name not in rankings[category]:
-                        return False
-                    if not isinstance(rankings[category][difficulty.name], list):
-                        return False
-            return True
-        except Exception:
-            return False 
\ No newline at end of file
+        """获取指定类别和难度的排行榜（只读，过期记录由 expire_if_due 定期清理）"""
+        return self.store.top(category, difficulty, self.config["max_records"])
@@ -0,0 +1,412 @@
+"""
+排行榜存储后端
+"""
+import abc
+import bisect
+import heapq
+import json
+import os
+import sqlite3
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.managers.persistence import PersistenceWorker
+
+class RankingStore(abc.ABC):
+    """排行榜存储接口：按 (分类, 难度) 分组，分数从高到低、同分先到者在前
+
+    各后端的名次语义一致：只报告前 max_records 名，之后的名次返回 None。
+    """
+    @abc.abstractmethod
+    def insert(self, category: str, difficulty: str, name: str, score: int,
+               timestamp: float) -> Optional[int]:
+        """插入一条记录，返回其排名（未进入前 max_records 名时返回 None）"""
+        
+    @abc.abstractmethod
+    def expire(self, category: str, difficulty: str, cutoff: float) -> int:
+        """删除时间不晚于 cutoff 的记录，返回删除数量"""
+        
+    @abc.abstractmethod
+    def rank_of(self, category: str, difficulty: str, score: int) -> Optional[int]:
+        """该分数现在提交会得到的名次（不插入），未进入前 max_records 名时返回 None"""
+        
+    @abc.abstractmethod
+    def top(self, category: str, difficulty: str, limit: int) -> List[Dict]:
+        """前 limit 名记录"""
+        
+    def save(self):
+        """一次提交结束后调用"""
+        pass
+        
+    def flush(self):
+        """等待数据写入磁盘"""
+        pass
+        
+    def close(self):
+        pass
+
+class RankingBucket:
+    """一个 (分类, 难度) 分组：按排名有序的记录，限时分类另有按时间排序的过期堆
+
+    被挤出保留范围的记录不会立即从过期堆中删除，过期时跳过；
+    堆中的条目超过保留记录数的两倍时整体压缩一次。
+    """
+    def __init__(self, max_records: Optional[int] = None, expires: bool = False):
+        self.max_records = max_records  # None 表示保留全部记录
+        self.expires = expires
+        self.records: List[Dict] = []
+        self.keys: List[Tuple[int, float]] = []  # (-score, timestamp)，与 records 一一对应
+        self.expiry: List[Tuple[float, int, Dict]] = []  # (timestamp, 序号, 记录) 最小堆
+        self._serial = 0
+        
+    def insert(self, record: Dict) -> Optional[int]:
+        """按排名插入，返回名次；超出保留范围时不插入并返回 None"""
+        key = (-record["score"], record["timestamp"])
+        index = bisect.bisect_right(self.keys, key)
+        if self.max_records is not None and index >= self.max_records:
+            return None
+        self.keys.insert(index, key)
+        self.records.insert(index, record)
+        if self.max_records is not None and len(self.records) > self.max_records:
+            del self.keys[self.max_records:]
+            del self.records[self.max_records:]
+        if self.expires:
+            heapq.heappush(self.expiry, (record["timestamp"], self._serial, record))
+            self._serial += 1
+            if self.max_records is not None and len(self.expiry) > 2 * self.max_records:
+                self.compact_expiry()
+        return index + 1
+        
+    def compact_expiry(self):
+        """从过期堆中去掉已被挤出保留范围的记录"""
+        alive = {id(record) for record in self.records}
+        self.expiry = [entry for entry in self.expiry if id(entry[2]) in alive]
+        heapq.heapify(self.expiry)
+        
+    def rank_of(self, score: int) -> Optional[int]:
+        """二分查找名次，同分排在已有记录之后，与 insert 一致"""
+        index = bisect.bisect_right(self.keys, (-score, float("inf")))
+        if self.max_records is not None and index >= self.max_records:
+            return None
+        return index + 1
+        
+    def expire(self, cutoff: float) -> int:
+        """移除时间不晚于 cutoff 的记录，只处理堆顶，返回移除数量"""
+        removed = 0
+        while self.expiry and self.expiry[0][0] <= cutoff:
+            _, _, record = heapq.heappop(self.expiry)
+            key = (-record["score"], record["timestamp"])
+            index = bisect.bisect_left(self.keys, key)
+            while index < len(self.keys) and self.keys[index] == key and self.records[index] is not record:
+                index += 1
+            if index == len(self.keys) or self.records[index] is not record:
+                continue  # 已被挤出保留范围
+            del self.keys[index]
+            del self.records[index]
+            removed += 1
+        return removed
+
+class JsonRankingStore(RankingStore):
+    """整份 JSON 文档
+
+    全部记录常驻内存；总榜每组只保留前 max_records 名，限时分类保留窗口内的前
+    window_records 名，这样旧记录过期后后面的名次能补上来，而文件大小与每次保存的
+    快照成本都有上限。
+    """
+    def __init__(self, config, persistence: PersistenceWorker):
+        self.config = config
+        self.persistence = persistence
+        self.buckets: Dict[str, Dict[str, RankingBucket]] = self.create_buckets()
+        self.load_rankings()
+        
+    def create_buckets(self) -> Dict[str, Dict[str, RankingBucket]]:
+        """按配置创建空分组"""
+        buckets = {}
+        for category, config in self.config["categories"].items():
+            expires = bool(config["expire_hours"])
+            buckets[category] = {
+                difficulty.name: RankingBucket(
+                    self.config["window_records"] if expires else self.config["max_records"], expires
+                )
+                for difficulty in self.config["difficulty_names"]
+            }
+        return buckets
+        
+    def load_rankings(self):
+        """加载排行榜数据，缺少的分类与难度保持为空，格式不对的记录跳过"""
+        try:
+            if not os.path.exists(self.config["file_path"]):
+                return
+            with open(self.config["file_path"], 'r', encoding='utf-8') as f:
+                rankings = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+        if not isinstance(rankings, dict):
+            return
+            
+        for category, by_difficulty in self.buckets.items():
+            saved = rankings.get(category)
+            if not isinstance(saved, dict):
+                continue
+            for difficulty, bucket in by_difficulty.items():
+                records = saved.get(difficulty)
+                if not isinstance(records, list):
+                    continue
+                for record in records:
+                    if self.validate_record(record):
+                        bucket.insert(record)
+                        
+    @staticmethod
+    def validate_record(record) -> bool:
+        """验证单条记录格式"""
+        return (
+            isinstance(record, dict)
+            and isinstance(record.get("name"), str)
+            and isinstance(record.get("score"), (int, float))
+            and isinstance(record.get("timestamp"), (int, float))
+        )
+        
+    def insert(self, category: str, difficulty: str, name: str, score: int,
+               timestamp: float) -> Optional[int]:
+        return self.visible_rank(self.buckets[category][difficulty].insert({
+            "name": name,
+            "score": score,
+            "timestamp": timestamp
+        }))
+        
+    def expire(self, category: str, difficulty: str, cutoff: float) -> int:
+        return self.buckets[category][difficulty].expire(cutoff)
+        
+    def rank_of(self, category: str, difficulty: str, score: int) -> Optional[int]:
+        return self.visible_rank(self.buckets[category][difficulty].rank_of(score))
+        
+    def visible_rank(self, rank: Optional[int]) -> Optional[int]:
+        """限时分类保留的记录多于显示的名次，只报告前 max_records 名"""
+        if rank is None or rank > self.config["max_records"]:
+            return None
+        return rank
+        
+    def top(self, category: str, difficulty: str, limit: int) -> List[Dict]:
+        return self.buckets[category][difficulty].records[:limit]
+        
+    def save(self):
+        """保存排行榜（异步写盘）
+
+        记录插入后不再修改，快照只需复制列表。
+        """
+        snapshot = {
+            category: {
+                difficulty: list(bucket.records)
+                for difficulty, bucket in by_difficulty.items()
+            }
+            for category, by_difficulty in self.buckets.items()
+        }
+        self.persistence.submit(self.config["file_path"], snapshot)
+        
+    def flush(self):
+        self.persistence.flush()
+
+class SqliteRankingStore(RankingStore):
+    """SQLite 排行榜，保留全部记录
+
+    数据库连接只在持久化线程中使用：插入与过期作为有序任务提交，游戏线程从不等待磁盘。
+    每组的前 max_records 名在内存中另存一份 RankingBucket，名次与前 N 名都直接读内存。
+    过期把内存中的记录移走后，由持久化线程按截止时间从 (score DESC, timestamp) 索引
+    重新读出前 max_records 名，下一次读取时与之后的插入合并，补上空出的名次。
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS records (
+            id INTEGER PRIMARY KEY,
+            category TEXT NOT NULL,
+            difficulty TEXT NOT NULL,
+            name TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            timestamp REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS records_rank
+            ON records (category, difficulty, score DESC, timestamp);
+        CREATE INDEX IF NOT EXISTS records_time
+            ON records (category, difficulty, timestamp);
+    """
+    
+    def __init__(self, config, persistence: PersistenceWorker):
+        self.config = config
+        self.persistence = persistence
+        self.connection: Optional[sqlite3.Connection] = None  # 只在持久化线程中创建与使用
+        self.buckets: Dict[str, Dict[str, RankingBucket]] = {
+            category: {
+                difficulty.name: RankingBucket(config["max_records"], bool(category_config["expire_hours"]))
+                for difficulty in config["difficulty_names"]
+            }
+            for category, category_config in config["categories"].items()
+        }
+        self._lock = threading.Lock()
+        self._rows: List[tuple] = []  # 待写入的 (序号, category, difficulty, name, score, timestamp)
+        self._serial = 0  # 已提交的插入数
+        self._written_serial = 0  # 持久化线程已写入的插入数
+        self._recent: List[Tuple[int, str, str, Dict]] = []  # 补位结果返回前需要重新合并的插入
+        self._requested: Dict[Tuple[str, str], int] = {}  # 尚未合并的补位请求 -> 请求时的插入数
+        self._refills: Dict[Tuple[str, str], Tuple[int, List[Dict]]] = {}  # 持久化线程读出的补位结果
+        self._cutoffs: Dict[Tuple[str, str], float] = {}
+        # 启动时在持久化线程中建表、导入旧数据并读出各组前 N 名
+        self.persistence.submit_task(self.open)
+        self.persistence.flush()
+        self.apply_refills()
+        
+    def open(self):
+        """持久化线程：打开数据库并读出各组的前 max_records 名"""
+        path = self.config["sqlite_path"]
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(self.SCHEMA)
+        if self.is_empty() and os.path.exists(self.config["file_path"]):
+            self.import_json(self.config["file_path"])
+        for category, by_difficulty in self.buckets.items():
+            for difficulty in by_difficulty:
+                self._refills[(category, difficulty)] = (0, self.read_top(category, difficulty, None))
+                
+    def is_empty(self) -> bool:
+        return self.connection.execute("SELECT 1 FROM records LIMIT 1").fetchone() is None
+        
+    def import_json(self, path: str):
+        """首次使用时导入旧的 JSON 排行榜"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                rankings = json.load(f)
+            self.insert_many(
+                (category, difficulty, record["name"], record["score"], record["timestamp"])
+                for category, by_difficulty in rankings.items()
+                if category in self.config["categories"]
+                for difficulty, records in by_difficulty.items()
+                for record in records
+            )
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, AttributeError):
+            print(f"Error importing {path}")
+            
+    def insert_many(self, rows: Iterable[tuple]):
+        """持久化线程：在一个事务中批量插入 (category, difficulty, name, score, timestamp)"""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO records (category, difficulty, name, score, timestamp) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            
+    def read_top(self, category: str, difficulty: str, cutoff: Optional[float]) -> List[Dict]:
+        """持久化线程：沿索引读出晚于 cutoff 的前 max_records 名"""
+        query = "SELECT name, score, timestamp FROM records WHERE category = ? AND difficulty = ? "
+        params: list = [category, difficulty]
+        if cutoff is not None:
+            query += "AND timestamp > ? "
+            params.append(cutoff)
+        query += "ORDER BY score DESC, timestamp LIMIT ?"
+        params.append(self.config["max_records"])
+        return [
+            {"name": name, "score": score, "timestamp": timestamp}
+            for name, score, timestamp in self.connection.execute(query, params)
+        ]
+        
+    def write_pending(self):
+        """持久化线程：把积攒的插入写入一个事务"""
+        with self._lock:
+            rows, self._rows = self._rows, []
+        if not rows:
+            return
+        self.insert_many(row[1:] for row in rows)
+        self._written_serial = rows[-1][0]
+        
+    def refill(self, category: str, difficulty: str, cutoff: float):
+        """持久化线程：删除过期记录并读出补位用的前 max_records 名"""
+        self.write_pending()
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM records WHERE category = ? AND difficulty = ? AND timestamp <= ?",
+                (category, difficulty, cutoff)
+            )
+        rows = self.read_top(category, difficulty, cutoff)
+        with self._lock:
+            self._refills[(category, difficulty)] = (self._written_serial, rows)
+            
+    def apply_refills(self):
+        """把持久化线程读出的补位结果合并进内存中的前 N 名"""
+        if not self._refills:
+            return
+        with self._lock:
+            refills, self._refills = self._refills, {}
+        for (category, difficulty), (serial, rows) in refills.items():
+            old = self.buckets[category][difficulty]
+            bucket = RankingBucket(old.max_records, old.expires)
+            for record in rows:
+                bucket.insert(record)
+            # 补位结果读出之后的插入还没有写进数据库，重新合并
+            for recent_serial, recent_category, recent_difficulty, record in self._recent:
+                if recent_serial > serial and (recent_category, recent_difficulty) == (category, difficulty):
+                    bucket.insert(record)
+            cutoff = self._cutoffs.get((category, difficulty))
+            if cutoff is not None:
+                bucket.expire(cutoff)
+            self.buckets[category][difficulty] = bucket
+            if self._requested.get((category, difficulty), -1) <= serial:
+                self._requested.pop((category, difficulty), None)
+        if not self._requested:
+            self._recent.clear()
+        else:
+            oldest = min(self._requested.values())
+            self._recent = [entry for entry in self._recent if entry[0] > oldest]
+            
+    def insert(self, category: str, difficulty: str, name: str, score: int,
+               timestamp: float) -> Optional[int]:
+        self.apply_refills()
+        record = {"name": name, "score": score, "timestamp": timestamp}
+        rank = self.buckets[category][difficulty].insert(record)
+        self._serial += 1
+        if self._requested:
+            self._recent.append((self._serial, category, difficulty, record))
+        with self._lock:
+            first = not self._rows
+            self._rows.append((self._serial, category, difficulty, name, score, timestamp))
+        if first:
+            self.persistence.submit_task(self.write_pending)
+        return rank
+        
+    def rank_of(self, category: str, difficulty: str, score: int) -> Optional[int]:
+        self.apply_refills()
+        return self.buckets[category][difficulty].rank_of(score)
+        
+    def expire(self, category: str, difficulty: str, cutoff: float) -> int:
+        """从内存中的前 N 名移除过期记录；有记录移走时交给持久化线程删除并补位"""
+        self.apply_refills()
+        self._cutoffs[(category, difficulty)] = cutoff
+        removed = self.buckets[category][difficulty].expire(cutoff)
+        if removed:
+            self._requested[(category, difficulty)] = self._serial
+            self.persistence.submit_task(lambda: self.refill(category, difficulty, cutoff))
+        return removed
+        
+    def top(self, category: str, difficulty: str, limit: int) -> List[Dict]:
+        self.apply_refills()
+        return self.buckets[category][difficulty].records[:limit]
+        
+    def flush(self):
+        self.persistence.flush()
+        
+    def close(self):
+        def close_connection():
+            if self.connection is not None:
+                self.write_pending()
+                self.connection.close()
+        self.persistence.submit_task(close_connection)
+        self.persistence.flush()
+
+def create_ranking_store(config, persistence: PersistenceWorker) -> RankingStore:
+    """按 config["backend"] 创建存储后端"""
+    backend = config.get("backend", "json")
+    if backend == "json":
+        return JsonRankingStore(config, persistence)
+    if backend == "sqlite":
+        return SqliteRankingStore(config, persistence)
+    raise ValueError(f"unknown ranking backend: {backend}")
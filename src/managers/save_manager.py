@@ -1,16 +1,25 @@
 """
 存档管理器
 """
+import copy
 import json
 import os
+import sys
 import time
 from typing import Dict, Any
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.config import PERSISTENCE
+from src.managers.persistence import PersistenceWorker
+
 class SaveManager:
-    def __init__(self, config):
+    def __init__(self, config, persistence: PersistenceWorker = None):
         self.config = config
         self.data = self.load_save()
         self.last_save_time = time.time()
+        # 存档写盘交给持久化线程，主循环不等待文件 I/O
+        self.persistence = persistence or PersistenceWorker(PERSISTENCE)
         
     def load_save(self) -> Dict[str, Any]:
         """加载存档"""
@@ -38,13 +47,16 @@ class SaveManager:
         current_time = time.time()
         if (force or self.config["auto_save"] and 
             current_time - self.last_save_time >= self.config["save_interval"]):
-            os.makedirs(os.path.dirname(self.config["file_path"]), exist_ok=True)
-            with open(self.config["file_path"], 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            self.persistence.submit(self.config["file_path"], copy.deepcopy(self.data))
             self.last_save_time = current_time
             
     def update_save(self, key: str, value: Any):
         """更新存档数据"""
         self.data[key] = value
         if self.config["auto_save"]:
-            self.save_game() 
\ No newline at end of file
+            self.save_game()
+            
+    def flush(self):
+        """强制保存并等待写入磁盘（退出游戏时调用）"""
+        self.save_game(force=True)
+        self.persistence.flush() 
\ No newline at end of file
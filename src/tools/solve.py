@@ -0,0 +1,67 @@
+"""
+满盘求解：用 Hamiltonian 环路求解器把棋盘走满，用于压测满盘残局
+
+用法：
+    python src/tools/solve.py --games 3
+    python src/tools/solve.py --difficulty INFINITE --seed 7 --replay save/solved.replay
+"""
+import argparse
+import random
+import time
+import sys
+import os
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import Difficulty
+from src.engine.game import GameEngine
+from src.engine.registry import POLICIES, make_policy
+from src.engine.replay import Replay
+
+def solve(difficulty: Difficulty, seed: int, policy_name: str = "hamiltonian",
+          max_ticks: int = 5000000) -> Dict:
+    """用策略玩完一局，返回步数、耗时与食物区域的填充率"""
+    engine = GameEngine(difficulty, seed=seed)
+    policy = make_policy(policy_name, random.Random(f"{policy_name}:{seed}"))
+    start = time.perf_counter()
+    policy.reset(engine)
+    while not engine.game_over and engine.tick < max_ticks:
+        engine.step(policy.act(engine))
+    seconds = time.perf_counter() - start
+
+    board = engine.board
+    filled = sum(1 for cell in engine.snake.position if board.in_food_area(cell))
+    return {
+        "engine": engine,
+        "seed": seed,
+        "ticks": engine.tick,
+        "length": len(engine.snake.position),
+        "score": engine.snake.score,
+        "fill": filled / board.food_cell_count,
+        "seconds": seconds,
+        "end_reason": engine.end_reason or "max_ticks"
+    }
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Play games to a full board with the cycle solver")
+    parser.add_argument("--difficulty", default=Difficulty.INFINITE.name, choices=[d.name for d in Difficulty])
+    parser.add_argument("--policy", default="hamiltonian", choices=sorted(POLICIES))
+    parser.add_argument("--games", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--max-ticks", type=int, default=5000000)
+    parser.add_argument("--replay", help="save the replay of the last game to this path")
+    args = parser.parse_args(argv)
+
+    result = None
+    for seed in range(args.seed, args.seed + args.games):
+        result = solve(Difficulty[args.difficulty], seed, args.policy, args.max_ticks)
+        print(f"seed {seed:<6} {result['end_reason']:<11} fill {result['fill']:7.2%}  "
+              f"length {result['length']:>5}  ticks {result['ticks']:>8}  "
+              f"{result['seconds']:.2f}s ({result['ticks'] / max(result['seconds'], 1e-9):,.0f} ticks/s)")
+    if args.replay and result is not None:
+        Replay.from_engine(result["engine"]).save(args.replay)
+        print(f"Replay saved to {args.replay}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+策略锦标赛：多进程批量运行带种子的无界面对局
+
+用法：
+    python src/tools/tournament.py --policies random greedy --games 1000
+"""
+import argparse
+import csv
+import json
+import random
+import statistics
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import Difficulty
+from src.engine.game import GameEngine
+from src.engine.registry import POLICIES, make_policy
+
+RESULT_FIELDS = [
+    "policy", "difficulty", "seed", "score", "length",
+    "ticks", "survival_time", "combo_peak", "end_reason"
+]
+
+def play_game(policy_name: str, difficulty: Difficulty, seed: int, max_steps: int) -> Dict:
+    """用指定策略完整地玩一局，返回结果行"""
+    engine = GameEngine(difficulty, seed=seed)
+    # 策略的随机源与对局种子分开，不影响食物与重生位置
+    policy = make_policy(policy_name, random.Random(f"{policy_name}:{seed}"))
+    policy.reset(engine)
+    combo_peak = 0
+    while not engine.game_over and engine.tick < max_steps:
+        engine.step(policy.act(engine))
+        combo_peak = max(combo_peak, engine.snake.combo_count)
+    return {
+        "policy": policy_name,
+        "difficulty": difficulty.name,
+        "seed": seed,
+        "score": engine.snake.score,
+        "length": engine.snake.length,
+        "ticks": engine.tick,
+        "survival_time": round(engine.elapsed, 3),
+        "combo_peak": combo_peak,
+        "end_reason": engine.end_reason or "max_steps"
+    }
+
+def play_chunk(policy_name: str, difficulty_name: str, seeds: List[int], max_steps: int) -> List[Dict]:
+    """工作进程入口：一次处理一批种子，减少进程间通信"""
+    difficulty = Difficulty[difficulty_name]
+    return [play_game(policy_name, difficulty, seed, max_steps) for seed in seeds]
+
+def summarize(rows: List[Dict]) -> Dict:
+    """按 策略/难度 汇总，没有对局的分组只报告 games = 0"""
+    if not rows:
+        return {
+            "games": 0, "score_mean": None, "score_median": None, "score_max": None,
+            "length_mean": None, "survival_mean": None, "combo_peak_max": None, "end_reasons": {}
+        }
+    scores = [row["score"] for row in rows]
+    return {
+        "games": len(rows),
+        "score_mean": round(statistics.mean(scores), 2),
+        "score_median": statistics.median(scores),
+        "score_max": max(scores),
+        "length_mean": round(statistics.mean(row["length"] for row in rows), 2),
+        "survival_mean": round(statistics.mean(row["survival_time"] for row in rows), 3),
+        "combo_peak_max": max(row["combo_peak"] for row in rows),
+        "end_reasons": {
+            reason: sum(1 for row in rows if row["end_reason"] == reason)
+            for reason in sorted({row["end_reason"] for row in rows})
+        }
+    }
+
+def run_tournament(policies: List[str], difficulties: List[Difficulty], games: int,
+                   seed: int, output: str, workers: int = None, chunk_size: int = 50,
+                   max_steps: int = 100000) -> Dict:
+    """运行锦标赛：结果逐批写入 CSV，结束后写出汇总 JSON 并返回汇总"""
+    # 所有策略使用同一组种子，保证对比公平
+    seeds = list(range(seed, seed + games))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, games, chunk_size)]
+    grouped: Dict[str, Dict[str, List[Dict]]] = {
+        name: {difficulty.name: [] for difficulty in difficulties} for name in policies
+    }
+    
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", newline="", encoding="utf-8") as f, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        futures = [
+            executor.submit(play_chunk, name, difficulty.name, chunk, max_steps)
+            for name in policies
+            for difficulty in difficulties
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            rows = future.result()
+            writer.writerows(rows)
+            f.flush()
+            for row in rows:
+                grouped[row["policy"]][row["difficulty"]].append(row)
+                
+    summary = {
+        name: {difficulty: summarize(rows) for difficulty, rows in by_difficulty.items()}
+        for name, by_difficulty in grouped.items()
+    }
+    with open(os.path.splitext(output)[0] + ".summary.json", "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Run seeded headless games for autopilot policies")
+    parser.add_argument("--policies", nargs="+", default=sorted(POLICIES), choices=sorted(POLICIES))
+    parser.add_argument("--difficulties", nargs="+", default=[d.name for d in Difficulty],
+                        choices=[d.name for d in Difficulty])
+    parser.add_argument("--games", type=int, default=1000, help="games per policy and difficulty")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=50, help="games per task")
+    parser.add_argument("--max-steps", type=int, default=100000, help="step cap for games without a time limit")
+    parser.add_argument("--output", default="tournament/results.csv")
+    args = parser.parse_args(argv)
+    
+    summary = run_tournament(
+        args.policies, [Difficulty[name] for name in args.difficulties], args.games,
+        args.seed, args.output, args.workers, args.chunk_size, args.max_steps
+    )
+    print(f"{'policy':<12}{'difficulty':<12}{'games':>7}{'mean':>9}{'median':>9}{'max':>7}")
+    for name, by_difficulty in summary.items():
+        for difficulty, stats in by_difficulty.items():
+            mean, median, best = (
+                "-" if stats[key] is None else stats[key]
+                for key in ("score_mean", "score_median", "score_max")
+            )
+            print(f"{name:<12}{difficulty:<12}{stats['games']:>7}{mean:>9}{median:>9}{best:>7}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+批量校验排行榜录像
+
+用法：
+    python src/tools/verify_submissions.py submissions/ --output results.jsonl
+"""
+import argparse
+import json
+import sys
+import os
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.rules import VERIFICATION
+from src.engine.verification import VerificationService
+
+def collect_paths(paths: List[str]) -> List[str]:
+    """展开目录中的 .replay 文件"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.endswith(".replay")
+            )
+        else:
+            files.append(path)
+    return files
+
+def read_file(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read(VERIFICATION["max_replay_bytes"] + 1)  # 超出上限的部分不必读取
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Verify leaderboard replays by re-simulating them")
+    parser.add_argument("paths", nargs="+", help="replay files or directories")
+    parser.add_argument("--workers", type=int, default=VERIFICATION["workers"])
+    parser.add_argument("--output", help="write one JSON result per line")
+    args = parser.parse_args(argv)
+    
+    config = dict(VERIFICATION, workers=args.workers)
+    files = collect_paths(args.paths)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    counts = {}
+    try:
+        with VerificationService(config) as service:
+            for path, result in zip(files, service.verify_all(read_file(path) for path in files)):
+                counts[result["status"]] = counts.get(result["status"], 0) + 1
+                out.write(json.dumps(dict(result, path=path)) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(", ".join(f"{status}: {count}" for status, count in sorted(counts.items())), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+整盘光栅化的蛇身渲染器
+"""
+from typing import Iterable, Tuple
+import sys
+import os
+import numpy as np
+import pygame
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.board import Board
+from src.config import VISUAL_EFFECTS
+
+class SurfarrayBoardRenderer:
+    """把整块棋盘的蛇身画在一张透明色键图层上
+
+    cells 为 (列, 行, 3) 的格子颜色数组，未占用的格子为色键颜色。
+    每帧只按蛇身变化的格子增量改写图层像素，绘制时无论蛇身多长都只需 blit 一次。
+    图块形状取自精灵图集的蛇身图块，与逐节 blit 的结果逐像素一致（不做插值）。
+    """
+    COLORKEY = (255, 0, 255)  # 与图层缓存的透明色一致
+    REBUILD_RATIO = 4  # 变化格子超过蛇身的 1/4 时整盘重建
+
+    def __init__(self, board: Board, tile: pygame.Surface):
+        self.board = board
+        self.cell_size = board.cell_size
+        self.palette = np.array(VISUAL_EFFECTS["snake_gradient"], dtype=np.uint8)
+        self.key = np.array(self.COLORKEY, dtype=np.uint8)
+        self.cells = np.empty((board.cols, board.rows, 3), dtype=np.uint8)
+        self.cells[:] = self.key
+
+        # 单格掩码：图块不透明的像素，其余（间隙与圆角）保持透明
+        alpha = pygame.surfarray.array_alpha(tile) > 0
+        self.cell_mask = np.zeros((self.cell_size, self.cell_size), dtype=bool)
+        self.cell_mask[:alpha.shape[0], :alpha.shape[1]] = alpha[:self.cell_size, :self.cell_size]
+        # 整盘平铺的掩码，整盘重建时使用
+        self.mask = np.tile(self.cell_mask, (board.cols, board.rows))
+
+        self.surface = pygame.Surface((board.cols * self.cell_size, board.rows * self.cell_size))
+        if pygame.display.get_surface():
+            self.surface = self.surface.convert()
+        self.surface.set_colorkey(self.COLORKEY)
+        self.surface.fill(self.COLORKEY)
+        self.snake = None
+
+    def update(self, snake, dirty_cells: Iterable[Tuple[int, int]]):
+        """同步蛇身变化；换了一条蛇或变化过多时整盘重建"""
+        if snake is not self.snake:
+            self.rebuild(snake)
+            return
+        dirty_cells = list(dirty_cells)
+        if not dirty_cells:
+            return
+        if len(dirty_cells) * self.REBUILD_RATIO > max(len(snake.position), self.board.cols):
+            self.rebuild(snake)
+            return
+
+        size = self.cell_size
+        cols = np.array([x // size for x, _ in dirty_cells])
+        rows = np.array([y // size for _, y in dirty_cells])
+        serials = [snake.segment_serial(cell) for cell in dirty_cells]
+        occupied = np.array([serial is not None for serial in serials])
+        colors = np.empty((len(dirty_cells), 3), dtype=np.uint8)
+        colors[:] = self.key
+        if occupied.any():
+            indices = np.array([serial for serial in serials if serial is not None])
+            colors[occupied] = self.palette[indices % len(self.palette)]
+        self.cells[cols, rows] = colors
+
+        # 按格子切分图层像素：(列, 格内x, 行, 格内y, 通道)，一次写入全部变化的格子
+        blocks = np.where(self.cell_mask[None, :, :, None], colors[:, None, None, :], self.key)
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        view = pixels.reshape(self.board.cols, size, self.board.rows, size, 3)
+        in_place = np.shares_memory(view, pixels)
+        if in_place:
+            view[cols, :, rows] = blocks
+        del view, pixels  # 释放图层锁
+        if not in_place:
+            # 像素格式无法原地切分时整张重新上传
+            self.blit_cells()
+
+    def rebuild(self, snake):
+        """按蛇身重新计算格子颜色，并放大成整张图层"""
+        self.snake = snake
+        self.cells[:] = self.key
+        body = snake.position
+        if body:
+            size = self.cell_size
+            cells = np.array(body, dtype=np.int64) // size
+            serials = snake.head_serial - np.arange(len(body))
+            self.cells[cells[:, 0], cells[:, 1]] = self.palette[serials % len(self.palette)]
+        self.blit_cells()
+
+    def blit_cells(self):
+        """把格子颜色放大到像素并整张写入图层"""
+        pixels = np.repeat(np.repeat(self.cells, self.cell_size, axis=0), self.cell_size, axis=1)
+        pixels[~self.mask] = self.key
+        pygame.surfarray.blit_array(self.surface, pixels)
+
+    def draw(self, screen: pygame.Surface):
+        """一次 blit 整盘蛇身（受 screen 的裁剪区域限制）"""
+        screen.blit(self.surface, (0, 0))
@@ -17,8 +17,9 @@ class Button:
         self.action = action
         self.is_hovered = False
         
-        # 创建字体
+        # 创建字体，按钮文字固定不变，只渲染一次
         self.font = pygame.font.SysFont('microsoftyaheimicrosoftyaheiui', 32)
+        self.text_surface = self.font.render(self.text, True, (255, 255, 255))
         
     def draw(self, screen: pygame.Surface):
         """绘制按钮"""
@@ -26,9 +27,8 @@ class Button:
         pygame.draw.rect(screen, self.current_color, self.rect, border_radius=15)
         
         # 绘制按钮文本
-        text_surface = self.font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        text_rect = self.text_surface.get_rect(center=self.rect.center)
+        screen.blit(self.text_surface, text_rect)
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         """处理按钮事件"""
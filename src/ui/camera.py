@@ -0,0 +1,60 @@
+"""
+大棋盘镜头
+"""
+from typing import Tuple
+import sys
+import os
+import pygame
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.board import Board
+
+class Camera:
+    """把棋盘的一部分（视口）映射到屏幕上
+
+    offset 为视口左上角的棋盘像素坐标，屏幕坐标 = 棋盘坐标 - offset + viewport.topleft。
+    镜头以目标为中心，并限制在棋盘范围内；棋盘比视口小的方向上居中显示。
+    """
+    def __init__(self, board: Board, viewport: pygame.Rect):
+        self.board = board
+        self.viewport = pygame.Rect(viewport)
+        self.offset = (0, 0)
+
+    @staticmethod
+    def _clamp(center: float, view: int, size: int) -> int:
+        if size <= view:
+            return (size - view) // 2
+        return int(min(max(center - view / 2, 0), size - view))
+
+    def follow(self, target: Tuple[float, float]):
+        """以格子 target（左上角坐标）的中心为镜头中心"""
+        half = self.board.cell_size / 2
+        self.offset = (
+            self._clamp(target[0] + half, self.viewport.width, self.board.width),
+            self._clamp(target[1] + half, self.viewport.height, self.board.height)
+        )
+
+    def to_screen(self, position: Tuple[float, float]) -> Tuple[int, int]:
+        """棋盘坐标转屏幕坐标"""
+        return (
+            int(position[0]) - self.offset[0] + self.viewport.left,
+            int(position[1]) - self.offset[1] + self.viewport.top
+        )
+
+    def visible_bounds(self, margin: int = 0) -> Tuple[int, int, int, int]:
+        """视口覆盖的棋盘像素范围 (left, top, right, bottom)，按格子对齐并向外扩展 margin 格"""
+        size = self.board.cell_size
+        left = self.offset[0] - self.offset[0] % size - margin * size
+        top = self.offset[1] - self.offset[1] % size - margin * size
+        right = self.offset[0] + self.viewport.width + margin * size
+        bottom = self.offset[1] + self.viewport.height + margin * size
+        return (max(left, 0), max(top, 0), min(right, self.board.width), min(bottom, self.board.height))
+
+    def view_rect(self) -> pygame.Rect:
+        """视口覆盖的棋盘像素范围"""
+        return pygame.Rect(self.offset, self.viewport.size)
+        
+    def board_rect(self) -> pygame.Rect:
+        """整个棋盘在屏幕上的位置（用于绘制墙壁）"""
+        return pygame.Rect(self.to_screen((0, 0)), (self.board.width, self.board.height))
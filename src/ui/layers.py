@@ -0,0 +1,28 @@
+"""
+静态图层缓存
+"""
+from typing import Callable, Dict, Hashable
+import pygame
+
+class LayerCache:
+    """按键缓存预先合成的静态图层（边框、网格、遮罩等）
+
+    图层只在第一次使用时绘制，之后每帧直接 blit。
+    图层内容依赖主题颜色，切换主题时需要调用 clear。
+    """
+    def __init__(self):
+        self._layers: Dict[Hashable, pygame.Surface] = {}
+        
+    def get(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """获取图层，不存在时调用 build 生成"""
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = self._layers[key] = build()
+        return layer
+        
+    def clear(self):
+        """清空全部图层（切换主题时调用）"""
+        self._layers.clear()
+        
+    def __len__(self) -> int:
+        return len(self._layers)
@@ -0,0 +1,122 @@
+"""
+大棋盘小地图
+"""
+from typing import Iterable, Optional, Set, Tuple
+import sys
+import os
+import numpy as np
+import pygame
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.engine.board import Board
+
+class Minimap:
+    """按块降采样的棋盘占用图
+
+    棋盘每 block x block 个格子对应小地图的一个像素，像素值取块内的最大值
+    （空 0、蛇身 1、食物 2），即占用网格的最大池化。
+    两次刷新之间只记录蛇身变化的格子，刷新时只重新计算这些格子所在的块；
+    换了一条蛇或切换主题时才整张重建。
+    """
+    EMPTY = 0
+    SNAKE = 1
+    FOOD = 2
+
+    def __init__(self, board: Board, config: dict):
+        self.board = board
+        self.config = config
+        cols, rows = board.cols, board.rows
+        self.block = max(1, -(-max(cols, rows) // config["size"]))
+        self.grid = np.zeros((-(-cols // self.block), -(-rows // self.block)), dtype=np.uint8)
+        self.scale = max(1, config["size"] // max(self.grid.shape))
+
+        # 每块一个像素的小图，刷新时放大到显示尺寸
+        self.pixels = pygame.Surface(self.grid.shape)
+        self.surface = pygame.Surface((self.grid.shape[0] * self.scale, self.grid.shape[1] * self.scale))
+        self.surface.set_alpha(config["opacity"])
+        self.rect = self.surface.get_rect(
+            topright=(config["position"]["right"], config["position"]["top"])
+        )
+
+        self.snake = None  # 上次刷新时的蛇，不同则整张重建
+        self.food: Optional[Tuple[int, int]] = None
+        self.touched: Set[Tuple[int, int]] = set()  # 上次刷新以来变化的格子
+        self.last_refresh = float("-inf")
+
+    def track(self, cells: Iterable[Tuple[int, int]]):
+        """记录本帧蛇身变化的格子，留到下次刷新时处理"""
+        self.touched.update(cells)
+
+    def invalidate(self):
+        """下次绘制时整张重建（切换主题时调用）"""
+        self.snake = None
+        self.last_refresh = float("-inf")
+
+    def block_of(self, cell: Tuple[int, int]) -> Tuple[int, int]:
+        """格子所在的块"""
+        size = self.board.cell_size * self.block
+        return (cell[0] // size, cell[1] // size)
+
+    def palette(self, theme) -> np.ndarray:
+        return np.array([theme.BACKGROUND, theme.SNAKE, theme.FOOD], dtype=np.uint8)
+
+    def refresh(self, snake, food: Optional[Tuple[int, int]], theme):
+        """把记录的变化合并进降采样网格并重绘小地图"""
+        palette = self.palette(theme)
+        if snake is not self.snake:
+            self.rebuild(snake, food, palette)
+        else:
+            blocks = {self.block_of(cell) for cell in self.touched}
+            if food != self.food:
+                blocks.update(self.block_of(cell) for cell in (self.food, food) if cell is not None)
+            for bx, by in blocks:
+                value = self.block_value(snake, food, bx, by)
+                self.grid[bx, by] = value
+                self.pixels.set_at((bx, by), palette[value].tolist())
+        self.food = food
+        self.touched.clear()
+        pygame.transform.scale(self.pixels, self.surface.get_size(), self.surface)
+
+    def rebuild(self, snake, food: Optional[Tuple[int, int]], palette: np.ndarray):
+        """整张重建：对蛇身所在的块做最大池化"""
+        self.snake = snake
+        self.grid[:] = self.EMPTY
+        if snake.position:
+            blocks = np.array(snake.position, dtype=np.int64) // (self.board.cell_size * self.block)
+            np.maximum.at(self.grid, (blocks[:, 0], blocks[:, 1]), self.SNAKE)
+        if food is not None:
+            self.grid[self.block_of(food)] = self.FOOD
+        pygame.surfarray.blit_array(self.pixels, palette[self.grid])
+
+    def block_value(self, snake, food: Optional[Tuple[int, int]], bx: int, by: int) -> int:
+        """重新计算单个块的值（块内格子的最大值）"""
+        if food is not None and self.block_of(food) == (bx, by):
+            return self.FOOD
+        size = self.board.cell_size
+        left, top = bx * self.block * size, by * self.block * size
+        right = min(left + self.block * size, self.board.width)
+        bottom = min(top + self.block * size, self.board.height)
+        for y in range(top, bottom, size):
+            for x in range(left, right, size):
+                if snake.occupies((x, y)):
+                    return self.SNAKE
+        return self.EMPTY
+
+    def draw(self, screen: pygame.Surface, snake, food: Optional[Tuple[int, int]], theme,
+             viewport: Optional[pygame.Rect], now: float):
+        """按刷新间隔更新后绘制小地图，viewport 为镜头覆盖的棋盘像素范围"""
+        if now - self.last_refresh >= self.config["refresh"]:
+            self.refresh(snake, food, theme)
+            self.last_refresh = now
+        screen.blit(self.surface, self.rect)
+
+        if viewport is not None:
+            # 镜头范围框：棋盘像素换算到小地图像素
+            ratio = self.scale / (self.board.cell_size * self.block)
+            view = pygame.Rect(
+                self.rect.left + int(viewport.left * ratio), self.rect.top + int(viewport.top * ratio),
+                max(1, int(viewport.width * ratio)), max(1, int(viewport.height * ratio))
+            )
+            pygame.draw.rect(screen, theme.TEXT, view.clip(self.rect), 1)
+        pygame.draw.rect(screen, theme.GRID, self.rect, self.config["border_width"])
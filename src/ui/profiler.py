@@ -0,0 +1,132 @@
+"""
+帧耗时分析器
+"""
+import csv
+import json
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+import pygame
+
+class _Section:
+    """可复用的计时上下文，避免每帧创建对象"""
+    __slots__ = ("profiler", "name", "start")
+    
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+        
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+        
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, (time.perf_counter() - self.start) * 1000.0)
+
+class Profiler:
+    """按区段记录每帧耗时（毫秒），保留最近 window 帧并计算百分位
+
+    用法：with profiler.section("draw"): ...
+    浮层每隔 overlay_refresh 秒重新统计并渲染一次，其余帧只 blit 缓存的 Surface。
+    """
+    PERCENTILES = (50, 95, 99)
+    
+    def __init__(self, config):
+        self.config = config
+        self.samples: Dict[str, Deque[float]] = {}
+        self._sections: Dict[str, _Section] = {}
+        self.overlay_visible = False
+        self.overlay: Optional[pygame.Surface] = None
+        self.overlay_rect: Optional[pygame.Rect] = None
+        self.overlay_time = 0.0
+        self.font = pygame.font.Font(None, config["font_size"])
+        
+    def section(self, name: str) -> _Section:
+        """获取区段计时器"""
+        timer = self._sections.get(name)
+        if timer is None:
+            timer = self._sections[name] = _Section(self, name)
+        return timer
+        
+    def record(self, name: str, value: float):
+        """记录一个样本"""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.config["window"])
+        samples.append(value)
+        
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """各区段的样本数、均值、百分位与最大值"""
+        result = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            count = len(ordered)
+            stats = {"samples": count, "mean": sum(ordered) / count}
+            for p in self.PERCENTILES:
+                # 最近秩法
+                stats[f"p{p}"] = ordered[max(0, -(-p * count // 100) - 1)]
+            stats["max"] = ordered[-1]
+            result[name] = stats
+        return result
+        
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self.overlay = None
+        
+    def draw_overlay(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """在屏幕右下角绘制统计浮层，返回其区域；未显示时返回 None"""
+        if not self.overlay_visible:
+            return None
+        now = time.perf_counter()
+        if self.overlay is None or now - self.overlay_time >= self.config["overlay_refresh"]:
+            self.overlay = self.render_overlay()
+            self.overlay_time = now
+            self.overlay_rect = self.overlay.get_rect(
+                bottomright=(screen.get_width() - 10, screen.get_height() - 10)
+            )
+        screen.blit(self.overlay, self.overlay_rect)
+        return self.overlay_rect
+        
+    def render_overlay(self) -> pygame.Surface:
+        """把当前统计渲染成不透明面板（脏矩形模式下反复绘制不会叠加）"""
+        lines = [f"{'ms':<9}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name, stats in self.stats().items():
+            lines.append(
+                f"{name:<9}{stats['p50']:>7.2f}{stats['p95']:>7.2f}{stats['p99']:>7.2f}"
+            )
+        rendered = [self.font.render(line, True, self.config["text_color"]) for line in lines]
+        line_height = self.font.get_linesize()
+        padding = 6
+        width = max(surface.get_width() for surface in rendered) + padding * 2
+        height = line_height * len(rendered) + padding * 2
+        panel = pygame.Surface((width, height))
+        panel.fill(self.config["background"])
+        for i, surface in enumerate(rendered):
+            panel.blit(surface, (padding, padding + i * line_height))
+        return panel
+        
+    def export(self, directory: str = None) -> List[str]:
+        """导出统计为 CSV 与 JSON（JSON 另含原始样本），返回写入的文件"""
+        directory = directory or self.config["export_dir"]
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, time.strftime("profile_%Y%m%d_%H%M%S"))
+        stats = self.stats()
+        
+        fields = ["section", "samples", "mean", "p50", "p95", "p99", "max"]
+        with open(stem + ".csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            for name, values in stats.items():
+                writer.writerow([name] + [round(values[field], 4) for field in fields[1:]])
+                
+        with open(stem + ".json", "w", encoding="utf-8") as f:
+            json.dump({
+                "unit": "ms",
+                "stats": stats,
+                "samples": {name: list(samples) for name, samples in self.samples.items()}
+            }, f, indent=2)
+        return [stem + ".csv", stem + ".json"]
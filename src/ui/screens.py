@@ -4,25 +4,37 @@
 import pygame
 import sys
 import os
+import random
+from itertools import chain, islice
 import time
+from typing import List, Optional
 
 # 添加项目根目录到 Python 路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from src.game.snake import Snake
-from src.game.food import Food
+from src.engine.game import GameEngine
+from src.engine.replay import Replay
+from src.engine.registry import Policy, make_policy
 from src.ui.theme import ThemeManager
 from src.ui.buttons import Button
+from src.ui.text_cache import TextCache
+from src.ui.sprites import SpriteAtlas
+from src.ui.layers import LayerCache
+from src.ui.board_renderer import SurfarrayBoardRenderer
+from src.ui.camera import Camera
+from src.ui.minimap import Minimap
 from src.managers.ranking_manager import RankingManager
 from src.managers.save_manager import SaveManager
 from src.managers.achievement_manager import AchievementManager
+from src.managers.persistence import PersistenceWorker
 from src.config import (
     WINDOW_WIDTH, WINDOW_HEIGHT, CELL_SIZE, CONTROLS, 
     GameState, COUNTDOWN_SECONDS, COUNTDOWN_FONT_SIZE, COUNTDOWN_COLOR,
     Difficulty, DIFFICULTY_SETTINGS, BUTTON_STYLE, GAME_MESSAGES,
     LAYOUT, MOVE_DELAY, FONTS, VISUAL_EFFECTS, GAME_STYLE,
-    TOUCH_CONTROLS, RANKING_SYSTEM, SAVE_SYSTEM, ACHIEVEMENTS,
-    RANKING_UI, VIRTUAL_JOYSTICK, UI_BUTTONS
+    TOUCH_CONTROLS, RANKING_SYSTEM, SAVE_SYSTEM, ACHIEVEMENTS, PERSISTENCE,
+    RANKING_UI, VIRTUAL_JOYSTICK, UI_BUTTONS, SIMULATION, RENDERING,
+    REPLAY_SYSTEM, MINIMAP, DEMO_MODE
 )
 
 class GameScreen:
@@ -35,17 +47,50 @@ class GameScreen:
             "title": pygame.font.SysFont('microsoftyaheimicrosoftyaheiui', FONTS["title"]["size"], bold=FONTS["title"]["bold"]),
             "subtitle": pygame.font.SysFont('microsoftyaheimicrosoftyaheiui', FONTS["subtitle"]["size"], bold=FONTS["subtitle"]["bold"]),
             "score": pygame.font.SysFont('microsoftyaheimicrosoftyaheiui', FONTS["score"]["size"], bold=FONTS["score"]["bold"]),
-            "message": pygame.font.SysFont('microsoftyaheimicrosoftyaheiui', FONTS["message"]["size"], bold=FONTS["message"]["bold"])
+            "message": pygame.font.SysFont('microsoftyaheimicrosoftyaheiui', FONTS["message"]["size"], bold=FONTS["message"]["bold"]),
+            "countdown": pygame.font.Font(None, COUNTDOWN_FONT_SIZE)
         }
         
+        # 文字缓存，切换主题时清空
+        self.text_cache = TextCache(RENDERING["text_cache_size"])
+        self.theme_manager.add_listener(self.text_cache.clear)
+        
+        # 边框、网格、遮罩等静态图层，切换主题时清空
+        self.layers = LayerCache()
+        self.theme_manager.add_listener(self.layers.clear)
+        
+        # 蛇身与食物图块，切换主题时重建
+        self.sprites = SpriteAtlas(self.theme_manager.current_theme)
+        self.theme_manager.add_listener(
+            lambda: self.sprites.build(self.theme_manager.current_theme)
+        )
+        
+        # 脏矩形渲染：记录上一帧绘制的内容，None 表示下一帧需要整屏重绘
+        self.drawn_frame = None
+        self.hud_rect = pygame.Rect(0, 0, WINDOW_WIDTH, int(LAYOUT["game_area"]["top"]))
+        self.joystick_rect = pygame.Rect(0, 0, VIRTUAL_JOYSTICK["size"], VIRTUAL_JOYSTICK["size"])
+        self.joystick_rect.center = (VIRTUAL_JOYSTICK["position"]["x"], VIRTUAL_JOYSTICK["position"]["y"])
+        self.theme_manager.add_listener(self.invalidate_frame)
+        
         # 初始化管理器
-        self.ranking_manager = RankingManager(RANKING_SYSTEM)
-        self.save_manager = SaveManager(SAVE_SYSTEM)
+        self.persistence = PersistenceWorker(PERSISTENCE)
+        self.ranking_manager = RankingManager(RANKING_SYSTEM, self.persistence)
+        self.save_manager = SaveManager(SAVE_SYSTEM, self.persistence)
         self.achievement_manager = AchievementManager(ACHIEVEMENTS, self.save_manager)
         
-        # 初始化游戏对象
-        self.snake = Snake()
-        self.food = Food()
+        # 初始化游戏对象（规则由无界面引擎负责）
+        self.engine = GameEngine(Difficulty.HARD, seed=self.new_seed())
+        self.last_replay: Optional[Replay] = None
+        
+        # 整盘光栅化渲染器（可选）：蛇身按格子增量更新，每帧只 blit 一次
+        self.board_renderer: Optional[SurfarrayBoardRenderer] = None
+        self.setup_board_renderer()
+        
+        # 棋盘大于窗口时镜头跟随蛇头，只绘制视口内的内容
+        self.camera: Optional[Camera] = None
+        self.minimap: Optional[Minimap] = None
+        self.setup_camera()
+        self.theme_manager.add_listener(lambda: self.minimap and self.minimap.invalidate())
         
         # 初始化游戏状态
         self.state = GameState.DIFFICULTY_SELECT
@@ -54,6 +99,10 @@ class GameScreen:
         self.is_first_game = True
         self.difficulty = Difficulty.HARD
         
+        # 演示模式：闲置时由自动驾驶策略操控，任意输入退出
+        self.autopilot: Optional[Policy] = None
+        self.last_input_time = time.time()
+        
         # 初始化按钮
         self.buttons = []
         self.setup_difficulty_buttons()
@@ -69,9 +118,21 @@ class GameScreen:
         self.game_start_time = 0
         self.time_left = 0
         
+        # 固定步长模拟
+        self.accumulator = 0.0  # 尚未模拟的时间（秒）
+        self.interpolation = 1.0  # 当前帧在两次移动之间的位置 [0, 1)
+        self.last_update_time = None
+        
         # 排行榜相关
         self.current_leaderboard_page = "all_time"
         self.input_text = ""
+        self.score_submitted = False  # 本局分数是否已提交
+        self.final_rankings = {}  # 本局提交后各分类的排名，供结束界面读取
+        self.pending_verification = None  # 本局录像校验的 Future，完成后填入 final_rankings
+        self.projected_score = None  # 上次查询预估名次时的分数
+        self.projected_rank = None  # 按当前分数预估的名次
+        self.projection_scores: List[int] = []  # 预估名次用的前 N 名分数快照
+        self.projection_key = None  # 快照对应的 (排行榜版本, 难度)
         
         # 初始化通用UI按钮
         self.ui_buttons = {
@@ -107,6 +168,19 @@ class GameScreen:
             )
         }
         
+        # 排行榜面板的返回按钮（保存引用以处理点击）
+        board_rect = self.leaderboard_rect()
+        self.leaderboard_back_button = Button(
+            board_rect.left + RANKING_UI["leaderboard"]["padding"],
+            board_rect.bottom - RANKING_UI["leaderboard"]["padding"] - BUTTON_STYLE["height"],
+            BUTTON_STYLE["width"]//2,
+            BUTTON_STYLE["height"],
+            "Back [Esc]",
+            BUTTON_STYLE["normal"],
+            BUTTON_STYLE["hover"],
+            lambda: setattr(self, 'state', GameState.DIFFICULTY_SELECT)
+        )
+        
     def setup_difficulty_buttons(self):
         """设置难度选择按钮"""
         button_width = BUTTON_STYLE["width"]
@@ -115,7 +189,7 @@ class GameScreen:
         start_y = LAYOUT["buttons_start_y"]
         
         # 添加标题
-        title_text = self.fonts["title"].render(GAME_MESSAGES["GAME_TITLE"], True, self.theme_manager.current_theme.TEXT)
+        title_text = self.text_cache.render(self.fonts["title"], GAME_MESSAGES["GAME_TITLE"], True, self.theme_manager.current_theme.TEXT)
         self.title_rect = title_text.get_rect(center=(WINDOW_WIDTH/2, LAYOUT["title_y_pos"]))
         
         # 添加排行榜按钮在右上角
@@ -153,29 +227,60 @@ class GameScreen:
             )
             self.buttons.append(button)
         
+    @property
+    def snake(self):
+        """当前局的蛇"""
+        return self.engine.snake
+        
+    @property
+    def food(self):
+        """当前局的食物"""
+        return self.engine.food
+        
     def select_difficulty(self, difficulty: Difficulty):
         """选择难度"""
         self.difficulty = difficulty
-        self.snake = Snake()  # 重新创建蛇
-        self.snake.difficulty = difficulty  # 设置难度
-        self.food = Food()  # 重新创建食物
+        self.engine = GameEngine(difficulty, seed=self.new_seed())  # 按难度重新开局
+        self.setup_camera()
         self.state = GameState.READY  # 设置为准备状态
         self.is_first_game = False
         
+    @staticmethod
+    def new_seed() -> int:
+        """每局使用独立的种子，配合输入记录即可完整重现"""
+        return random.getrandbits(32)
+        
     def start_countdown(self):
         """开始倒计时"""
         self.state = GameState.COUNTDOWN
         self.countdown_start = time.time()
         self.countdown_current = COUNTDOWN_SECONDS
         self.game_start_time = time.time()  # 记录游戏开始时间
+        self.score_submitted = False
+        self.final_rankings = {}
+        self.pending_verification = None
+        self.projected_score = None
+        self.projected_rank = None
         # 设置游戏时间限制
         if DIFFICULTY_SETTINGS[self.difficulty]["time_limit"]:
             self.time_left = DIFFICULTY_SETTINGS[self.difficulty]["time_limit"]
         
-    def update(self):
-        """更新游戏状态"""
+    def update(self, dt: float = None):
+        """更新游戏状态，dt 为距上一帧的时间（秒）"""
         current_time = time.time()
-        
+        if dt is None:
+            dt = 0.0 if self.last_update_time is None else current_time - self.last_update_time
+        self.last_update_time = current_time
+        self.ranking_manager.expire_if_due(current_time)
+        for future, rankings in self.ranking_manager.poll_verified():
+            if future is self.pending_verification:
+                self.final_rankings = rankings or {}
+                self.pending_verification = None
+        
+        if (self.state == GameState.DIFFICULTY_SELECT and DEMO_MODE["enabled"]
+                and current_time - self.last_input_time >= DEMO_MODE["idle_seconds"]):
+            self.start_demo()
+            
         if self.state == GameState.COUNTDOWN:
             elapsed = int(current_time - self.countdown_start)
             self.countdown_current = max(0, COUNTDOWN_SECONDS - elapsed)
@@ -183,43 +288,114 @@ class GameScreen:
             if self.countdown_current == 0:
                 self.state = GameState.PLAYING
                 self.game_start_time = current_time
+                self.accumulator = 0.0
             return
             
         if self.state == GameState.PLAYING:
-            # 更新时间限制
-            if DIFFICULTY_SETTINGS[self.difficulty]["time_limit"]:
-                self.time_left = max(0, DIFFICULTY_SETTINGS[self.difficulty]["time_limit"] - 
-                                   int(current_time - self.game_start_time))
-                if self.time_left == 0:
-                    self.handle_game_over()  # 调用游戏结束处理
-                    return
-                    
-            # 只在应该移动时才移动蛇
-            if self.snake.should_move():
-                collision = self.snake.move(
-                    allow_wall_pass=not DIFFICULTY_SETTINGS[self.difficulty]["wall_collision"]
-                )
-                if collision:
-                    if not self.snake.respawn():
-                        self.state = GameState.GAME_OVER
-                    return
-                    
-                if self.snake.position[0] == self.food.position:
-                    self.snake.grow()
-                    self.food.respawn(self.snake.position)
+            # 按固定步长推进模拟，一帧内可能移动多步或不移动
+            self.accumulator += min(dt, SIMULATION["max_frame_time"])
+            step = self.snake.step_interval
+            while self.accumulator >= step and self.state == GameState.PLAYING:
+                self.accumulator -= step
+                self.step_simulation()
+            if self.snake.score != self.projected_score and self.autopilot is None:
+                self.update_projected_rank()
+            # 剩余时间按模拟时间计算，暂停期间不流逝
+            if self.engine.time_left is not None:
+                self.time_left = self.engine.time_left
                 
-    def draw(self):
-        """绘制游戏界面"""
+        if (self.state == GameState.PLAYING and SIMULATION["interpolate"]
+                and not RENDERING["dirty_rects"] and self.board_layer() is None):
+            self.interpolation = min(1.0, self.accumulator / self.snake.step_interval)
+        else:
+            self.interpolation = 1.0
+            
+    def setup_board_renderer(self):
+        """按 RENDERING["board_renderer"] 选择蛇身渲染方式"""
+        self.board_renderer = None
+        if RENDERING["board_renderer"] == "surfarray":
+            self.board_renderer = SurfarrayBoardRenderer(self.engine.board, self.sprites.segments[0])
+        self.invalidate_frame()
+        
+    def board_layer(self) -> Optional[SurfarrayBoardRenderer]:
+        """当前可用的光栅化渲染器；镜头模式下棋盘放不进一张图层，不使用"""
+        return self.board_renderer if self.camera is None else None
+        
+    def setup_camera(self):
+        """棋盘大于窗口时启用镜头，否则直接按窗口坐标绘制"""
+        board = self.engine.board
+        self.camera = None
+        self.minimap = None
+        if board.width > WINDOW_WIDTH or board.height > WINDOW_HEIGHT:
+            self.camera = Camera(board, self.screen.get_rect())
+            self.camera.follow(self.snake.position[0])
+            if MINIMAP["enabled"]:
+                self.minimap = Minimap(board, MINIMAP)
+        self.invalidate_frame()
+        
+    def update_projected_rank(self):
+        """分数变化时按内存中的分数快照计算预估名次，绘制时直接使用结果
+
+        快照只在排行榜变化（提交分数、记录过期）或换难度后重新读取，游戏中不查询存储。
+        """
+        self.projected_score = self.snake.score
+        key = (self.ranking_manager.revision, self.difficulty)
+        if key != self.projection_key:
+            self.projection_key = key
+            self.projection_scores = self.ranking_manager.top_scores(
+                RANKING_UI["projection_category"], self.difficulty.name
+            )
+        self.projected_rank = self.ranking_manager.project_rank(self.projection_scores, self.snake.score)
+        
+    def step_simulation(self):
+        """执行一次模拟步：移动、碰撞与进食"""
+        if self.autopilot is not None:
+            action = self.autopilot.act(self.engine)
+            if action is not None:
+                self.engine.change_direction(action)
+        self.engine.step()
+        if self.engine.game_over:
+            self.handle_game_over()
+            
+    def start_demo(self):
+        """进入演示模式：自动驾驶直接开始一局"""
+        is_first_game = self.is_first_game
+        self.select_difficulty(DEMO_MODE["difficulty"])
+        self.is_first_game = is_first_game
+        self.autopilot = make_policy(DEMO_MODE["policy"])
+        self.autopilot.reset(self.engine)
+        self.start_countdown()
+        self.state = GameState.PLAYING
+        self.accumulator = 0.0
+        self.invalidate_frame()
+        
+    def stop_demo(self):
+        """退出演示模式，回到难度选择界面"""
+        self.autopilot = None
+        self.state = GameState.DIFFICULTY_SELECT
+        self.invalidate_frame()
+                
+    def draw(self) -> Optional[List[pygame.Rect]]:
+        """绘制游戏界面，返回本帧变化的屏幕区域，None 表示整屏都需要更新"""
+        # 每帧取出一次蛇身变化的格子，供光栅化渲染器与脏矩形共同使用
+        dirty_cells = self.snake.drain_dirty_cells()
+        if self.board_layer() is not None:
+            self.board_renderer.update(self.snake, dirty_cells)
+        if self.minimap is not None:
+            self.minimap.track(dirty_cells)
+        if self.can_draw_dirty():
+            return self.draw_dirty(dirty_cells)
+            
         theme = self.theme_manager.current_theme
         self.screen.fill(theme.BACKGROUND)
         
         if self.state == GameState.DIFFICULTY_SELECT:
             # 绘制标题
-            title_text = self.fonts["title"].render(GAME_MESSAGES["GAME_TITLE"], True, theme.TEXT)
+            title_text = self.text_cache.render(self.fonts["title"], GAME_MESSAGES["GAME_TITLE"], True, theme.TEXT)
             self.screen.blit(title_text, self.title_rect)
             
             # 绘制副标题
-            subtitle_text = self.fonts["subtitle"].render(GAME_MESSAGES["SUBTITLE"], True, theme.TEXT)
+            subtitle_text = self.text_cache.render(self.fonts["subtitle"], GAME_MESSAGES["SUBTITLE"], True, theme.TEXT)
             subtitle_rect = subtitle_text.get_rect(center=(WINDOW_WIDTH/2, LAYOUT["subtitle_y_pos"]))
             self.screen.blit(subtitle_text, subtitle_rect)
             
@@ -227,41 +403,24 @@ class GameScreen:
             for button in self.buttons:
                 button.draw(self.screen)
         else:
+            if self.camera is not None:
+                self.camera.follow(self.interpolated_head())
+                
             # 绘制游戏区域
             self.draw_game_area()
             
             # 绘制游戏元素
             self.draw_snake()
             self.draw_food()
+            self.draw_minimap()
             
             # 绘制UI元素
             self.draw_score()
             self.draw_lives()
             
             # 绘制剩余时间（如果有时间限制）
-            if self.state == GameState.PLAYING and DIFFICULTY_SETTINGS[self.difficulty]["time_limit"]:
-                time_text = self.fonts["message"].render(
-                    f"{GAME_MESSAGES['TIME_LEFT']}: {self.time_left}秒", 
-                    True, 
-                    theme.TEXT
-                )
-                time_rect = time_text.get_rect(
-                    midtop=(WINDOW_WIDTH/2, LAYOUT["score_margin"])
-                )
-                self.screen.blit(time_text, time_rect)
-                
-                # 时间不足10秒时闪烁提示
-                if self.time_left <= 10:
-                    if int(time.time() * 2) % 2:  # 每0.5秒闪烁一次
-                        warning_text = self.fonts["message"].render(
-                            f"⚠ {self.time_left} ⚠", 
-                            True, 
-                            (231, 76, 60)  # 红色警告
-                        )
-                        warning_rect = warning_text.get_rect(
-                            midtop=(WINDOW_WIDTH/2, time_rect.bottom + 5)
-                        )
-                        self.screen.blit(warning_text, warning_rect)
+            if self.state == GameState.PLAYING:
+                self.draw_time_left()
             
             # 绘制游戏状态
             if self.state == GameState.READY:
@@ -288,12 +447,147 @@ class GameScreen:
         
         self.draw_virtual_joystick()
         
+        self.remember_frame()
+        return None
+        
+    def draw_time_left(self):
+        """绘制剩余时间"""
+        if not DIFFICULTY_SETTINGS[self.difficulty]["time_limit"]:
+            return
+        theme = self.theme_manager.current_theme
+        time_text = self.text_cache.render(
+            self.fonts["message"],
+            f"{GAME_MESSAGES['TIME_LEFT']}: {self.time_left}秒", 
+            True, 
+            theme.TEXT
+        )
+        time_rect = time_text.get_rect(
+            midtop=(WINDOW_WIDTH/2, LAYOUT["score_margin"])
+        )
+        self.screen.blit(time_text, time_rect)
+        
+        # 时间不足10秒时闪烁提示
+        if self.time_left <= 10:
+            if self.time_warning_visible():  # 每0.5秒闪烁一次
+                warning_text = self.text_cache.render(
+                    self.fonts["message"],
+                    f"⚠ {self.time_left} ⚠", 
+                    True, 
+                    (231, 76, 60)  # 红色警告
+                )
+                warning_rect = warning_text.get_rect(
+                    midtop=(WINDOW_WIDTH/2, time_rect.bottom + 5)
+                )
+                self.screen.blit(warning_text, warning_rect)
+                
+    def time_warning_visible(self) -> bool:
+        """剩余时间警告的闪烁相位"""
+        return bool(int(time.time() * 2) % 2)
+        
+    def invalidate_frame(self):
+        """下一帧强制整屏重绘"""
+        self.drawn_frame = None
+        
+    def frame_signature(self) -> dict:
+        """本帧非蛇身元素的状态，用于判断哪些区域需要重绘"""
+        return {
+            "state": self.state,
+            "food": (self.food.position, int(4 * self.pulse_value)),
+            "hud": (
+                self.snake.score, self.projected_rank, self.snake.lives, self.time_left,
+                self.time_left <= 10 and self.time_warning_visible(),
+                self.ui_buttons["pause"].current_color,
+                self.ui_buttons["back"].current_color
+            ),
+            "joystick": self.pressed_directions()
+        }
+        
+    def remember_frame(self):
+        """整屏绘制后记录当前帧，蛇身变化已全部画出"""
+        self.drawn_frame = self.frame_signature()
+        
+    def can_draw_dirty(self) -> bool:
+        """是否可以只重绘变化区域"""
+        return (
+            RENDERING["dirty_rects"]
+            and self.state == GameState.PLAYING
+            and self.drawn_frame is not None
+            and self.drawn_frame["state"] == GameState.PLAYING
+            and self.camera is None  # 镜头每步都会移动
+        )
+        
+    def cell_rect(self, cell) -> pygame.Rect:
+        """格子对应的屏幕区域"""
+        return pygame.Rect(cell[0], cell[1], CELL_SIZE, CELL_SIZE)
+        
+    def food_rect(self, position) -> pygame.Rect:
+        """食物可能覆盖的屏幕区域（包含脉冲放大）"""
+        return self.cell_rect(position).inflate(8, 8)
+        
+    def draw_dirty(self, dirty_cells) -> List[pygame.Rect]:
+        """脏矩形模式：只重绘本帧变化的区域（dirty_cells 为蛇身变化的格子）"""
+        theme = self.theme_manager.current_theme
+        previous = self.drawn_frame
+        current = self.frame_signature()
+        
+        dirty = [self.cell_rect(cell) for cell in dirty_cells]
+        if current["food"] != previous["food"]:
+            for position in (previous["food"][0], current["food"][0]):
+                if position is not None:
+                    dirty.append(self.food_rect(position))
+        if current["hud"] != previous["hud"]:
+            dirty.append(self.hud_rect)
+        if current["joystick"] != previous["joystick"]:
+            dirty.append(self.joystick_rect)
+            
+        # 按整屏绘制的顺序逐个元素重绘，每个元素只在与它相交的区域内绘制一次，
+        # 其余像素保持上一帧的内容；区域先合并为互不重叠的矩形，半透明元素才不会叠加两次
+        dirty = self.merge_rects(dirty)
+        screen_rect = self.screen.get_rect()
+        for rect in dirty:
+            # 伸出屏幕的矩形先裁剪，fill 不会按屏幕边缘缩短负坐标矩形的宽度
+            self.screen.fill(theme.BACKGROUND, rect.clip(screen_rect))
+        food = current["food"][0]
+        elements = [
+            (None, lambda rect: self.draw_game_area()),
+            (None, self.draw_snake),
+            (self.food_rect(food) if food is not None else pygame.Rect(0, 0, 0, 0),
+             lambda rect: self.draw_food()),
+            (self.hud_rect, lambda rect: (self.draw_score(), self.draw_lives(), self.draw_time_left())),
+            (self.ui_buttons["pause"].rect, lambda rect: self.ui_buttons["pause"].draw(self.screen)),
+            (self.ui_buttons["back"].rect, lambda rect: self.ui_buttons["back"].draw(self.screen)),
+            (self.joystick_rect, lambda rect: self.draw_virtual_joystick())
+        ]
+        for bounds, draw in elements:
+            for rect in dirty:
+                if bounds is None or bounds.colliderect(rect):
+                    self.screen.set_clip(rect)
+                    draw(rect)
+        self.screen.set_clip(None)
+        
+        self.drawn_frame = current
+        return dirty
+        
+    @staticmethod
+    def merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """把相互重叠的矩形合并为外接矩形，直到两两不重叠"""
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            rect = pygame.Rect(rect)
+            index = rect.collidelist(merged)
+            while index >= 0:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+        
     def draw_ready_screen(self):
         """绘制准备界面"""
         theme = self.theme_manager.current_theme
         
         # 标题
-        title = self.fonts["title"].render(
+        title = self.text_cache.render(
+            self.fonts["title"],
             f"{DIFFICULTY_SETTINGS[self.difficulty]['name']}", 
             True, theme.TEXT
         )
@@ -304,7 +598,7 @@ class GameScreen:
         description = GAME_MESSAGES[f"DIFFICULTY_{self.difficulty.name}"]
         y_offset = LAYOUT["subtitle_y_pos"]
         for line in description.split('\n'):
-            desc_text = self.fonts["message"].render(line, True, theme.TEXT)
+            desc_text = self.text_cache.render(self.fonts["message"], line, True, theme.TEXT)
             desc_rect = desc_text.get_rect(center=(WINDOW_WIDTH/2, y_offset))
             self.screen.blit(desc_text, desc_rect)
             y_offset += 40
@@ -314,8 +608,9 @@ class GameScreen:
         
     def draw_countdown(self):
         """绘制倒计时"""
-        font = pygame.font.Font(None, COUNTDOWN_FONT_SIZE)
-        text = font.render(str(self.countdown_current), True, COUNTDOWN_COLOR)
+        text = self.text_cache.render(
+            self.fonts["countdown"], str(self.countdown_current), True, COUNTDOWN_COLOR
+        )
         rect = text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2))
         self.screen.blit(text, rect)
         
@@ -323,16 +618,11 @@ class GameScreen:
         """绘制游戏结束界面"""
         theme = self.theme_manager.current_theme
         
-        # 添加分数到排行榜
-        rankings = self.ranking_manager.add_score(
-            self.difficulty.name,
-            self.snake.score
-        )
-        
         texts = [
-            (self.fonts["title"].render(GAME_MESSAGES["GAME_OVER"], True, theme.TEXT), 
+            (self.text_cache.render(self.fonts["title"], GAME_MESSAGES["GAME_OVER"], True, theme.TEXT), 
              LAYOUT["title_y_pos"]),
-            (self.fonts["subtitle"].render(
+            (self.text_cache.render(
+                self.fonts["subtitle"],
                 f"{GAME_MESSAGES['FINAL_SCORE']}: {self.snake.score}", 
                 True, theme.TEXT
             ), LAYOUT["subtitle_y_pos"])
@@ -340,10 +630,11 @@ class GameScreen:
         
         # 显示排名信息
         y_offset = LAYOUT["subtitle_y_pos"] + 50
-        for category, rank in rankings.items():
+        for category, rank in self.final_rankings.items():
             if rank is not None:
                 category_name = RANKING_SYSTEM["categories"][category]["name"]
-                rank_text = self.fonts["message"].render(
+                rank_text = self.text_cache.render(
+                    self.fonts["message"],
                     f"{category_name}: #{rank}", True, 
                     (46, 204, 113) if rank <= 3 else theme.TEXT
                 )
@@ -361,20 +652,23 @@ class GameScreen:
         
     def handle_event(self, event: pygame.event.Event):
         """处理游戏事件"""
+        if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN):
+            self.last_input_time = time.time()
+            if self.autopilot is not None:
+                # 演示中的任意输入只用于退出演示
+                self.stop_demo()
+                return
         if event.type == pygame.KEYDOWN:
             # 名字输入处理
             if self.state == GameState.NAME_INPUT:
                 if event.key == pygame.K_RETURN and self.input_text:
                     # 保存记录
-                    self.ranking_manager.add_score(
-                        self.difficulty.name,
-                        self.snake.score,
-                        self.input_text
-                    )
+                    self.submit_score(self.input_text)
                     self.state = GameState.GAME_OVER
                 elif event.key == pygame.K_BACKSPACE:
                     self.input_text = self.input_text[:-1]
                 elif event.key == pygame.K_ESCAPE:
+                    self.submit_score()
                     self.state = GameState.GAME_OVER
                 elif len(self.input_text) < RANKING_UI["name_input"]["max_length"]:
                     if event.unicode.isprintable():
@@ -388,13 +682,13 @@ class GameScreen:
             elif self.state == GameState.PLAYING:
                 # 游戏控制
                 if event.key in CONTROLS["UP"]:
-                    self.snake.change_direction((0, -CELL_SIZE))
+                    self.engine.change_direction("UP")
                 elif event.key in CONTROLS["DOWN"]:
-                    self.snake.change_direction((0, CELL_SIZE))
+                    self.engine.change_direction("DOWN")
                 elif event.key in CONTROLS["LEFT"]:
-                    self.snake.change_direction((-CELL_SIZE, 0))
+                    self.engine.change_direction("LEFT")
                 elif event.key in CONTROLS["RIGHT"]:
-                    self.snake.change_direction((CELL_SIZE, 0))
+                    self.engine.change_direction("RIGHT")
             elif self.state == GameState.LEADERBOARD and event.key == pygame.K_TAB:
                 # 切换排行榜分类
                 categories = list(RANKING_SYSTEM["categories"].keys())
@@ -402,6 +696,7 @@ class GameScreen:
                 self.current_leaderboard_page = categories[
                     (current_index + 1) % len(categories)
                 ]
+                self.ranking_manager.expire_records()
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = event.pos
@@ -461,37 +756,71 @@ class GameScreen:
         
     def reset_game(self):
         """重置游戏"""
-        self.snake.reset()
-        self.food.respawn(self.snake.position)
-        # 根据难度设置游戏参数
-        settings = DIFFICULTY_SETTINGS[self.difficulty]
-        self.snake.speed = settings["speed"]
-        self.snake.wall_collision = settings["wall_collision"]
-        self.snake.lives = settings["lives"]
-        self.snake.move_delay = MOVE_DELAY[self.difficulty]  # 设置移动延迟
-        self.snake.move_counter = 0  # 重置移动计数器
+        self.engine.reset(self.new_seed())  # 引擎按难度设置生命、速度等参数
+        self.accumulator = 0.0  # 重置模拟时间
         # 重置状态
         self.state = GameState.READY
         self.countdown_start = 0
         self.countdown_current = COUNTDOWN_SECONDS
         
-    def draw_game_area(self):
-        """绘制游戏区域"""
-        theme = self.theme_manager.current_theme
-        
-        # 绘制游戏区域边框
-        game_area = pygame.Rect(
+    def game_area_rect(self) -> pygame.Rect:
+        """游戏区域在屏幕上的范围"""
+        return pygame.Rect(
             0,
             LAYOUT["game_area"]["top"],
             WINDOW_WIDTH,
             LAYOUT["game_area"]["bottom"] - LAYOUT["game_area"]["top"]
         )
-        pygame.draw.rect(self.screen, theme.GRID, game_area, GAME_STYLE["border_width"])
+        
+    def draw_game_area(self):
+        """绘制游戏区域"""
+        if self.camera is not None:
+            self.draw_board_walls()
+            return
+        game_area = self.game_area_rect()
+        if GAME_STYLE["show_grid"]:
+            self.draw_grid()
+        # 绘制游戏区域边框
+        self.screen.blit(self.layers.get("game_area", self.build_game_area_layer), game_area)
+        
+    def draw_board_walls(self):
+        """镜头模式：整个棋盘都是游戏区域，按镜头位置绘制网格与墙壁"""
+        theme = self.theme_manager.current_theme
+        board_rect = self.camera.board_rect()
+        if GAME_STYLE["show_grid"]:
+            # 网格图层比窗口多一格，按镜头偏移对齐格子
+            offset = self.camera.offset
+            self.screen.set_clip(board_rect.clip(self.screen.get_rect()))
+            self.screen.blit(
+                self.layers.get("board_grid", self.build_board_grid_layer),
+                (-(offset[0] % CELL_SIZE), -(offset[1] % CELL_SIZE))
+            )
+            self.screen.set_clip(None)
+        pygame.draw.rect(self.screen, theme.GRID, board_rect, GAME_STYLE["border_width"])
+        
+    def build_game_area_layer(self) -> pygame.Surface:
+        """游戏区域边框图层，内部用 colorkey 透明"""
+        theme = self.theme_manager.current_theme
+        game_area = self.game_area_rect()
+        return self.keyed_layer(game_area.size, lambda layer: pygame.draw.rect(
+            layer, theme.GRID, layer.get_rect(), GAME_STYLE["border_width"]
+        ))
+        
+    @staticmethod
+    def keyed_layer(size, paint) -> pygame.Surface:
+        """以 colorkey 表示透明的图层，RLE 加速后透明区域几乎不占 blit 时间"""
+        layer = pygame.Surface(size)
+        key = (255, 0, 255)
+        layer.fill(key)
+        paint(layer)
+        layer.set_colorkey(key, pygame.RLEACCEL)
+        return layer.convert() if pygame.display.get_surface() else layer
         
     def draw_score(self):
         """绘制分数"""
         theme = self.theme_manager.current_theme
-        score_text = self.fonts["score"].render(
+        score_text = self.text_cache.render(
+            self.fonts["score"],
             f"{GAME_MESSAGES['SCORE']}: {self.snake.score}", 
             True, 
             theme.TEXT
@@ -501,59 +830,151 @@ class GameScreen:
         )
         self.screen.blit(score_text, score_rect)
         
-    def draw_snake(self):
-        """绘制蛇"""
-        theme = self.theme_manager.current_theme
-        for i, segment in enumerate(self.snake.position):
-            # 使用渐变色
-            color_index = i % len(VISUAL_EFFECTS["snake_gradient"])
-            color = VISUAL_EFFECTS["snake_gradient"][color_index]
-            
-            # 绘制蛇身方块
-            pygame.draw.rect(
-                self.screen,
-                color,
-                pygame.Rect(
-                    segment[0],
-                    segment[1],
-                    CELL_SIZE - 2,  # 留出间隙
-                    CELL_SIZE - 2
-                ),
-                border_radius=GAME_STYLE["snake_radius"]
+        # 游戏中显示按当前分数预估的名次
+        if self.state == GameState.PLAYING and self.projected_rank is not None:
+            rank_text = self.text_cache.render(
+                self.fonts["message"],
+                GAME_MESSAGES["PROJECTED_RANK"].format(rank=self.projected_rank),
+                True,
+                theme.TEXT
             )
+            rank_rect = rank_text.get_rect(topleft=(LAYOUT["score_margin"], score_rect.bottom + 5))
+            self.screen.blit(rank_text, rank_rect)
+            
+        # 演示模式提示（演示中不显示预估名次）
+        if self.autopilot is not None:
+            demo_text = self.text_cache.render(self.fonts["message"], GAME_MESSAGES["DEMO"], True, theme.TEXT)
+            demo_rect = demo_text.get_rect(topleft=(LAYOUT["score_margin"], score_rect.bottom + 5))
+            self.screen.blit(demo_text, demo_rect)
+        
+    def draw_snake(self, region: pygame.Rect = None):
+        """绘制蛇，指定 region 时只绘制该区域内的蛇身"""
+        if self.camera is not None:
+            self.screen.blits(self.visible_snake_blits(), doreturn=False)
+            return
+        if self.board_renderer is not None:
+            # 光栅化图层已包含整条蛇，裁剪区域由 screen.set_clip 决定
+            self.board_renderer.draw(self.screen)
+            return
+        if region is not None:
+            self.draw_snake_region(region)
+            return
+        # 一次提交所有蛇身图块
+        self.screen.blits(self.snake_blits(), doreturn=False)
+        
+    def snake_blits(self):
+        """逐节生成 (图块, 位置)，供 Surface.blits 使用"""
+        body = self.snake.position
+        alpha = self.interpolation
+        tiles = self.sprites.segments
+        count = len(tiles)
+        head_serial = self.snake.head_serial
+        # 使用渐变色，颜色跟随蛇身每一节而不是随移动闪烁
+        if alpha >= 1.0:
+            for i, segment in enumerate(body):
+                yield tiles[(head_serial - i) % count], segment
+            return
+            
+        # 在上一步所在格子与当前格子之间插值，每节的上一格就是下一节现在的位置
+        previous_cells = chain(islice(body, 1, None), (self.snake.previous_tail,))
+        for i, ((x, y), previous) in enumerate(zip(body, previous_cells)):
+            if (previous is not None and abs(x - previous[0]) <= CELL_SIZE
+                    and abs(y - previous[1]) <= CELL_SIZE):
+                x = previous[0] + (x - previous[0]) * alpha
+                y = previous[1] + (y - previous[1]) * alpha
+            yield tiles[(head_serial - i) % count], (int(x), int(y))
+        
+    @staticmethod
+    def lerp_cell(cell, previous, alpha: float):
+        """在上一格与当前格之间插值（穿墙等非相邻移动不插值）"""
+        if (alpha >= 1.0 or previous is None or abs(cell[0] - previous[0]) > CELL_SIZE
+                or abs(cell[1] - previous[1]) > CELL_SIZE):
+            return cell
+        return (
+            int(previous[0] + (cell[0] - previous[0]) * alpha),
+            int(previous[1] + (cell[1] - previous[1]) * alpha)
+        )
+        
+    def interpolated_head(self):
+        """本帧蛇头的绘制位置（镜头跟随的目标）"""
+        body = self.snake.position
+        previous = body[1] if len(body) > 1 else self.snake.previous_tail
+        return self.lerp_cell(body[0], previous, self.interpolation)
+        
+    def visible_snake_blits(self):
+        """镜头模式：只生成视口内的蛇身图块，位置换算为屏幕坐标
+
+        蛇身比视口格子数短时遍历蛇身并按范围过滤；
+        更长时改为逐个查询视口内格子的占用索引，开销只与视口大小有关。
+        """
+        left, top, right, bottom = self.camera.visible_bounds(margin=1)
+        dx = self.camera.viewport.left - self.camera.offset[0]
+        dy = self.camera.viewport.top - self.camera.offset[1]
+        body = self.snake.position
+        view_cells = ((right - left) // CELL_SIZE) * ((bottom - top) // CELL_SIZE)
+        if len(body) <= view_cells:
+            for tile, (x, y) in self.snake_blits():
+                if left <= x < right and top <= y < bottom:
+                    yield tile, (x + dx, y + dy)
+            return
+            
+        tiles = self.sprites.segments
+        count = len(tiles)
+        head_serial = self.snake.head_serial
+        alpha = self.interpolation
+        for y in range(top, bottom, CELL_SIZE):
+            for x in range(left, right, CELL_SIZE):
+                serial = self.snake.segment_serial((x, y))
+                if serial is None:
+                    continue
+                position = (x, y)
+                if alpha < 1.0:
+                    i = head_serial - serial
+                    previous = body[i + 1] if i + 1 < len(body) else self.snake.previous_tail
+                    position = self.lerp_cell(position, previous, alpha)
+                yield tiles[serial % count], (position[0] + dx, position[1] + dy)
+        
+    def draw_snake_region(self, region: pygame.Rect):
+        """按格子查询占用索引，只绘制区域内的蛇身"""
+        tiles = self.sprites.segments
+        left = region.left - region.left % CELL_SIZE
+        top = region.top - region.top % CELL_SIZE
+        blits = []
+        for y in range(top, region.bottom, CELL_SIZE):
+            for x in range(left, region.right, CELL_SIZE):
+                serial = self.snake.segment_serial((x, y))
+                if serial is not None:
+                    blits.append((tiles[serial % len(tiles)], (x, y)))
+        self.screen.blits(blits, doreturn=False)
         
     def draw_food(self):
         """绘制食物"""
-        theme = self.theme_manager.current_theme
+        if self.food.position is None:
+            return
+        pulse_size = 0
         if VISUAL_EFFECTS["food_pulse"]:
-            # 脉冲效果
-            pulse_size = int(4 * self.pulse_value)
-            rect = pygame.Rect(
-                self.food.position[0] - pulse_size//2,
-                self.food.position[1] - pulse_size//2,
-                CELL_SIZE - 2 + pulse_size,
-                CELL_SIZE - 2 + pulse_size
-            )
-        else:
-            rect = pygame.Rect(
-                self.food.position[0],
-                self.food.position[1],
-                CELL_SIZE - 2,
-                CELL_SIZE - 2
-            )
-        
-        pygame.draw.rect(
-            self.screen,
-            theme.FOOD,
-            rect,
-            border_radius=GAME_STYLE["food_radius"]
+            # 脉冲效果：按放大像素数取预渲染帧
+            pulse_size = min(int(4 * self.pulse_value), len(self.sprites.food) - 1)
+        x, y = self.food.position
+        if self.camera is not None:
+            x, y = self.camera.to_screen((x, y))
+        self.screen.blit(self.sprites.food[pulse_size], (x - pulse_size // 2, y - pulse_size // 2))
+        
+    def draw_minimap(self):
+        """镜头模式下绘制小地图（按配置的间隔刷新）"""
+        if self.minimap is None:
+            return
+        self.minimap.draw(
+            self.screen, self.snake, self.food.position, self.theme_manager.current_theme,
+            self.camera.view_rect(), time.time()
         )
         
     def draw_lives(self):
         """绘制生命值"""
         if self.snake.lives > 1:
             heart_text = "❤" * self.snake.lives
-            lives_text = self.fonts["message"].render(
+            lives_text = self.text_cache.render(
+                self.fonts["message"],
                 f"{GAME_MESSAGES['LIVES']}: {heart_text}", True, 
                 self.theme_manager.current_theme.TEXT
             )
@@ -587,14 +1008,14 @@ class GameScreen:
                         # 滑动手势
                         if abs(dx) > abs(dy):
                             if dx > 0:
-                                self.snake.change_direction((CELL_SIZE, 0))
+                                self.engine.change_direction("RIGHT")
                             else:
-                                self.snake.change_direction((-CELL_SIZE, 0))
+                                self.engine.change_direction("LEFT")
                         else:
                             if dy > 0:
-                                self.snake.change_direction((0, CELL_SIZE))
+                                self.engine.change_direction("DOWN")
                             else:
-                                self.snake.change_direction((0, -CELL_SIZE))
+                                self.engine.change_direction("UP")
                 elif touch_time >= TOUCH_CONTROLS["long_press_time"] / 1000:
                     # 长按
                     self.handle_long_press()
@@ -615,75 +1036,66 @@ class GameScreen:
         
     def draw_grid(self):
         """绘制网格"""
-        theme = self.theme_manager.current_theme
-        grid_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self.screen.blit(self.layers.get("grid", self.build_grid_layer), self.game_area_rect())
         
-        # 获取当前难度的网格大小
-        grid_size = DIFFICULTY_SETTINGS[self.difficulty]["grid_size"]
-        cell_size = min(
-            (WINDOW_WIDTH) // grid_size,
-            (LAYOUT["game_area"]["bottom"] - LAYOUT["game_area"]["top"]) // grid_size
-        )
-        
-        # 计算游戏区域的实际大小和起始位置
-        game_width = cell_size * grid_size
-        game_height = cell_size * grid_size
-        start_x = (WINDOW_WIDTH - game_width) // 2
-        start_y = (LAYOUT["game_area"]["bottom"] + LAYOUT["game_area"]["top"] - game_height) // 2
-        
-        # 绘制竖线
-        for x in range(grid_size + 1):
-            x_pos = start_x + x * cell_size
-            pygame.draw.line(
-                grid_surface,
-                GAME_STYLE["grid_color"],
-                (x_pos, start_y),
-                (x_pos, start_y + game_height),
-                GAME_STYLE["grid_line_width"]
-            )
-        
-        # 绘制横线
-        for y in range(grid_size + 1):
-            y_pos = start_y + y * cell_size
-            pygame.draw.line(
-                grid_surface,
-                GAME_STYLE["grid_color"],
-                (start_x, y_pos),
-                (start_x + game_width, y_pos),
-                GAME_STYLE["grid_line_width"]
-            )
-        
-        self.screen.blit(grid_surface, (0, 0))
+    def build_grid_layer(self) -> pygame.Surface:
+        """按格子大小绘制游戏区域网格，整体按 grid_opacity 半透明"""
+        theme = self.theme_manager.current_theme
+        game_area = self.game_area_rect()
+        width, height = game_area.size
+        # 网格与蛇身格子对齐（格子坐标以窗口左上角为原点）
+        offset_y = -game_area.top % CELL_SIZE
+        
+        def paint(layer):
+            # 绘制竖线
+            for x in range(0, width + 1, CELL_SIZE):
+                pygame.draw.line(layer, theme.GRID, (x, 0), (x, height),
+                                 GAME_STYLE["grid_line_width"])
+            # 绘制横线
+            for y in range(offset_y, height + 1, CELL_SIZE):
+                pygame.draw.line(layer, theme.GRID, (0, y), (width, y),
+                                 GAME_STYLE["grid_line_width"])
+                                 
+        layer = self.keyed_layer(game_area.size, paint)
+        layer.set_alpha(int(255 * VISUAL_EFFECTS["grid_opacity"]))
+        return layer
+        
+    def build_board_grid_layer(self) -> pygame.Surface:
+        """镜头模式的网格图层：覆盖窗口并多出一格，供按偏移平移"""
+        theme = self.theme_manager.current_theme
+        width = WINDOW_WIDTH + CELL_SIZE
+        height = WINDOW_HEIGHT + CELL_SIZE
+        
+        def paint(layer):
+            for x in range(0, width + 1, CELL_SIZE):
+                pygame.draw.line(layer, theme.GRID, (x, 0), (x, height),
+                                 GAME_STYLE["grid_line_width"])
+            for y in range(0, height + 1, CELL_SIZE):
+                pygame.draw.line(layer, theme.GRID, (0, y), (width, y),
+                                 GAME_STYLE["grid_line_width"])
+                                 
+        layer = self.keyed_layer((width, height), paint)
+        layer.set_alpha(int(255 * VISUAL_EFFECTS["grid_opacity"]))
+        return layer
         
     def show_leaderboard(self):
         """显示排行榜"""
         self.state = GameState.LEADERBOARD
         self.current_leaderboard_page = "all_time"  # 默认显示历史最佳
+        self.ranking_manager.expire_records()
         
     def draw_leaderboard(self):
         """绘制排行榜界面"""
         theme = self.theme_manager.current_theme
         config = RANKING_UI["leaderboard"]
         
-        # 绘制半透明背景
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # 半透明黑色背景
-        self.screen.blit(overlay, (0, 0))
-        
-        # 绘制排行榜面板
-        board_rect = pygame.Rect(
-            WINDOW_WIDTH//2 - config["width"]//2,
-            WINDOW_HEIGHT//2 - config["height"]//2,
-            config["width"],
-            config["height"]
-        )
-        pygame.draw.rect(self.screen, theme.BACKGROUND, board_rect,
-                        border_radius=GAME_STYLE["border_width"])
-        pygame.draw.rect(self.screen, theme.GRID, board_rect,
-                        GAME_STYLE["border_width"], border_radius=GAME_STYLE["border_width"])
+        # 半透明背景与排行榜面板
+        self.screen.blit(self.layers.get("leaderboard", self.build_leaderboard_layer), (0, 0))
+        board_rect = self.leaderboard_rect()
         
         # 绘制标题
-        title_text = self.fonts["subtitle"].render(  # 改用较小的字体
+        title_text = self.text_cache.render(  # 改用较小的字体
+            self.fonts["subtitle"],
             f"{RANKING_SYSTEM['categories'][self.current_leaderboard_page]['name']} Rankings",
             True, theme.TEXT
         )
@@ -700,21 +1112,12 @@ class GameScreen:
         )
         
         # 绘制返回按钮
-        back_button = Button(
-            board_rect.left + config["padding"],
-            board_rect.bottom - config["padding"] - BUTTON_STYLE["height"],
-            BUTTON_STYLE["width"]//2,
-            BUTTON_STYLE["height"],
-            "Back [Esc]",
-            BUTTON_STYLE["normal"],
-            BUTTON_STYLE["hover"],
-            lambda: setattr(self, 'state', GameState.DIFFICULTY_SELECT)
-        )
+        back_button = self.leaderboard_back_button
         back_button.draw(self.screen)
-        self.leaderboard_back_button = back_button  # 保存引用以处理点击
         
         # 绘制切换分类提示
-        hint_text = self.fonts["message"].render(
+        hint_text = self.text_cache.render(
+            self.fonts["message"],
             "Press TAB to Switch Category", True, theme.TEXT
         )
         hint_rect = hint_text.get_rect(
@@ -722,13 +1125,36 @@ class GameScreen:
         )
         self.screen.blit(hint_text, hint_rect)
         
+    def leaderboard_rect(self) -> pygame.Rect:
+        """排行榜面板的范围"""
+        config = RANKING_UI["leaderboard"]
+        return pygame.Rect(
+            WINDOW_WIDTH//2 - config["width"]//2,
+            WINDOW_HEIGHT//2 - config["height"]//2,
+            config["width"],
+            config["height"]
+        )
+        
+    def build_leaderboard_layer(self) -> pygame.Surface:
+        """全屏半透明遮罩加上不透明的排行榜面板"""
+        theme = self.theme_manager.current_theme
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 128))  # 半透明黑色背景
+        board_rect = self.leaderboard_rect()
+        pygame.draw.rect(layer, theme.BACKGROUND, board_rect,
+                        border_radius=GAME_STYLE["border_width"])
+        pygame.draw.rect(layer, theme.GRID, board_rect,
+                        GAME_STYLE["border_width"], border_radius=GAME_STYLE["border_width"])
+        return layer.convert_alpha() if pygame.display.get_surface() else layer
+        
     def draw_name_input(self):
         """绘制名字输入界面"""
         theme = self.theme_manager.current_theme
         config = RANKING_UI["name_input"]
         
         # 绘制提示文本
-        prompt_text = self.fonts["message"].render(
+        prompt_text = self.text_cache.render(
+            self.fonts["message"],
             GAME_MESSAGES["ENTER_NAME"], True, theme.TEXT
         )
         prompt_rect = prompt_text.get_rect(
@@ -748,9 +1174,10 @@ class GameScreen:
         
         # 绘制输入的文本
         if self.input_text:
-            text_surface = self.fonts["message"].render(self.input_text, True, theme.TEXT)
+            text_surface = self.text_cache.render(self.fonts["message"], self.input_text, True, theme.TEXT)
         else:
-            text_surface = self.fonts["message"].render(
+            text_surface = self.text_cache.render(
+                self.fonts["message"],
                 config["placeholder"], True, (*theme.TEXT[:3], 128)
             )
         text_rect = text_surface.get_rect(
@@ -759,7 +1186,8 @@ class GameScreen:
         self.screen.blit(text_surface, text_rect)
         
         # 绘制确认按钮提示
-        submit_text = self.fonts["message"].render(
+        submit_text = self.text_cache.render(
+            self.fonts["message"],
             GAME_MESSAGES["SUBMIT"], True, theme.TEXT
         )
         submit_rect = submit_text.get_rect(
@@ -769,17 +1197,56 @@ class GameScreen:
 
     def handle_game_over(self):
         """处理游戏结束"""
+        if self.autopilot is not None:
+            # 演示局不保存录像也不计分，直接开始下一局
+            self.start_demo()
+            return
+        self.last_replay = Replay.from_engine(self.engine)
+        self.persistence.submit(REPLAY_SYSTEM["last_replay_path"], self.last_replay.to_bytes())
         if self.snake.score >= RANKING_UI["min_score_for_record"]:
             self.state = GameState.NAME_INPUT
             self.input_text = ""
         else:
+            self.submit_score()
             self.state = GameState.GAME_OVER
+            
+    def submit_score(self, player_name: str = None):
+        """提交本局分数到排行榜，每局只提交一次"""
+        if self.score_submitted:
+            return
+        self.score_submitted = True
+        if RANKING_SYSTEM["verify_submissions"] and self.last_replay:
+            # 重新模拟整局可能较慢，放到校验线程，完成后由 update 填入排名
+            self.pending_verification = self.ranking_manager.submit_verified_score(
+                self.last_replay.to_bytes(), player_name or "玩家"
+            )
+        elif player_name:
+            self.final_rankings = self.ranking_manager.add_score(
+                self.difficulty.name, self.snake.score, player_name
+            )
+        else:
+            self.final_rankings = self.ranking_manager.add_score(
+                self.difficulty.name, self.snake.score
+            )
+            
+    def close(self):
+        """退出前写入尚未落盘的数据"""
+        self.save_manager.flush()
+        self.ranking_manager.close()
 
     def draw_virtual_joystick(self):
         """绘制虚拟摇杆"""
         if self.state != GameState.PLAYING:
             return
         
+        pressed = self.pressed_directions()
+        joystick_surface = self.layers.get(
+            ("joystick", pressed), lambda: self.build_joystick_layer(pressed)
+        )
+        self.screen.blit(joystick_surface, self.joystick_rect)
+        
+    def build_joystick_layer(self, pressed: tuple) -> pygame.Surface:
+        """按下方向组合对应的摇杆图层"""
         config = VIRTUAL_JOYSTICK
         joystick_surface = pygame.Surface((config["size"], config["size"]), pygame.SRCALPHA)
         
@@ -795,20 +1262,21 @@ class GameScreen:
             "RIGHT": (config["size"] - config["button_size"]//2, config["size"]//2)
         }
         
-        # 获取当前按下的键
-        keys = pygame.key.get_pressed()
-        
         # 绘制方向键
         for direction, pos in buttons.items():
-            color = config["colors"]["active"] if any(keys[key] for key in CONTROLS[direction]) \
+            color = config["colors"]["active"] if direction in pressed \
                     else config["colors"]["buttons"]
             pygame.draw.circle(joystick_surface, color, pos, config["button_size"]//2)
-        
-        # 绘制到屏幕
-        self.screen.blit(joystick_surface, 
-                        (config["position"]["x"] - config["size"]//2,
-                         config["position"]["y"] - config["size"]//2))
+        return joystick_surface.convert_alpha() if pygame.display.get_surface() else joystick_surface
 
+    def pressed_directions(self) -> tuple:
+        """当前按下的方向键"""
+        keys = pygame.key.get_pressed()
+        return tuple(
+            direction for direction in ("UP", "DOWN", "LEFT", "RIGHT")
+            if any(keys[key] for key in CONTROLS[direction])
+        )
+        
     def handle_back(self):
         """处理返回按钮点击"""
         if self.state == GameState.PLAYING:
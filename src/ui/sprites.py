@@ -0,0 +1,43 @@
+"""
+预渲染精灵图集
+"""
+from typing import List
+import sys
+import os
+import pygame
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.config import CELL_SIZE, VISUAL_EFFECTS, GAME_STYLE
+
+class SpriteAtlas:
+    """蛇身与食物的预渲染图块
+
+    圆角矩形只在创建图集（以及切换主题）时光栅化一次，绘制时直接 blit。
+    segments[i] 对应 snake_gradient 的第 i 种颜色；food[p] 为放大 p 像素的脉冲帧。
+    """
+    SEGMENT_SIZE = CELL_SIZE - 2  # 留出间隙
+    PULSE_FRAMES = 5  # 脉冲放大 0~4 像素
+    
+    def __init__(self, theme):
+        self.segments: List[pygame.Surface] = []
+        self.food: List[pygame.Surface] = []
+        self.build(theme)
+        
+    def build(self, theme):
+        """按主题重新生成全部图块"""
+        self.segments = [
+            self._tile(color, self.SEGMENT_SIZE, GAME_STYLE["snake_radius"])
+            for color in VISUAL_EFFECTS["snake_gradient"]
+        ]
+        self.food = [
+            self._tile(theme.FOOD, self.SEGMENT_SIZE + pulse, GAME_STYLE["food_radius"])
+            for pulse in range(self.PULSE_FRAMES)
+        ]
+        
+    @staticmethod
+    def _tile(color, size: int, radius: int) -> pygame.Surface:
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, surface.get_rect(), border_radius=radius)
+        # 转换为与屏幕一致的像素格式，blit 时无需逐像素转换
+        return surface.convert_alpha() if pygame.display.get_surface() else surface
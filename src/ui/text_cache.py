@@ -0,0 +1,38 @@
+"""
+文字表面缓存
+"""
+from collections import OrderedDict
+from typing import Tuple
+import pygame
+
+class TextCache:
+    """按 (字体, 文本, 颜色, 抗锯齿) 缓存 font.render 结果的 LRU 缓存
+
+    静态文字只渲染一次，分数等动态文字只在内容变化时重新渲染。
+    返回的 Surface 是共享的，调用方只能 blit，不能修改。
+    """
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        
+    def render(self, font: pygame.font.Font, text: str, antialias: bool,
+               color: Tuple[int, ...]) -> pygame.Surface:
+        """获取渲染好的文字，参数顺序与 font.render 一致"""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+            
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)  # 淘汰最久未使用的文字
+        return surface
+        
+    def clear(self):
+        """清空缓存（切换主题时调用）"""
+        self._surfaces.clear()
+        
+    def __len__(self) -> int:
+        return len(self._surfaces)
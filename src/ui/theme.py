@@ -11,10 +11,17 @@ from src.config import Colors
 class ThemeManager:
     def __init__(self):
         self.is_dark_mode = False
+        self.listeners = []  # 主题切换回调，用于让渲染缓存失效
+        
+    def add_listener(self, callback):
+        """注册主题切换回调"""
+        self.listeners.append(callback)
         
     def toggle_theme(self):
         """切换主题"""
         self.is_dark_mode = not self.is_dark_mode
+        for callback in self.listeners:
+            callback()
         
     @property
     def current_theme(self):
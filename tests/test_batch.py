@@ -0,0 +1,86 @@
+"""
+批量环境与 GameEngine 的规则一致性测试
+"""
+import random
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from src.engine.rules import ACTIONS, Difficulty, LARGE_BOARD
+from src.engine import batch as batch_module
+from src.engine.batch import BatchEngine
+from src.engine.game import GameEngine, EVENT_EAT, EVENT_RESPAWN
+
+END_REASONS = {
+    batch_module.END_NONE: None,
+    batch_module.END_COLLISION: "collision",
+    batch_module.END_TIME_UP: "time_up",
+    batch_module.END_BOARD_FULL: "board_full"
+}
+
+def cell_to_pixel(batch: BatchEngine, cell: int):
+    size = batch.board.cell_size
+    return (int(cell) % batch.cols * size, int(cell) // batch.cols * size)
+
+def choose_action(batch: BatchEngine, rng: random.Random) -> int:
+    """多数时候朝食物走，偶尔随机转向，保证两边都会吃到食物、撞到自己"""
+    if rng.random() < 0.2 or batch.food[0] < 0:
+        return rng.randrange(len(ACTIONS))
+    head, food = int(batch.head[0]), int(batch.food[0])
+    dx = food % batch.cols - head % batch.cols
+    dy = food // batch.cols - head // batch.cols
+    if dx and (not dy or rng.random() < 0.5):
+        return ACTIONS.index("RIGHT" if dx > 0 else "LEFT")
+    if dy:
+        return ACTIONS.index("DOWN" if dy > 0 else "UP")
+    return -1
+
+def play_both(difficulty: Difficulty, seed: int, max_ticks: int = 5000):
+    """同一种子、同一动作序列推进两个引擎
+
+    两者的随机源不同，因此把批量环境抽到的起点、食物和重生位置同步给 GameEngine，
+    其余规则（移动、碰撞、计分、生命、时间限制）各自独立计算。
+    """
+    batch = BatchEngine(1, difficulty, seed=seed)
+    engine = GameEngine(difficulty, seed=seed)
+    engine.snake.position = [cell_to_pixel(batch, batch.head[0])]
+    engine.food.position = cell_to_pixel(batch, batch.food[0])
+    rng = random.Random(seed)
+
+    while not engine.game_over and engine.tick < max_ticks:
+        index = choose_action(batch, rng)
+        event = engine.step(ACTIONS[index] if index >= 0 else None)
+        _, _, done, events = batch.step([index])
+
+        if events[0] == batch_module.EVENT_RESPAWN:
+            assert event == EVENT_RESPAWN
+            engine.snake.position = [cell_to_pixel(batch, batch.head[0])]
+        elif events[0] == batch_module.EVENT_EAT:
+            assert event == EVENT_EAT
+            if batch.food[0] >= 0:
+                engine.food.position = cell_to_pixel(batch, batch.food[0])
+        assert engine.snake.position[0] == cell_to_pixel(batch, batch.head[0])
+        assert engine.snake.score == batch.score[0]
+        assert engine.snake.length == batch.length[0]
+        assert engine.game_over == done[0]
+    return engine, batch
+
+@pytest.mark.parametrize("difficulty", list(Difficulty))
+def test_batch_matches_game_engine(difficulty):
+    for seed in range(5):
+        engine, batch = play_both(difficulty, seed)
+        assert engine.end_reason == END_REASONS[int(batch.end_reason[0])]
+        assert engine.snake.score == batch.score[0]
+        assert len(engine.snake.position) == batch.size[0]
+
+def test_batch_uses_difficulty_board(monkeypatch):
+    monkeypatch.setitem(LARGE_BOARD, "enabled", True)
+    monkeypatch.setitem(LARGE_BOARD, "cols", 60)
+    monkeypatch.setitem(LARGE_BOARD, "rows", 50)
+    difficulty = LARGE_BOARD["difficulties"][0]
+    batch = BatchEngine(1, difficulty, seed=0)
+    engine = GameEngine(difficulty, seed=0)
+    assert (batch.cols, batch.rows) == (engine.board.cols, engine.board.rows) == (60, 50)
@@ -0,0 +1,93 @@
+"""
+空闲格子索引测试
+"""
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from src.engine.rules import LARGE_BOARD
+from src.engine.board import Board
+from src.game.food import Food
+from src.game.grid import FreeCellIndex, SparseFreeCells, make_free_cells
+
+def check_index(index, board: Board, occupied: set):
+    """索引的空闲格子必须恰好是食物区域减去占用格子"""
+    cells = list(board.food_cells())
+    assert len(index) == len(cells) - len(occupied)
+    assert index.is_full == (len(occupied) == len(cells))
+    for cell in cells:
+        assert index.is_free(cell) == (cell not in occupied)
+
+def test_occupy_release_sample_invariants():
+    board = Board.large(8, 6)
+    for index in (FreeCellIndex(board.food_cells()), SparseFreeCells(board)):
+        rng = random.Random(1)
+        cells = list(board.food_cells())
+        occupied = set()
+        for _ in range(2000):
+            cell = rng.choice(cells)
+            if rng.random() < 0.6:
+                index.occupy(cell)
+                occupied.add(cell)
+            else:
+                index.release(cell)
+                occupied.discard(cell)
+            sample = index.sample(rng)
+            assert sample is None if len(occupied) == len(cells) else sample not in occupied
+        check_index(index, board, occupied)
+
+        # 重复占用/释放、区域外的格子都不影响计数
+        if occupied:
+            index.occupy(next(iter(occupied)))
+        index.release((-board.cell_size, 0))
+        index.occupy((board.width, 0))
+        check_index(index, board, occupied)
+
+        index.reset(cells[:3])
+        check_index(index, board, set(cells[:3]))
+
+def test_sample_is_uniform():
+    board = Board.large(4, 3)
+    index = FreeCellIndex(board.food_cells())
+    cells = list(board.food_cells())
+    index.occupy(cells[0])
+    rng = random.Random(2)
+    counts = {}
+    for _ in range(11000):
+        cell = index.sample(rng)
+        counts[cell] = counts.get(cell, 0) + 1
+    assert set(counts) == set(cells[1:])
+    assert all(800 < count < 1200 for count in counts.values())
+
+def test_food_respawn_on_full_board():
+    board = Board.large(5, 4)
+    for free_cells in (FreeCellIndex(board.food_cells()), SparseFreeCells(board)):
+        cells = list(board.food_cells())
+        free_cells.reset(cells[1:])
+        food = Food(free_cells, board, random.Random(0))
+        assert food.position == cells[0]
+        free_cells.occupy(cells[0])
+        assert not food.respawn(free_cells)
+        assert food.position is None
+        free_cells.release(cells[-1])
+        assert food.respawn(free_cells)
+        assert food.position == cells[-1]
+
+def test_sparse_fallback_near_full():
+    """只剩一个空格时拒绝采样几乎必然失败，退化为扫描仍能找到它"""
+    board = Board.large(30, 30)
+    index = SparseFreeCells(board, max_tries=4)
+    cells = list(board.food_cells())
+    rng = random.Random(3)
+    for last in rng.sample(cells, 20):
+        index.reset(cell for cell in cells if cell != last)
+        assert len(index) == 1
+        assert index.sample(rng) == last
+
+def test_make_free_cells_picks_index_by_size(monkeypatch):
+    board = Board.large(10, 10)
+    assert isinstance(make_free_cells(board), FreeCellIndex)
+    monkeypatch.setitem(LARGE_BOARD, "dense_index_limit", 50)
+    assert isinstance(make_free_cells(board), SparseFreeCells)
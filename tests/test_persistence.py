@@ -0,0 +1,32 @@
+"""
+持久化线程测试
+"""
+import json
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from src.managers.persistence import PersistenceWorker
+
+def test_burst_is_coalesced_into_one_write(tmp_path, monkeypatch):
+    writes = []
+    original = PersistenceWorker.write_atomic
+    monkeypatch.setattr(PersistenceWorker, "write_atomic",
+                        staticmethod(lambda path, snapshot: (writes.append(snapshot), original(path, snapshot))))
+    worker = PersistenceWorker({"coalesce_delay": 0.2, "flush_timeout": 5.0})
+    path = str(tmp_path / "data.json")
+    for i in range(5000):
+        worker.submit(path, {"value": i})
+    assert worker.flush()
+    assert len(writes) <= 2
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"value": 4999}
+
+def test_tasks_run_in_order_before_flush_returns():
+    worker = PersistenceWorker({"coalesce_delay": 0.5, "flush_timeout": 5.0})
+    done = []
+    for i in range(100):
+        worker.submit_task(lambda i=i: done.append(i))
+    assert worker.flush()
+    assert done == list(range(100))
@@ -0,0 +1,71 @@
+"""
+排行榜存储后端一致性测试
+"""
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from src.config import RANKING_SYSTEM, PERSISTENCE
+from src.managers.persistence import PersistenceWorker
+from src.managers.ranking_store import JsonRankingStore, SqliteRankingStore
+
+def make_stores(tmp_path):
+    config = dict(
+        RANKING_SYSTEM,
+        file_path=str(tmp_path / "rankings.json"),
+        sqlite_path=str(tmp_path / "rankings.db")
+    )
+    return [
+        JsonRankingStore(config, PersistenceWorker(PERSISTENCE)),
+        SqliteRankingStore(config, PersistenceWorker(PERSISTENCE))
+    ]
+
+def test_backends_agree_on_ranks(tmp_path):
+    """同一串提交与过期操作在两个后端上得到相同的名次与前 N 名"""
+    stores = make_stores(tmp_path)
+    rng = random.Random(0)
+    difficulty = "HARD"
+    for tick in range(300):
+        score = rng.randrange(0, 200, 5)
+        now = float(tick)
+        for category in RANKING_SYSTEM["categories"]:
+            results = []
+            for store in stores:
+                if category != "all_time":
+                    store.expire(category, difficulty, now - 40)
+                    # SQLite 在持久化线程中补位，等补位结果返回后再比较
+                    store.flush()
+                results.append((
+                    store.rank_of(category, difficulty, score),
+                    store.insert(category, difficulty, "player", score, now),
+                    store.top(category, difficulty, RANKING_SYSTEM["max_records"])
+                ))
+            assert results[0] == results[1], (tick, category)
+    for store in stores:
+        store.close()
+
+def test_ranks_beyond_max_records_are_none(tmp_path):
+    for store in make_stores(tmp_path):
+        for i in range(RANKING_SYSTEM["max_records"]):
+            store.insert("all_time", "EASY", "player", 100, float(i))
+        assert store.rank_of("all_time", "EASY", 100) is None
+        assert store.insert("all_time", "EASY", "player", 100, 99.0) is None
+        assert store.rank_of("all_time", "EASY", 101) == 1
+        store.close()
+
+def test_sqlite_reopen_keeps_records(tmp_path):
+    config = dict(
+        RANKING_SYSTEM,
+        file_path=str(tmp_path / "rankings.json"),
+        sqlite_path=str(tmp_path / "rankings.db")
+    )
+    store = SqliteRankingStore(config, PersistenceWorker(PERSISTENCE))
+    for i in range(30):
+        store.insert("all_time", "MEDIUM", f"p{i}", i * 5, float(i))
+    expected = store.top("all_time", "MEDIUM", RANKING_SYSTEM["max_records"])
+    store.close()
+    reopened = SqliteRankingStore(config, PersistenceWorker(PERSISTENCE))
+    assert reopened.top("all_time", "MEDIUM", RANKING_SYSTEM["max_records"]) == expected
+    reopened.close()
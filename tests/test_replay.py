@@ -0,0 +1,100 @@
+"""
+录像编码与提交校验测试
+"""
+import random
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from src.config import RANKING_SYSTEM, PERSISTENCE
+from src.engine.rules import Difficulty
+from src.engine.game import GameEngine
+from src.engine.registry import make_policy
+from src.engine.replay import Replay, ReplayPlayer, read_varint, write_varint
+from src.engine.verification import (
+    verify_replay, VERIFIED, REJECT_MALFORMED, REJECT_MISMATCH
+)
+from src.managers.persistence import PersistenceWorker
+from src.managers.ranking_manager import RankingManager
+
+def record_game(difficulty: Difficulty = Difficulty.MEDIUM, seed: int = 3) -> GameEngine:
+    """用贪心策略完整玩一局"""
+    engine = GameEngine(difficulty, seed=seed)
+    policy = make_policy("greedy", random.Random(seed))
+    policy.reset(engine)
+    while not engine.game_over:
+        engine.step(policy.act(engine))
+    return engine
+
+def test_varint_round_trip():
+    values = [0, 1, 0x7F, 0x80, 0x3FFF, 0x4000, 2 ** 32, 2 ** 63 + 5]
+    out = bytearray()
+    for value in values:
+        write_varint(out, value)
+    offset = 0
+    for value in values:
+        decoded, offset = read_varint(bytes(out), offset)
+        assert decoded == value
+    assert offset == len(out)
+
+def test_varint_rejects_bad_input():
+    with pytest.raises(ValueError):
+        write_varint(bytearray(), -1)
+    with pytest.raises(ValueError):
+        read_varint(b"\x80\x80", 0)
+
+def test_replay_bytes_round_trip():
+    replay = Replay.from_engine(record_game())
+    assert replay.events
+    decoded = Replay.from_bytes(replay.to_bytes())
+    assert decoded.difficulty == replay.difficulty
+    assert decoded.seed == replay.seed
+    assert decoded.events == replay.events
+    assert (decoded.end_tick, decoded.score) == (replay.end_tick, replay.score)
+
+def test_recorded_game_replays_to_same_score():
+    engine = record_game()
+    assert engine.snake.score > 0
+    replay = Replay.from_bytes(Replay.from_engine(engine).to_bytes())
+    replayed = ReplayPlayer(replay).run()
+    assert replayed.snake.score == engine.snake.score
+    assert replayed.tick == engine.tick
+    assert replayed.end_reason == engine.end_reason
+
+    result = verify_replay(replay.to_bytes())
+    assert result["status"] == VERIFIED
+    assert result["accepted"]
+    assert result["score"] == engine.snake.score
+
+def test_modified_score_is_mismatch():
+    replay = Replay.from_engine(record_game())
+    replay.score += 10
+    result = verify_replay(replay.to_bytes())
+    assert result["status"] == REJECT_MISMATCH
+    assert not result["accepted"]
+
+def test_truncated_replay_is_malformed():
+    data = Replay.from_engine(record_game()).to_bytes()
+    assert verify_replay(data[:-1])["status"] == REJECT_MALFORMED
+
+def test_verified_submission_is_added_after_poll(tmp_path):
+    """后台校验不阻塞提交，poll_verified 之后才记入排行榜"""
+    config = dict(RANKING_SYSTEM, file_path=str(tmp_path / "rankings.json"), backend="json")
+    manager = RankingManager(config, PersistenceWorker(PERSISTENCE))
+    replay = Replay.from_engine(record_game())
+    accepted = manager.submit_verified_score(replay.to_bytes(), "player")
+    replay.score += 10
+    rejected = manager.submit_verified_score(replay.to_bytes(), "cheater")
+    assert manager.get_rankings("all_time", replay.difficulty.name) == []
+
+    accepted.result()
+    rejected.result()
+    finished = dict(manager.poll_verified())
+    assert finished[accepted]["all_time"] == 1
+    assert finished[rejected] is None
+    records = manager.get_rankings("all_time", replay.difficulty.name)
+    assert [(r["name"], r["score"]) for r in records] == [("player", replay.score - 10)]
+    manager.close()
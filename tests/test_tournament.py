@@ -0,0 +1,23 @@
+"""
+策略锦标赛汇总测试
+"""
+import json
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from src.tools.tournament import main, summarize
+
+def test_summarize_empty_group():
+    stats = summarize([])
+    assert stats["games"] == 0
+    assert stats["score_mean"] is None
+    assert stats["end_reasons"] == {}
+
+def test_zero_games(tmp_path, capsys):
+    output = tmp_path / "results.csv"
+    main(["--policies", "greedy", "--difficulties", "EASY", "--games", "0", "--output", str(output)])
+    summary = json.loads((tmp_path / "results.summary.json").read_text(encoding="utf-8"))
+    assert summary["greedy"]["EASY"]["games"] == 0
+    assert "greedy" in capsys.readouterr().out